@@ -13,25 +13,20 @@ class PromotionUseCase {
         }
         logger_1.logger.info({ requestId: context.requestId, userId: context.user.id, releaseId }, 'Validating production promotion');
         const authHeader = { Authorization: `Bearer ${context.user.token || ''}` };
-        // 1. Buscar release do backend
-        const releaseResponse = await this.backendClient.get(`/releases/${releaseId}`, context.requestId, authHeader);
-        const release = releaseResponse.data?.data || releaseResponse.data;
-        const score = release.evidenceScore ?? release.evidence_score ?? 0;
-        const evidenceUrl = release.evidenceUrl ?? release.evidence_url ?? '';
-        // 2. Buscar approvals do release
-        const approvalsResponse = await this.backendClient.get(`/approvals?release_id=${releaseId}`, context.requestId, authHeader);
-        const approvalsData = approvalsResponse.data?.data;
-        const approvals = Array.isArray(approvalsData)
-            ? approvalsData
-            : (approvalsData?.data || []);
-        const approvedCount = approvals.filter((a) => a.outcome === 'APPROVED').length;
-        // 3. Validar contra policy (valores padrao do policy.yaml)
-        const minScore = 70;
-        const minApprovals = 1;
-        const hasMinScore = score >= minScore;
-        const hasApprovals = approvedCount >= minApprovals;
-        const hasEvidenceUrl = !!evidenceUrl && evidenceUrl.trim() !== '';
-        const isFrozen = false; // Backend valida freeze na hora do promote real
+        // Checklist do backend: release, contador de approvals e policy corrente em uma chamada
+        const checklistResponse = await this.backendClient.post('/releases/checklist:batch', { releaseIds: [releaseId] }, context.requestId, authHeader);
+        const checklist = checklistResponse.data?.data?.data?.[0];
+        if (!checklist) {
+            throw new exceptions_1.NotFoundException(`Release ${releaseId} not found`);
+        }
+        const score = checklist.score ?? 0;
+        const minScore = checklist.minScore;
+        const approvedCount = checklist.approvalCount ?? 0;
+        const minApprovals = checklist.minApprovals;
+        const hasMinScore = checklist.scoreOk;
+        const hasApprovals = checklist.approvalsOk;
+        const hasEvidenceUrl = checklist.evidenceOk;
+        const isFrozen = checklist.isFrozen;
         const allowed = hasMinScore && hasApprovals && hasEvidenceUrl && !isFrozen;
         const reasons = [];
         if (!hasApprovals)
@@ -40,6 +35,8 @@ class PromotionUseCase {
             reasons.push('Evidence URL e obrigatoria');
         if (!hasMinScore)
             reasons.push(`Score ${score} abaixo do minimo ${minScore}`);
+        if (isFrozen)
+            reasons.push(checklist.freezeMessage || 'Freeze window ativa');
         logger_1.logger.info({ requestId: context.requestId, releaseId, score, minScore, approvedCount, allowed }, 'Production validation result');
         return {
             allowed,
@@ -20,6 +20,9 @@ class ProxyController {
             if (req.headers.authorization) {
                 forwardedHeaders.authorization = req.headers.authorization;
             }
+            if (req.headers['idempotency-key']) {
+                forwardedHeaders['idempotency-key'] = req.headers['idempotency-key'];
+            }
             let response;
             if (method === 'GET' || method === 'HEAD' || method === 'DELETE') {
                 response = await this.backendClient[method.toLowerCase()](pathWithQuery, req.context.requestId, forwardedHeaders);
@@ -1,6 +1,6 @@
 import { IRequestContext, IPromotionValidation } from '@domain/entities';
 import { IBackendClient } from '@infrastructure/http/IBackendClient';
-import { ForbiddenException } from '@domain/exceptions';
+import { ForbiddenException, NotFoundException } from '@domain/exceptions';
 import { logger } from '@core/logger';
 
 export class PromotionUseCase {
@@ -21,38 +21,28 @@ export class PromotionUseCase {
 
     const authHeader = { Authorization: `Bearer ${(context.user as any).token || ''}` };
 
-    // 1. Buscar release do backend
-    const releaseResponse = await this.backendClient.get(
-      `/releases/${releaseId}`,
+    // Checklist do backend: release, contador de approvals e policy corrente em uma chamada
+    const checklistResponse = await this.backendClient.post(
+      '/releases/checklist:batch',
+      { releaseIds: [releaseId] },
       context.requestId,
       authHeader
     );
 
-    const release = releaseResponse.data?.data || releaseResponse.data;
-    const score = release.evidenceScore ?? release.evidence_score ?? 0;
-    const evidenceUrl = release.evidenceUrl ?? release.evidence_url ?? '';
-
-    // 2. Buscar approvals do release
-    const approvalsResponse = await this.backendClient.get(
-      `/approvals?release_id=${releaseId}`,
-      context.requestId,
-      authHeader
-    );
-
-    const approvalsData = approvalsResponse.data?.data;
-    const approvals = Array.isArray(approvalsData)
-      ? approvalsData
-      : (approvalsData?.data || []);
-    const approvedCount = approvals.filter((a: any) => a.outcome === 'APPROVED').length;
+    const checklist = checklistResponse.data?.data?.data?.[0];
+    if (!checklist) {
+      throw new NotFoundException(`Release ${releaseId} not found`);
+    }
 
-    // 3. Validar contra policy (valores padrao do policy.yaml)
-    const minScore = 70;
-    const minApprovals = 1;
+    const score = checklist.score ?? 0;
+    const minScore = checklist.minScore;
+    const approvedCount = checklist.approvalCount ?? 0;
+    const minApprovals = checklist.minApprovals;
 
-    const hasMinScore = score >= minScore;
-    const hasApprovals = approvedCount >= minApprovals;
-    const hasEvidenceUrl = !!evidenceUrl && evidenceUrl.trim() !== '';
-    const isFrozen = false; // Backend valida freeze na hora do promote real
+    const hasMinScore = checklist.scoreOk;
+    const hasApprovals = checklist.approvalsOk;
+    const hasEvidenceUrl = checklist.evidenceOk;
+    const isFrozen = checklist.isFrozen;
 
     const allowed = hasMinScore && hasApprovals && hasEvidenceUrl && !isFrozen;
 
@@ -60,6 +50,7 @@ export class PromotionUseCase {
     if (!hasApprovals) reasons.push(`Requer ${minApprovals} aprovacao(oes), tem ${approvedCount}`);
     if (!hasEvidenceUrl) reasons.push('Evidence URL e obrigatoria');
     if (!hasMinScore) reasons.push(`Score ${score} abaixo do minimo ${minScore}`);
+    if (isFrozen) reasons.push(checklist.freezeMessage || 'Freeze window ativa');
 
     logger.info(
       { requestId: context.requestId, releaseId, score, minScore, approvedCount, allowed },
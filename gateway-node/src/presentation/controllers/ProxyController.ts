@@ -21,6 +21,9 @@ export class ProxyController {
       if (req.headers.authorization) {
         forwardedHeaders.authorization = req.headers.authorization as string;
       }
+      if (req.headers['idempotency-key']) {
+        forwardedHeaders['idempotency-key'] = req.headers['idempotency-key'] as string;
+      }
 
       let response;
       if (method === 'GET' || method === 'HEAD' || method === 'DELETE') {
@@ -0,0 +1,62 @@
+"""
+Manutenção das partições mensais de audit_logs
+
+Uso:
+    python audit_retention.py list
+    python audit_retention.py ensure [--ahead 3]
+    python audit_retention.py archive [--retention-months 12] [--dir /var/lib/aurora/audit-archive]
+                                      [--format jsonl|parquet] [--dry-run]
+
+archive desanexa as partições mais antigas que a retenção, exporta cada uma para
+<dir>/audit_logs_AAAA_MM.jsonl.gz (ou .parquet) e remove a tabela. Pensado para cron.
+"""
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.infrastructure.database import SessionLocal
+from src.infrastructure.audit_partitions import ARCHIVE_FORMATS, AuditPartitionManager
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Partições e retenção de audit_logs")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="Lista as partições")
+
+    ensure = commands.add_parser("ensure", help="Cria as partições do mês corrente e seguintes")
+    ensure.add_argument("--ahead", type=int, default=int(os.getenv("AUDIT_PARTITIONS_AHEAD", "3")))
+
+    archive = commands.add_parser("archive", help="Arquiva e remove partições fora da retenção")
+    archive.add_argument("--retention-months", type=int, default=int(os.getenv("AUDIT_RETENTION_MONTHS", "12")))
+    archive.add_argument("--dir", default=os.getenv("AUDIT_ARCHIVE_DIR", "audit-archive"))
+    archive.add_argument("--format", choices=ARCHIVE_FORMATS, default="jsonl")
+    archive.add_argument("--dry-run", action="store_true")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.command == "list":
+        with SessionLocal() as session:
+            for partition in AuditPartitionManager.list_partitions(session):
+                print(f"{partition.name}\t{partition.month:%Y-%m}\t{'attached' if partition.attached else 'detached'}")
+        return 0
+
+    if args.command == "ensure":
+        created = AuditPartitionManager(SessionLocal, months_ahead=args.ahead).ensure_partitions()
+        print(f"Partições criadas: {', '.join(created) or 'nenhuma'}")
+        return 0
+
+    files = AuditPartitionManager(SessionLocal).archive(
+        args.retention_months, args.dir, args.format, dry_run=args.dry_run
+    )
+    action = "Seriam arquivadas" if args.dry_run else "Arquivadas"
+    print(f"{action}: {', '.join(str(f) for f in files) or 'nenhuma'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Benchmark de serialização das listagens (GET /releases) por página
+
+Compara, para páginas de releases em memória (sem banco):
+- caminho anterior: model_dump por linha, envelope ApiResponse validado e despejado
+  de novo, response_model=dict e jsonable_encoder do FastAPI, json.dumps do JSONResponse
+- caminho direto: dump da página via TypeAdapter, envelope montado como dict e
+  renderizado uma vez com orjson (FastJSONResponse)
+
+A montagem dos DTOs (ReleaseResponse.from_orm), comum aos dois caminhos, é medida à
+parte para mostrar o peso relativo da serialização na página inteira.
+
+Uso:
+    python benchmarks/bench_list_serialization.py --limits 100 1000 --iterations 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.infrastructure.orm.release import ReleaseORM
+from src.application.dtos.api_response import ApiResponse
+from src.application.dtos.release_dtos import ReleaseResponse
+from src.presentation.utils.json_response import dump_models, success_json
+
+DICT_FIELD = create_response_field(name="Response_bench", type_=dict)
+LOOP = asyncio.new_event_loop()
+
+
+def make_releases(count: int):
+    app_id = uuid.uuid4()
+    start = datetime(2026, 1, 1)
+    return [
+        ReleaseORM(id=uuid.uuid4(), application_id=app_id, version=f"1.0.{i}", env="DEV", status="PENDING",
+                   evidence_url=f"https://ci.example.com/builds/{i}", evidence_score=80, version_row=i,
+                   created_at=start + timedelta(minutes=i), deployed_at=None)
+        for i in range(count)
+    ]
+
+
+def page_meta(limit: int) -> dict:
+    return {'total': 250000, 'totalExact': True, 'skip': 0, 'limit': limit, 'nextCursor': "opaque-cursor"}
+
+
+def build_dtos(releases):
+    return [ReleaseResponse.from_orm(r, "aurora-api", approval_count=2, rejection_count=0) for r in releases]
+
+
+def previous_path(dtos, limit: int) -> bytes:
+    response_data = {'data': [r.model_dump(by_alias=True) for r in dtos], **page_meta(limit)}
+    content = ApiResponse.success_response(response_data, None).model_dump()
+    encoded = LOOP.run_until_complete(serialize_response(field=DICT_FIELD, response_content=content))
+    return JSONResponse(encoded).body
+
+
+def direct_path(dtos, limit: int) -> bytes:
+    return success_json({'data': dump_models(dtos), **page_meta(limit)}).body
+
+
+def measure(fn, iterations: int, *args) -> float:
+    fn(*args)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(*args)
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limits", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'limit':>6} {'DTOs':>10} {'anterior':>10} {'direto':>10} {'ganho':>7} {'bytes':>9}")
+    for limit in args.limits:
+        releases = make_releases(limit)
+        dtos = build_dtos(releases)
+        build_ms = measure(build_dtos, args.iterations, releases)
+        previous_ms = measure(previous_path, args.iterations, dtos, limit)
+        direct_ms = measure(direct_path, args.iterations, dtos, limit)
+        assert json.loads(previous_path(dtos, limit))["data"] == json.loads(direct_path(dtos, limit))["data"]
+        print(f"{limit:>6} {build_ms:>8.2f}ms {previous_ms:>8.2f}ms {direct_ms:>8.2f}ms "
+              f"{previous_ms / direct_ms:>6.1f}x {len(direct_path(dtos, limit)):>9}")
+
+
+if __name__ == "__main__":
+    main()
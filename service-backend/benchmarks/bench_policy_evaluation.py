@@ -0,0 +1,78 @@
+"""
+Microbenchmark de PolicyService.validate_promotion (PRE_PROD -> PROD)
+
+Compara a avaliação antiga de freeze window (pytz + strftime + prints a cada
+chamada) com as janelas pré-compiladas por minuto do dia.
+
+Uso:
+    python benchmarks/bench_policy_evaluation.py --iterations 100000
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pytz import timezone as pytz_timezone
+
+from src.domain.services.policy_service import PolicyService
+
+
+def legacy_is_frozen_now(window) -> bool:
+    """Reprodução da implementação anterior de FreezeWindow.is_frozen_now"""
+    tz = pytz_timezone(window.timezone_name)
+    current_time = datetime.now(tz).strftime("%H:%M")
+    print(f"[FREEZE CHECK] Env: {window.env}, Current: {current_time}, Window: {window.start}-{window.end}, TZ: {window.timezone_name}")
+    if window.start < window.end:
+        is_frozen = window.start <= current_time <= window.end
+    else:
+        is_frozen = current_time >= window.start or current_time <= window.end
+    print(f"[FREEZE CHECK] Is frozen: {is_frozen}")
+    return is_frozen
+
+
+def legacy_is_frozen_for_env(service: PolicyService, env: str) -> bool:
+    for window in service.freeze_windows:
+        if window.env == env:
+            return legacy_is_frozen_now(window)
+    return False
+
+
+def measure(service: PolicyService, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        service.validate_promotion(
+            "PRE_PROD", "PROD", approval_count=1,
+            evidence_score=80, evidence_url="https://ci.example.com/report.pdf"
+        )
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with patch("os.path.exists", return_value=False):
+        service = PolicyService()
+
+    # stdout descartado: em produção os prints iam para o log do container
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        with patch.object(service, "is_frozen_for_env", lambda env: legacy_is_frozen_for_env(service, env)):
+            legacy = measure(service, args.iterations)
+    compiled = measure(service, args.iterations)
+
+    print(f"{'variante':<12} {'total s':>9} {'us/call':>9} {'calls/s':>12}")
+    for label, elapsed in (("legacy", legacy), ("compiled", compiled)):
+        print(f"{label:<12} {elapsed:>9.3f} {elapsed / args.iterations * 1e6:>9.2f} "
+              f"{args.iterations / elapsed:>12.0f}")
+    print(f"speedup: {legacy / compiled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark de ScoringService: custo por URL
+
+Compara a implementação anterior (buscas `in` repetidas + urlparse), calculate_score
+com o memo frio e quente, e calculate_scores (um passe pré-compilado + dedupe no lote).
+Também confere que todas as variantes dão o mesmo score, inclusive com palavras
+coladas e sobrepostas como PASSUCCESS.
+
+Uso:
+    python benchmarks/bench_scoring.py --sizes 1000 100000 --distinct 0.5
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.domain.services.scoring_service import ScoringService
+
+WORDS = ["build", "test", "report", "results", "evidence", "pass", "PASS", "success", "SUCCESS",
+         "ci", "artifacts", "run", "job", "main", "release", "coverage", "pas", "s", "uccess", "."]
+EXTENSIONS = ["", ".pdf", ".html", ".json", ".xml", ".png", ".jpg", ".txt"]
+SCHEMES = ["https://", "http://", "ftp://", ""]
+
+
+def legacy_calculate_score(evidence_url: str) -> int:
+    """Reprodução da implementação anterior (buscas `in` repetidas)"""
+    try:
+        parsed = urlparse(evidence_url)
+        if not all([parsed.scheme, parsed.netloc]):
+            return 0
+    except Exception:
+        return 0
+    score = 0
+    url_upper = evidence_url.upper()
+    if url_upper.startswith("HTTPS://"):
+        score += 20
+    elif url_upper.startswith("HTTP://"):
+        score += 10
+    if any(pattern in url_upper for pattern in ["TEST", "REPORT", "RESULTS", "EVIDENCE"]):
+        score += 20
+    if "PASS" in url_upper:
+        score += 30
+    if "SUCCESS" in url_upper:
+        score += 20
+    if any(ext in url_upper for ext in [".PDF", ".HTML", ".JSON", ".XML", ".PNG", ".JPG"]):
+        score += 10
+    return min(score, ScoringService.MAX_SCORE)
+
+
+def make_urls(count: int, distinct_ratio: float, seed: int = 42):
+    rng = random.Random(seed)
+    distinct = [
+        f"{rng.choice(SCHEMES)}ci{rng.randint(1, 50)}.example.com/"
+        + rng.choice(["/", "-", ""]).join(rng.choice(WORDS) for _ in range(rng.randint(2, 6)))
+        + f"-{rng.randint(1, 10**6)}{rng.choice(EXTENSIONS)}"
+        for _ in range(max(1, int(count * distinct_ratio)))
+    ]
+    return [rng.choice(distinct) for _ in range(count)]
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000])
+    parser.add_argument("--distinct", type=float, default=1.0, help="fração de URLs distintas no lote")
+    args = parser.parse_args()
+
+    # Sem handlers: mede o scoring, não o I/O de log
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'URLs':>8} {'variante':<22} {'total ms':>10} {'us/URL':>8}")
+    for size in args.sizes:
+        urls = make_urls(size, args.distinct)
+        legacy, legacy_s = timed(lambda: [legacy_calculate_score(url) for url in urls])
+        ScoringService.clear_cache()
+        single, single_s = timed(lambda: [ScoringService.calculate_score(url) for url in urls])
+        warm, warm_s = timed(lambda: [ScoringService.calculate_score(url) for url in urls])
+        ScoringService.clear_cache()
+        batch, batch_s = timed(lambda: ScoringService.calculate_scores(urls))
+        assert legacy == single == warm == batch, "scores divergentes"
+        for label, elapsed in (("legacy calculate_score", legacy_s),
+                               ("calculate_score (frio)", single_s),
+                               ("calculate_score (memo)", warm_s),
+                               ("calculate_scores", batch_s)):
+            print(f"{size:>8} {label:<22} {elapsed * 1000:>10.1f} {elapsed / size * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark de verificação de JWT (HS256): PyJWT x TokenVerifier
+
+Mede verificações por segundo de:
+- jwt.decode do PyJWT com a chave em string (preparada a cada chamada)
+- jwt.decode do PyJWT com PyJWK pré-carregado
+- TokenVerifier com tokens sempre novos (cache frio) e repetidos (cache quente)
+
+Uso:
+    python benchmarks/bench_token_verification.py --tokens 200 --iterations 20000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import jwt
+
+from src.core.auth import TokenVerifier
+
+SECRET = "benchmark-secret-with-enough-length-for-hs256"
+
+
+def make_tokens(count: int):
+    exp = int(time.time()) + 3600
+    return [
+        jwt.encode({"email": f"user{i}@test.com", "name": f"User {i}", "sub": f"user{i}@test.com",
+                    "role": "VIEWER", "exp": exp}, SECRET, algorithm="HS256")
+        for i in range(count)
+    ]
+
+
+def measure(name: str, fn, tokens, iterations: int):
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(tokens[i % len(tokens)])
+    elapsed = time.perf_counter() - start
+    print(f"{name:<32} {iterations / elapsed:>12,.0f} /s {elapsed / iterations * 1e6:>9.2f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=200, help="Tokens distintos (sessões) em rodízio")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    tokens = make_tokens(args.tokens)
+    pyjwk = jwt.PyJWK.from_dict({"kty": "oct", "alg": "HS256",
+                                 "k": jwt.utils.base64url_encode(SECRET.encode()).decode()})
+    cold_tokens = make_tokens(args.iterations)
+
+    print(f"{'variante':<32} {'verificações':>15} {'por chamada':>12}")
+    measure("PyJWT decode (chave str)", lambda t: jwt.decode(t, SECRET, algorithms=["HS256"]),
+            tokens, args.iterations)
+    measure("PyJWT decode (PyJWK)", lambda t: jwt.decode(t, pyjwk, algorithms=["HS256"]),
+            tokens, args.iterations)
+    measure("TokenVerifier, cache frio", TokenVerifier(SECRET).verify, cold_tokens, args.iterations)
+    warm = TokenVerifier(SECRET)
+    for token in tokens:
+        warm.verify(token)
+    measure("TokenVerifier, cache quente", warm.verify, tokens, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
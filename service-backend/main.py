@@ -1,11 +1,20 @@
 from fastapi import FastAPI
 from src.presentation.middleware.exception_handler import setup_exception_handlers
 from src.presentation.middleware.request_id_middleware import request_id_middleware
+from src.presentation.middleware.read_your_writes_middleware import read_your_writes_middleware
+from src.presentation.middleware.idempotency_middleware import idempotency_middleware
 from src.presentation.controllers.auth_controller import router as auth_router
 from src.presentation.routes.application_routes import router as application_router
 from src.presentation.routes.release_routes import router as release_router
 from src.presentation.routes.approval_routes import router as approval_router
 from src.presentation.routes.audit_log_routes import router as audit_log_router
+from src.presentation.routes.metrics_routes import router as metrics_router
+from src.infrastructure.database import dispose_async_engine
+from src.domain.services.policy_service import start_policy_watcher, stop_policy_watcher
+from src.infrastructure.idempotency_store import start_idempotency_sweeper, stop_idempotency_sweeper
+from src.infrastructure.audit_writer import start_audit_writer, stop_audit_writer
+from src.infrastructure.audit_partitions import start_audit_partition_maintenance, stop_audit_partition_maintenance
+from src.application.services.password_hashing import shutdown_password_executor
 
 app = FastAPI(
     title="Aurora Release Management API",
@@ -14,16 +23,30 @@ app = FastAPI(
 )
 
 # Registrar middleware
+app.middleware("http")(idempotency_middleware)
 app.middleware("http")(request_id_middleware)
+app.middleware("http")(read_your_writes_middleware)
 
 setup_exception_handlers(app)
 
+app.add_event_handler("startup", start_policy_watcher)
+app.add_event_handler("startup", start_idempotency_sweeper)
+app.add_event_handler("startup", start_audit_writer)
+app.add_event_handler("startup", start_audit_partition_maintenance)
+app.add_event_handler("shutdown", stop_policy_watcher)
+app.add_event_handler("shutdown", stop_idempotency_sweeper)
+app.add_event_handler("shutdown", stop_audit_writer)
+app.add_event_handler("shutdown", stop_audit_partition_maintenance)
+app.add_event_handler("shutdown", shutdown_password_executor)
+app.add_event_handler("shutdown", dispose_async_engine)
+
 # Registrar routers
 app.include_router(auth_router)
 app.include_router(application_router)
 app.include_router(release_router)
 app.include_router(approval_router)
 app.include_router(audit_log_router)
+app.include_router(metrics_router)
 
 @app.get("/health", tags=["Health"])
 async def health_check():
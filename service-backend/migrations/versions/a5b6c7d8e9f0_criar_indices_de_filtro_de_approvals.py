@@ -0,0 +1,36 @@
+"""criar indices de filtro de approvals
+
+Revision ID: a5b6c7d8e9f0
+Revises: f4a5b6c7d8e9
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5b6c7d8e9f0'
+down_revision: Union[str, None] = 'f4a5b6c7d8e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# GET /approvals filtrado, ordenado por (created_at DESC, id DESC).
+# approver_email(+outcome) já é coberto por ix_approvals_approver_outcome_created.
+FILTER_INDEXES = [
+    ('ix_approvals_release_created_id', 'approvals', ['release_id', 'created_at', 'id']),
+    ('ix_approvals_outcome_created_id', 'approvals', ['outcome', 'created_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in FILTER_INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(FILTER_INDEXES):
+        op.drop_index(name, table_name=table)
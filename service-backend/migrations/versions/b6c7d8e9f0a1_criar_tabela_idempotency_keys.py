@@ -0,0 +1,41 @@
+"""criar tabela idempotency_keys
+
+Revision ID: b6c7d8e9f0a1
+Revises: a5b6c7d8e9f0
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6c7d8e9f0a1'
+down_revision: Union[str, None] = 'a5b6c7d8e9f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'idempotency_keys',
+        sa.Column('id', sa.dialects.postgresql.UUID(as_uuid=True), server_default=sa.func.gen_random_uuid(), nullable=False),
+        sa.Column('key', sa.String(255), nullable=False),
+        sa.Column('request_method', sa.String(10), nullable=False),
+        sa.Column('request_path', sa.String(500), nullable=False),
+        sa.Column('response_body', sa.Text(), nullable=False),
+        sa.Column('status_code', sa.String(3), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        # Alvo do INSERT ... ON CONFLICT (key)
+        sa.Index('ix_idempotency_keys_key', 'key', unique=True),
+        # Limpeza em lotes dos expirados
+        sa.Index('ix_idempotency_keys_expires_at', 'expires_at'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('idempotency_keys')
@@ -0,0 +1,40 @@
+"""criar indices da caixa de aprovacao
+
+Revision ID: c1d2e3f4a5b6
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c1d2e3f4a5b6'
+down_revision: Union[str, None] = 'b8c9d0e1f2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Anti-join de /approvals/pending/current: decisões do aprovador por release
+    op.create_index(
+        'ix_approvals_release_approver_decided',
+        'approvals',
+        ['release_id', 'approver_email'],
+        postgresql_where=sa.text('outcome IS NOT NULL'),
+    )
+    # Varredura ordenada das releases aprováveis (fora de PROD)
+    op.create_index(
+        'ix_releases_pending_inbox',
+        'releases',
+        ['created_at', 'id'],
+        postgresql_where=sa.text("env <> 'PROD'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_releases_pending_inbox', table_name='releases')
+    op.drop_index('ix_approvals_release_approver_decided', table_name='approvals')
@@ -0,0 +1,39 @@
+"""criar tabela audit_log_outbox
+
+Revision ID: c7d8e9f0a1b2
+Revises: b6c7d8e9f0a1
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d8e9f0a1b2'
+down_revision: Union[str, None] = 'b6c7d8e9f0a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Sem índices secundários: o INSERT na transação da operação fica barato
+    op.create_table(
+        'audit_log_outbox',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('audit_id', sa.dialects.postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('actor', sa.String(255), nullable=False),
+        sa.Column('action', sa.String(100), nullable=False),
+        sa.Column('entity', sa.String(100), nullable=False),
+        sa.Column('entity_id', sa.dialects.postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('request_id', sa.String(255), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('audit_log_outbox')
@@ -0,0 +1,31 @@
+"""criar indice do historico de aprovacoes
+
+Revision ID: d2e3f4a5b6c7
+Revises: c1d2e3f4a5b6
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2e3f4a5b6c7'
+down_revision: Union[str, None] = 'c1d2e3f4a5b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # /approvals/approved/current e /approvals/rejected/current (keyset em created_at, id)
+    op.create_index(
+        'ix_approvals_approver_outcome_created',
+        'approvals',
+        ['approver_email', 'outcome', 'created_at', 'id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_approvals_approver_outcome_created', table_name='approvals')
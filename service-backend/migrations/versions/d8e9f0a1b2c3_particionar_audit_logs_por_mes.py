@@ -0,0 +1,100 @@
+"""particionar audit_logs por mês
+
+Revision ID: d8e9f0a1b2c3
+Revises: c7d8e9f0a1b2
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8e9f0a1b2c3'
+down_revision: Union[str, None] = 'c7d8e9f0a1b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Meses criados à frente do corrente; depois disso o AuditPartitionManager mantém
+MONTHS_AHEAD = 3
+
+# (nome, colunas) - mesmos índices da tabela original, criados no pai (propagam às partições)
+AUDIT_LOG_INDEXES = [
+    ('ix_audit_logs_actor', ['actor']),
+    ('ix_audit_logs_action', ['action']),
+    ('ix_audit_logs_entity_id', ['entity_id']),
+    ('ix_audit_logs_created_at', ['created_at']),
+    ('ix_audit_logs_created_id', ['created_at', 'id']),
+    ('ix_audit_logs_entity_created_id', ['entity', 'entity_id', 'created_at', 'id']),
+    ('ix_audit_logs_actor_created_id', ['actor', 'created_at', 'id']),
+]
+
+COLUMNS = "id, actor, action, entity, entity_id, payload, request_id, created_at"
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _columns():
+    return [
+        sa.Column('id', sa.dialects.postgresql.UUID(as_uuid=True), server_default=sa.func.gen_random_uuid(), nullable=False),
+        sa.Column('actor', sa.String(255), nullable=False),
+        sa.Column('action', sa.String(100), nullable=False),
+        sa.Column('entity', sa.String(100), nullable=False),
+        sa.Column('entity_id', sa.dialects.postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('request_id', sa.String(255)),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    ]
+
+
+def upgrade() -> None:
+    op.rename_table('audit_logs', 'audit_logs_unpartitioned')
+    op.execute("ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey")
+
+    # A chave de partição precisa fazer parte da PK
+    op.create_table(
+        'audit_logs',
+        *_columns(),
+        sa.PrimaryKeyConstraint('id', 'created_at'),
+        postgresql_partition_by='RANGE (created_at)',
+    )
+
+    oldest = op.get_bind().execute(sa.text("SELECT min(created_at) FROM audit_logs_unpartitioned")).scalar()
+    current = datetime.utcnow().date().replace(day=1)
+    month = min(oldest.date(), current).replace(day=1) if oldest else current
+    last = _add_months(current, MONTHS_AHEAD)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE audit_logs_{month.year:04d}_{month.month:02d} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+
+    op.execute(f"INSERT INTO audit_logs ({COLUMNS}) SELECT {COLUMNS} FROM audit_logs_unpartitioned")
+    op.drop_table('audit_logs_unpartitioned')
+
+    # Índices depois da carga: mais rápido que mantê-los linha a linha
+    for name, columns in AUDIT_LOG_INDEXES:
+        op.create_index(name, 'audit_logs', columns)
+
+
+def downgrade() -> None:
+    op.rename_table('audit_logs', 'audit_logs_partitioned')
+    op.execute("ALTER TABLE audit_logs_partitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_partitioned_pkey")
+    for name, _ in AUDIT_LOG_INDEXES:
+        op.execute(f"ALTER INDEX {name} RENAME TO {name}_partitioned")
+
+    op.create_table('audit_logs', *_columns(), sa.PrimaryKeyConstraint('id'))
+    op.execute(f"INSERT INTO audit_logs ({COLUMNS}) SELECT {COLUMNS} FROM audit_logs_partitioned")
+    # Remove o pai e todas as partições
+    op.drop_table('audit_logs_partitioned')
+
+    for name, columns in AUDIT_LOG_INDEXES:
+        op.create_index(name, 'audit_logs', columns)
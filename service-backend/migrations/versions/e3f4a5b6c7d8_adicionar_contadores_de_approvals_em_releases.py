@@ -0,0 +1,43 @@
+"""adicionar contadores de approvals em releases
+
+Revision ID: e3f4a5b6c7d8
+Revises: d2e3f4a5b6c7
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3f4a5b6c7d8'
+down_revision: Union[str, None] = 'd2e3f4a5b6c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('releases', sa.Column('approved_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('releases', sa.Column('rejected_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill a partir das approvals existentes
+    op.execute("""
+        UPDATE releases r
+        SET approved_count = c.approved,
+            rejected_count = c.rejected
+        FROM (
+            SELECT release_id,
+                   COUNT(*) FILTER (WHERE outcome = 'APPROVED') AS approved,
+                   COUNT(*) FILTER (WHERE outcome = 'REJECTED') AS rejected
+            FROM approvals
+            GROUP BY release_id
+        ) c
+        WHERE c.release_id = r.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('releases', 'rejected_count')
+    op.drop_column('releases', 'approved_count')
@@ -0,0 +1,47 @@
+"""criar partição default de audit_logs
+
+Revision ID: e9f0a1b2c3d4
+Revises: d8e9f0a1b2c3
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9f0a1b2c3d4'
+down_revision: Union[str, None] = 'd8e9f0a1b2c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = "id, actor, action, entity, entity_id, payload, request_id, created_at"
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    # Recebe linhas sem partição mensal (manutenção desligada ou atrasada) em vez de
+    # falhar o INSERT na transação da operação; o AuditPartitionManager as redistribui
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE audit_logs DETACH PARTITION audit_logs_default")
+    months = op.get_bind().execute(sa.text(
+        "SELECT DISTINCT date_trunc('month', created_at)::date FROM audit_logs_default"
+    )).scalars().all()
+    for month in months:
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS audit_logs_{month.year:04d}_{month.month:02d} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+        )
+    op.execute(f"INSERT INTO audit_logs ({COLUMNS}) SELECT {COLUMNS} FROM audit_logs_default")
+    op.drop_table('audit_logs_default')
@@ -0,0 +1,27 @@
+"""adicionar hash da requisição em idempotency_keys
+
+Revision ID: f0a1b2c3d4e5
+Revises: e9f0a1b2c3d4
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f0a1b2c3d4e5'
+down_revision: Union[str, None] = 'e9f0a1b2c3d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SHA-256 do corpo da requisição; registros anteriores ficam sem hash (não comparados)
+    op.add_column('idempotency_keys', sa.Column('request_hash', sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('idempotency_keys', 'request_hash')
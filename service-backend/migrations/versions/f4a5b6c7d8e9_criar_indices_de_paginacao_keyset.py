@@ -0,0 +1,41 @@
+"""criar indices de paginacao keyset
+
+Revision ID: f4a5b6c7d8e9
+Revises: e3f4a5b6c7d8
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a5b6c7d8e9'
+down_revision: Union[str, None] = 'e3f4a5b6c7d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (nome, tabela, colunas) - listagens ordenadas por (created_at DESC, id DESC)
+KEYSET_INDEXES = [
+    ('ix_releases_created_id', 'releases', ['created_at', 'id']),
+    ('ix_releases_application_created_id', 'releases', ['application_id', 'created_at', 'id']),
+    ('ix_releases_status_created_id', 'releases', ['status', 'created_at', 'id']),
+    ('ix_approvals_created_id', 'approvals', ['created_at', 'id']),
+    ('ix_audit_logs_created_id', 'audit_logs', ['created_at', 'id']),
+    ('ix_audit_logs_entity_created_id', 'audit_logs', ['entity', 'entity_id', 'created_at', 'id']),
+    ('ix_audit_logs_actor_created_id', 'audit_logs', ['actor', 'created_at', 'id']),
+    ('ix_applications_created_id', 'applications', ['created_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in KEYSET_INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(KEYSET_INDEXES):
+        op.drop_index(name, table_name=table)
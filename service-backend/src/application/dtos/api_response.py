@@ -54,6 +54,17 @@ class ApiResponse(BaseModel, Generic[T]):
             timestamp=datetime.now(timezone.utc)
         )
     
+    @staticmethod
+    def success_body(data, request_id: Optional[str] = None) -> dict:
+        """Envelope de sucesso já no formato de model_dump(), sem validação"""
+        return {
+            'success': True,
+            'data': data,
+            'error': None,
+            'requestId': request_id,
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+
     @staticmethod
     def error_response(
         code: str,
@@ -10,7 +10,8 @@ class AuditLogResponse(BaseModel):
     action: str = Field(alias="action")
     entity: str = Field(alias="entity")
     entity_id: UUID = Field(alias="entityId")
-    payload: Dict[str, Any] = Field(alias="payload")
+    # None quando a listagem é pedida sem payload (includePayload=false)
+    payload: Optional[Dict[str, Any]] = Field(alias="payload")
     request_id: Optional[str] = Field(alias="requestId")
     created_at: datetime = Field(alias="createdAt")
 
@@ -26,7 +27,7 @@ class AuditLogResponse(BaseModel):
             action=orm_object.action,
             entity=orm_object.entity,
             entity_id=orm_object.entity_id,
-            payload=orm_object.payload,
+            payload=getattr(orm_object, 'payload', None),
             request_id=orm_object.request_id,
             created_at=orm_object.created_at
         )
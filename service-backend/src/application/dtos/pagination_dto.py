@@ -12,12 +12,16 @@ class PaginatedResponse(BaseModel, Generic[T]):
     )
     
     data: List[T]
-    total: int
+    total: Optional[int] = None
+    total_exact: bool = True
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
     
     @property
     def has_next(self) -> bool:
+        if self.total is None:
+            return self.next_cursor is not None
         return (self.skip + self.limit) < self.total
     
     @property
@@ -1,10 +1,24 @@
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.orm.user import UserORM
 from src.infrastructure.repositories.user_repository import UserRepository
-from src.domain.entities.user import User
+from src.infrastructure.repositories.async_user_repository import AsyncUserRepository
+from src.infrastructure.cache.user_cache import get_user_cache
+from src.domain.entities.user import User, UserRole
 from src.application.exceptions import AuthenticationError, UserNotFoundError
+from src.application.services.password_hashing import (
+    hash_password, pwd_context, verify_password, verify_password_async
+)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def _to_user(user_orm: UserORM) -> User:
+    return User(
+        id=str(user_orm.id),
+        email=user_orm.email,
+        name=user_orm.name,
+        role=user_orm.role,
+        created_at=user_orm.created_at
+    )
 
 
 class AuthService:
@@ -21,17 +35,39 @@ class AuthService:
         if not self._verify_password(password, user_orm.password_hash):
             raise AuthenticationError("Email ou senha incorretos")
         
-        return User(
-            id=str(user_orm.id),
-            email=user_orm.email,
-            name=user_orm.name,
-            role=user_orm.role,
-            created_at=user_orm.created_at
-        )
+        return _to_user(user_orm)
 
     def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+        return verify_password(plain_password, hashed_password)
+
+    def update_role(self, email: str, role: UserRole) -> User:
+        user_orm = self.user_repo.update_role(email, role)
+        if not user_orm:
+            raise UserNotFoundError(f"Usuário {email} não encontrado")
+        self.session.commit()
+        # Role nova vale imediatamente neste processo; nos demais, após USER_CACHE_TTL_SECONDS
+        get_user_cache().invalidate(email)
+        return _to_user(user_orm)
 
     @staticmethod
     def hash_password(password: str) -> str:
-        return pwd_context.hash(password)
+        return hash_password(password)
+
+
+class AsyncAuthService:
+    """AuthService sobre AsyncSession; bcrypt roda no executor dedicado, fora do event loop"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.user_repo = AsyncUserRepository(session)
+
+    async def authenticate(self, email: str, password: str) -> User:
+        user_orm = await self.user_repo.get_by_email(email)
+
+        if not user_orm:
+            raise UserNotFoundError(f"Usuário {email} não encontrado")
+
+        if not await verify_password_async(password, user_orm.password_hash):
+            raise AuthenticationError("Email ou senha incorretos")
+
+        return _to_user(user_orm)
@@ -0,0 +1,61 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from passlib.context import CryptContext
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+EXECUTOR_KINDS = ("thread", "process")
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verificação bcrypt (CPU-bound, ~centenas de ms); função de módulo para rodar em processo"""
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _create_executor(kind: str, workers: int) -> Executor:
+    if kind not in EXECUTOR_KINDS:
+        raise ValueError(f"PASSWORD_HASH_EXECUTOR inválido: {kind} (use {', '.join(EXECUTOR_KINDS)})")
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    # bcrypt libera o GIL durante o hash, então threads já rodam em paralelo
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+
+
+_executor: Optional[Executor] = None
+
+
+def get_password_executor() -> Executor:
+    """
+    Executor dedicado e limitado para bcrypt (singleton por processo).
+
+    PASSWORD_HASH_EXECUTOR: thread (padrão) ou process
+    PASSWORD_HASH_WORKERS: máximo de hashes simultâneos (padrão: núcleos, até 4)
+    """
+    global _executor
+    if _executor is None:
+        _executor = _create_executor(
+            os.getenv("PASSWORD_HASH_EXECUTOR", "thread").lower(),
+            int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+        )
+    return _executor
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password no executor dedicado, sem bloquear o event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_password_executor(), verify_password, plain_password, hashed_password)
+
+
+def shutdown_password_executor():
+    """Shutdown: encerra o executor de bcrypt"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
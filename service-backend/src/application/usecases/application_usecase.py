@@ -2,8 +2,10 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from src.infrastructure.repositories.application_repository import ApplicationRepository
+from src.infrastructure.cache.application_cache import get_application_cache
 from src.application.dtos.application_dtos import ApplicationRequest, ApplicationResponse
 from src.application.dtos.pagination_dto import PaginatedResponse
+from src.infrastructure.repositories.counting import CountMode
 
 
 class ApplicationUseCase:
@@ -30,17 +32,20 @@ class ApplicationUseCase:
             raise ValueError(f"Application {app_id} not found")
         return ApplicationResponse.model_validate(app)
 
-    def list_all(self, skip: int = 0, limit: int = 100) -> PaginatedResponse[ApplicationResponse]:
-        apps = self.repo.list_all(skip, limit)
-        total = self.repo.count_all()
+    def list_all(self, skip: int = 0, limit: int = 100, cursor: str = None,
+                 include_total: bool = True, count_mode: CountMode = CountMode.EXACT) -> PaginatedResponse[ApplicationResponse]:
+        apps, next_cursor = self.repo.list_all(skip, limit, cursor)
+        total, total_exact = self.repo.count_all(count_mode) if include_total else (None, False)
         data = [ApplicationResponse.model_validate(app) for app in apps]
-        return PaginatedResponse(data=data, total=total, skip=skip, limit=limit)
+        return PaginatedResponse(data=data, total=total, total_exact=total_exact, skip=skip, limit=limit,
+                                 next_cursor=next_cursor)
 
     def update(self, app_id: UUID, request: ApplicationRequest) -> ApplicationResponse:
         app = self.repo.update(app_id, request.name, request.owner_team, request.repo_url)
         if not app:
             raise ValueError(f"Application {app_id} not found")
         self.session.commit()
+        get_application_cache().invalidate(app_id)
         return ApplicationResponse.model_validate(app)
 
     def delete(self, app_id: UUID) -> bool:
@@ -48,4 +53,5 @@ class ApplicationUseCase:
         if not deleted:
             raise ValueError(f"Application {app_id} not found")
         self.session.commit()
+        get_application_cache().invalidate(app_id)
         return True
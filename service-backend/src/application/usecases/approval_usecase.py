@@ -1,11 +1,23 @@
 from uuid import UUID
 from sqlalchemy.orm import Session
-from src.infrastructure.repositories.approval_repository import ApprovalRepository
+from src.infrastructure.repositories.approval_repository import ApprovalRepository, ApprovalFilter
 from src.infrastructure.repositories.release_repository import ReleaseRepository
 from src.infrastructure.repositories.release_event_repository import ReleaseEventRepository
 from src.infrastructure.repositories.audit_log_repository import AuditLogRepository
 from src.infrastructure.repositories.application_repository import ApplicationRepository
+from src.infrastructure.cache.application_cache import get_application_cache
 from src.application.dtos.approval_dtos import ApprovalRequest, ApprovalResponse
+from src.application.dtos.pagination_dto import PaginatedResponse
+from src.infrastructure.repositories.counting import CountMode
+
+
+def _counter_deltas(outcome: str, sign: int = 1) -> dict:
+    """Converte um outcome em deltas para ReleaseRepository.adjust_approval_counters"""
+    if outcome == 'APPROVED':
+        return {'approved': sign}
+    if outcome == 'REJECTED':
+        return {'rejected': sign}
+    return {}
 
 
 class ApprovalUseCase:
@@ -15,6 +27,7 @@ class ApprovalUseCase:
         self.audit_repo = AuditLogRepository(session)
         self.release_repo = ReleaseRepository(session)
         self.app_repo = ApplicationRepository(session)
+        self.app_cache = get_application_cache()
         self.session = session
         self.actor_email = actor_email or "unknown"
 
@@ -26,8 +39,12 @@ class ApprovalUseCase:
             notes=request.notes
         )
         
+        deltas = _counter_deltas(request.outcome)
+        if deltas:
+            self.release_repo.adjust_approval_counters(release_id, **deltas)
+        
         # Log de auditoria
-        self.audit_repo.create(
+        self.audit_repo.append(
             actor=self.actor_email,
             action="CREATE",
             entity="APPROVAL",
@@ -47,9 +64,15 @@ class ApprovalUseCase:
             raise ValueError(f"Approval {approval_id} not found")
         return ApprovalResponse.from_orm(approval)
 
-    def list_all(self, skip: int = 0, limit: int = 100):
-        approvals = self.repo.list_all(skip, limit)
-        return [ApprovalResponse.from_orm(a) for a in approvals]
+    def list_all(self, skip: int = 0, limit: int = 100, cursor: str = None,
+                 include_total: bool = True, count_mode: CountMode = CountMode.EXACT,
+                 filters: ApprovalFilter = None) -> PaginatedResponse[ApprovalResponse]:
+        filters = filters.normalized() if filters else None
+        approvals, next_cursor = self.repo.list_all(skip, limit, cursor, filters)
+        total, total_exact = self.repo.count_all(count_mode, filters) if include_total else (None, False)
+        data = [ApprovalResponse.from_orm(a) for a in approvals]
+        return PaginatedResponse(data=data, total=total, total_exact=total_exact, skip=skip, limit=limit,
+                                 next_cursor=next_cursor)
 
     def list_by_release(self, release_id: UUID):
         approvals = self.repo.list_by_release(release_id)
@@ -93,12 +116,10 @@ class ApprovalUseCase:
                 notes=notes or "Aprovado"
             )
         
-        application = self.app_repo.get_by_id(release.application_id)
-        app_name = application.name if application else "Unknown"
+        app_name = self.app_cache.get_name(self.app_repo, release.application_id)
         
-        # Contar aprovações APPROVED para este release
-        all_approvals = self.repo.list_by_release(release_id)
-        approval_count = len([a for a in all_approvals if a.outcome == 'APPROVED'])
+        # Atualizar contador de aprovações da release (mesma transação)
+        approval_count, _ = self.release_repo.adjust_approval_counters(release_id, approved=1)
         
         # Verificar se atingiu minApprovals da policy
         policy_service = get_policy_service()
@@ -126,7 +147,7 @@ class ApprovalUseCase:
         )
         
         # Log de auditoria
-        self.audit_repo.create(
+        self.audit_repo.append(
             actor=approver_email,
             action="APPROVE",
             entity="RELEASE",
@@ -178,8 +199,9 @@ class ApprovalUseCase:
                 notes=notes or "Rejeitado"
             )
         
-        application = self.app_repo.get_by_id(release.application_id)
-        app_name = application.name if application else "Unknown"
+        self.release_repo.adjust_approval_counters(release_id, rejected=1)
+        
+        app_name = self.app_cache.get_name(self.app_repo, release.application_id)
         
         # Criar evento
         self.event_repo.create(
@@ -191,7 +213,7 @@ class ApprovalUseCase:
         )
         
         # Log de auditoria
-        self.audit_repo.create(
+        self.audit_repo.append(
             actor=approver_email,
             action="REJECT",
             entity="RELEASE",
@@ -214,14 +236,22 @@ class ApprovalUseCase:
         if not approval:
             raise ValueError(f"Approval {approval_id} not found")
         
+        previous_outcome = approval.outcome
         approval.outcome = outcome
         if notes:
             approval.notes = notes
         
+        # Mover a decisão entre os contadores da release
+        if previous_outcome != outcome:
+            deltas = _counter_deltas(outcome)
+            for key, value in _counter_deltas(previous_outcome, sign=-1).items():
+                deltas[key] = deltas.get(key, 0) + value
+            if deltas:
+                self.release_repo.adjust_approval_counters(approval.release_id, **deltas)
+        
         # Buscar informações do release e aplicação para adicionar ao audit log
         release = self.release_repo.get_by_id(approval.release_id)
-        application = self.app_repo.get_by_id(release.application_id) if release else None
-        app_name = application.name if application else "Unknown"
+        app_name = self.app_cache.get_name(self.app_repo, release.application_id) if release else "Unknown"
         
         self.event_repo.create(
             release_id=approval.release_id,
@@ -232,7 +262,7 @@ class ApprovalUseCase:
         )
         
         # Log de auditoria com detalhes enriquecidos
-        self.audit_repo.create(
+        self.audit_repo.append(
             actor=approval.approver_email,
             action="APPROVE" if outcome == 'APPROVED' else "REJECT",
             entity="APPROVAL",
@@ -0,0 +1,62 @@
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.repositories.async_release_repository import AsyncReleaseRepository
+from src.infrastructure.repositories.async_approval_repository import AsyncApprovalRepository
+from src.infrastructure.repositories.counting import CountMode
+from src.application.dtos.release_dtos import ReleaseResponse
+from src.application.dtos.pagination_dto import PaginatedResponse
+
+
+class AsyncReleaseUseCase:
+    """Listagens de releases e caixas do aprovador sobre AsyncSession (mesmas respostas de ReleaseUseCase)"""
+
+    def __init__(self, session: AsyncSession):
+        self.repo = AsyncReleaseRepository(session)
+        self.approval_repo = AsyncApprovalRepository(session)
+        self.session = session
+
+    @staticmethod
+    def _to_responses(rows) -> list:
+        return [
+            ReleaseResponse.from_orm(release, app_name, approval_count=release.approved_count,
+                                     rejection_count=release.rejected_count)
+            for release, app_name in rows
+        ]
+
+    async def list_all(self, skip: int = 0, limit: int = 100, cursor: str = None,
+                       include_total: bool = True, count_mode: CountMode = CountMode.EXACT) -> PaginatedResponse[ReleaseResponse]:
+        rows, next_cursor = await self.repo.list_all(skip, limit, cursor)
+        total, total_exact = await self.repo.count_all(count_mode) if include_total else (None, False)
+        data = self._to_responses(rows)
+        return PaginatedResponse(data=data, total=total, total_exact=total_exact, skip=skip, limit=limit,
+                                 next_cursor=next_cursor)
+
+    async def list_by_application(self, app_id: UUID, skip: int = 0, limit: int = 100, cursor: str = None,
+                                  include_total: bool = True, count_mode: CountMode = CountMode.EXACT) -> PaginatedResponse[ReleaseResponse]:
+        rows, next_cursor = await self.repo.list_by_application(app_id, skip, limit, cursor)
+        total, total_exact = await self.repo.count_by_application(app_id, count_mode) if include_total else (None, False)
+        data = self._to_responses(rows)
+        return PaginatedResponse(data=data, total=total, total_exact=total_exact, skip=skip, limit=limit,
+                                 next_cursor=next_cursor)
+
+    async def list_pending_for_user(self, approver_email: str, skip: int = 0, limit: int = 100) -> PaginatedResponse[ReleaseResponse]:
+        """Releases que o usuário ainda NÃO aprovou e NÃO rejeitou (excluindo releases em PROD)"""
+        rows, total = await self.repo.list_pending_for_approver(approver_email, skip, limit)
+        data = self._to_responses([(r, app_name or "Unknown") for r, app_name in rows])
+        return PaginatedResponse(data=data, total=total, skip=skip, limit=limit)
+
+    async def list_approved_by_user(self, approver_email: str, skip: int = 0, limit: int = 100,
+                                    cursor: str = None) -> PaginatedResponse[ReleaseResponse]:
+        return await self._list_decided_by_user(approver_email, 'APPROVED', skip, limit, cursor)
+
+    async def list_rejected_by_user(self, approver_email: str, skip: int = 0, limit: int = 100,
+                                    cursor: str = None) -> PaginatedResponse[ReleaseResponse]:
+        return await self._list_decided_by_user(approver_email, 'REJECTED', skip, limit, cursor)
+
+    async def _list_decided_by_user(self, approver_email: str, outcome: str, skip: int, limit: int,
+                                    cursor: str = None) -> PaginatedResponse[ReleaseResponse]:
+        rows, total, next_cursor = await self.approval_repo.list_decided_by_approver(
+            approver_email, outcome, skip, limit, cursor
+        )
+        data = self._to_responses([(r, app_name or "Unknown") for r, app_name in rows])
+        return PaginatedResponse(data=data, total=total, skip=skip, limit=limit, next_cursor=next_cursor)
@@ -3,6 +3,13 @@ from sqlalchemy.orm import Session
 from src.infrastructure.repositories.audit_log_repository import AuditLogRepository
 from src.application.dtos.audit_log_dtos import AuditLogResponse
 from src.application.dtos.pagination_dto import PaginatedResponse
+from src.infrastructure.repositories.counting import CountMode
+from src.infrastructure.repositories.projection import AUDIT_LOG_LISTING, AUDIT_LOG_SUMMARY, Projection
+
+
+def _projection(include_payload: bool) -> Projection:
+    """Sem payload, a listagem não lê nem desserializa a coluna JSON"""
+    return AUDIT_LOG_LISTING if include_payload else AUDIT_LOG_SUMMARY
 
 
 class AuditLogUseCase:
@@ -16,20 +23,29 @@ class AuditLogUseCase:
         self.session.commit()
         return AuditLogResponse.from_orm(log)
 
-    def list_all(self, skip: int = 0, limit: int = 100) -> PaginatedResponse[AuditLogResponse]:
-        logs = self.repo.list_all(skip, limit)
-        total = self.repo.count_all()
+    def list_all(self, skip: int = 0, limit: int = 100, cursor: str = None,
+                 include_total: bool = True, count_mode: CountMode = CountMode.EXACT,
+                 include_payload: bool = True) -> PaginatedResponse[AuditLogResponse]:
+        logs, next_cursor = self.repo.list_all(skip, limit, cursor, _projection(include_payload))
+        total, total_exact = self.repo.count_all(count_mode) if include_total else (None, False)
         data = [AuditLogResponse.from_orm(log) for log in logs]
-        return PaginatedResponse(data=data, total=total, skip=skip, limit=limit)
+        return PaginatedResponse(data=data, total=total, total_exact=total_exact, skip=skip, limit=limit,
+                                 next_cursor=next_cursor)
 
-    def list_by_entity(self, entity: str, entity_id: UUID, skip: int = 0, limit: int = 100) -> PaginatedResponse[AuditLogResponse]:
-        logs = self.repo.list_by_entity(entity, entity_id, skip, limit)
-        total = self.repo.count_by_entity(entity, entity_id)
+    def list_by_entity(self, entity: str, entity_id: UUID, skip: int = 0, limit: int = 100, cursor: str = None,
+                       include_total: bool = True, count_mode: CountMode = CountMode.EXACT,
+                       include_payload: bool = True) -> PaginatedResponse[AuditLogResponse]:
+        logs, next_cursor = self.repo.list_by_entity(entity, entity_id, skip, limit, cursor, _projection(include_payload))
+        total, total_exact = self.repo.count_by_entity(entity, entity_id, count_mode) if include_total else (None, False)
         data = [AuditLogResponse.from_orm(log) for log in logs]
-        return PaginatedResponse(data=data, total=total, skip=skip, limit=limit)
+        return PaginatedResponse(data=data, total=total, total_exact=total_exact, skip=skip, limit=limit,
+                                 next_cursor=next_cursor)
 
-    def list_by_actor(self, actor: str, skip: int = 0, limit: int = 100) -> PaginatedResponse[AuditLogResponse]:
-        logs = self.repo.list_by_actor(actor, skip, limit)
-        total = self.repo.count_by_actor(actor)
+    def list_by_actor(self, actor: str, skip: int = 0, limit: int = 100, cursor: str = None,
+                      include_total: bool = True, count_mode: CountMode = CountMode.EXACT,
+                      include_payload: bool = True) -> PaginatedResponse[AuditLogResponse]:
+        logs, next_cursor = self.repo.list_by_actor(actor, skip, limit, cursor, _projection(include_payload))
+        total, total_exact = self.repo.count_by_actor(actor, count_mode) if include_total else (None, False)
         data = [AuditLogResponse.from_orm(log) for log in logs]
-        return PaginatedResponse(data=data, total=total, skip=skip, limit=limit)
+        return PaginatedResponse(data=data, total=total, total_exact=total_exact, skip=skip, limit=limit,
+                                 next_cursor=next_cursor)
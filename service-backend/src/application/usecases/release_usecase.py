@@ -1,13 +1,16 @@
 from uuid import UUID
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from src.infrastructure.repositories.release_repository import ReleaseRepository
 from src.infrastructure.repositories.release_event_repository import ReleaseEventRepository
 from src.infrastructure.repositories.approval_repository import ApprovalRepository
 from src.infrastructure.repositories.audit_log_repository import AuditLogRepository
 from src.infrastructure.repositories.application_repository import ApplicationRepository
+from src.infrastructure.cache.application_cache import get_application_cache
 from src.application.dtos.release_dtos import ReleaseRequest, ReleaseResponse
 from src.application.dtos.pagination_dto import PaginatedResponse
-from src.domain.services.policy_service import get_policy_service
+from src.infrastructure.repositories.counting import CountMode
+from src.domain.services.policy_service import get_policy_service, PolicySnapshot
 from src.domain.services.scoring_service import ScoringService
 
 
@@ -18,6 +21,7 @@ class ReleaseUseCase:
         self.approval_repo = ApprovalRepository(session)
         self.audit_repo = AuditLogRepository(session)
         self.app_repo = ApplicationRepository(session)
+        self.app_cache = get_application_cache()
         self.session = session
         self.actor_email = actor_email or "unknown"
 
@@ -29,8 +33,7 @@ class ReleaseUseCase:
             raise ValueError(f"Release {request.version} for env {request.environment} already exists")
         
         # Carregar nome da aplicação
-        application = self.app_repo.get_by_id(app_id)
-        app_name = application.name if application else "Unknown"
+        app_name = self.app_cache.get_name(self.app_repo, app_id)
         
         # Calcular score automaticamente se evidence_url fornecida
         evidence_score = request.evidence_score or 0
@@ -52,7 +55,7 @@ class ReleaseUseCase:
         )
         
         # Log de auditoria
-        self.audit_repo.create(
+        self.audit_repo.append(
             actor=self.actor_email,
             action="CREATE",
             entity="RELEASE",
@@ -73,105 +76,133 @@ class ReleaseUseCase:
         release = self.repo.get_by_id(release_id)
         if not release:
             raise ValueError(f"Release {release_id} not found")
-        return ReleaseResponse.from_orm(release)
+        return self._to_responses([(release, None)])[0]
 
-    def list_by_application(self, app_id: UUID, skip: int = 0, limit: int = 100) -> PaginatedResponse[ReleaseResponse]:
-        releases = self.repo.list_by_application(app_id, skip, limit)
-        total = self.repo.count_by_application(app_id)
-        
-        # Adicionar contagem de aprovações e rejeições
+    def _to_responses(self, rows) -> list:
+        """Monta os DTOs de uma página com as contagens de approvals lidas dos contadores da
+        própria release e os nomes de application ausentes resolvidos em lote pelo cache"""
+        apps = self.app_cache.get_many(
+            self.app_repo, {release.application_id for release, app_name in rows if app_name is None}
+        )
         data = []
-        for release in releases:
-            approvals = self.approval_repo.list_by_release(release.id)
-            approval_count = sum(1 for a in approvals if a.outcome == 'APPROVED')
-            rejection_count = sum(1 for a in approvals if a.outcome == 'REJECTED')
-            data.append(ReleaseResponse.from_orm(release, approval_count=approval_count, rejection_count=rejection_count))
-        
-        return PaginatedResponse(data=data, total=total, skip=skip, limit=limit)
+        for release, app_name in rows:
+            if app_name is None:
+                app = apps.get(release.application_id)
+                app_name = app.name if app else None
+            data.append(ReleaseResponse.from_orm(
+                release, app_name,
+                approval_count=release.approved_count,
+                rejection_count=release.rejected_count
+            ))
+        return data
 
-    def list_by_status(self, status: str, skip: int = 0, limit: int = 100) -> PaginatedResponse[ReleaseResponse]:
-        releases = self.repo.list_by_status(status, skip, limit)
-        total = self.repo.count_by_status(status)
-        data = [ReleaseResponse.from_orm(r) for r in releases]
-        return PaginatedResponse(data=data, total=total, skip=skip, limit=limit)
+    def list_by_application(self, app_id: UUID, skip: int = 0, limit: int = 100, cursor: str = None,
+                            include_total: bool = True, count_mode: CountMode = CountMode.EXACT) -> PaginatedResponse[ReleaseResponse]:
+        releases, next_cursor = self.repo.list_by_application(app_id, skip, limit, cursor)
+        total, total_exact = self.repo.count_by_application(app_id, count_mode) if include_total else (None, False)
+        data = self._to_responses([(r, None) for r in releases])
+        return PaginatedResponse(data=data, total=total, total_exact=total_exact, skip=skip, limit=limit,
+                                 next_cursor=next_cursor)
 
-    def list_all(self, skip: int = 0, limit: int = 100) -> PaginatedResponse[ReleaseResponse]:
-        releases = self.repo.list_all(skip, limit)
-        total = self.repo.count_all()
-        data = [ReleaseResponse.from_orm(r) for r in releases]
-        return PaginatedResponse(data=data, total=total, skip=skip, limit=limit)
+    def list_by_status(self, status: str, skip: int = 0, limit: int = 100, cursor: str = None,
+                       include_total: bool = True, count_mode: CountMode = CountMode.EXACT) -> PaginatedResponse[ReleaseResponse]:
+        releases, next_cursor = self.repo.list_by_status(status, skip, limit, cursor)
+        total, total_exact = self.repo.count_by_status(status, count_mode) if include_total else (None, False)
+        data = self._to_responses([(r, None) for r in releases])
+        return PaginatedResponse(data=data, total=total, total_exact=total_exact, skip=skip, limit=limit,
+                                 next_cursor=next_cursor)
+
+    def list_all(self, skip: int = 0, limit: int = 100, cursor: str = None,
+                 include_total: bool = True, count_mode: CountMode = CountMode.EXACT) -> PaginatedResponse[ReleaseResponse]:
+        releases, next_cursor = self.repo.list_all(skip, limit, cursor)
+        total, total_exact = self.repo.count_all(count_mode) if include_total else (None, False)
+        data = self._to_responses([(r, None) for r in releases])
+        return PaginatedResponse(data=data, total=total, total_exact=total_exact, skip=skip, limit=limit,
+                                 next_cursor=next_cursor)
 
     def list_pending_for_user(self, approver_email: str, skip: int = 0, limit: int = 100) -> PaginatedResponse[ReleaseResponse]:
         """Retorna releases que o usuário ainda NÃO aprovou e NÃO rejeitou (excluindo releases em PROD)"""
-        # Carregar todos os releases para contar
-        all_releases = self.repo.list_all(0, 999999)  # Carregar tudo em memória para contar
-        pending_releases = []
-        
-        for release in all_releases:
-            # Ignorar releases em PROD (não podem ser aprovadas)
-            if release.env == 'PROD':
-                continue
-                
-            approvals = self.approval_repo.list_by_release(release.id)
-            user_approval = next(
-                (a for a in approvals if a.approver_email == approver_email and a.outcome),
-                None
-            )
-            
-            if not user_approval:
-                application = self.app_repo.get_by_id(release.application_id)
-                app_name = application.name if application else "Unknown"
-                pending_releases.append((release, app_name))
-        
-        # Aplicar paginação após filtro
-        total = len(pending_releases)
-        paginated = pending_releases[skip:skip + limit]
-        data = [ReleaseResponse.from_orm(r, app_name) for r, app_name in paginated]
+        rows, total = self.repo.list_pending_for_approver(approver_email, skip, limit)
+        data = self._to_responses([(r, app_name or "Unknown") for r, app_name in rows])
         return PaginatedResponse(data=data, total=total, skip=skip, limit=limit)
 
-    def list_approved_by_user(self, approver_email: str, skip: int = 0, limit: int = 100) -> PaginatedResponse[ReleaseResponse]:
+    def list_approved_by_user(self, approver_email: str, skip: int = 0, limit: int = 100,
+                              cursor: str = None) -> PaginatedResponse[ReleaseResponse]:
         """Retorna releases APROVADOS pelo usuário"""
-        all_releases = self.repo.list_all(0, 999999)
-        approved_releases = []
-        
-        for release in all_releases:
-            approvals = self.approval_repo.list_by_release(release.id)
-            user_approval = next(
-                (a for a in approvals if a.approver_email == approver_email),
-                None
-            )
-            
-            if user_approval and user_approval.outcome == 'APPROVED':
-                application = self.app_repo.get_by_id(release.application_id)
-                app_name = application.name if application else "Unknown"
-                approved_releases.append((release, app_name))
-        
-        total = len(approved_releases)
-        paginated = approved_releases[skip:skip + limit]
-        data = [ReleaseResponse.from_orm(r, app_name) for r, app_name in paginated]
-        return PaginatedResponse(data=data, total=total, skip=skip, limit=limit)
+        return self._list_decided_by_user(approver_email, 'APPROVED', skip, limit, cursor)
 
-    def list_rejected_by_user(self, approver_email: str, skip: int = 0, limit: int = 100) -> PaginatedResponse[ReleaseResponse]:
+    def list_rejected_by_user(self, approver_email: str, skip: int = 0, limit: int = 100,
+                              cursor: str = None) -> PaginatedResponse[ReleaseResponse]:
         """Retorna releases REJEITADOS pelo usuário"""
-        all_releases = self.repo.list_all(0, 999999)
-        rejected_releases = []
-        
-        for release in all_releases:
-            approvals = self.approval_repo.list_by_release(release.id)
-            user_approval = next(
-                (a for a in approvals if a.approver_email == approver_email),
-                None
-            )
-            
-            if user_approval and user_approval.outcome == 'REJECTED':
-                application = self.app_repo.get_by_id(release.application_id)
-                app_name = application.name if application else "Unknown"
-                rejected_releases.append((release, app_name))
-        
-        total = len(rejected_releases)
-        paginated = rejected_releases[skip:skip + limit]
-        data = [ReleaseResponse.from_orm(r, app_name) for r, app_name in paginated]
-        return PaginatedResponse(data=data, total=total, skip=skip, limit=limit)
+        return self._list_decided_by_user(approver_email, 'REJECTED', skip, limit, cursor)
+
+    def _list_decided_by_user(self, approver_email: str, outcome: str, skip: int, limit: int,
+                              cursor: str = None) -> PaginatedResponse[ReleaseResponse]:
+        rows, total, next_cursor = self.approval_repo.list_decided_by_approver(
+            approver_email, outcome, skip, limit, cursor
+        )
+        data = self._to_responses([(r, app_name or "Unknown") for r, app_name in rows])
+        return PaginatedResponse(data=data, total=total, skip=skip, limit=limit, next_cursor=next_cursor)
+
+    # Checklist de pré-lançamento (PRE_PROD → PROD)
+
+    CHECKLIST_TARGET_ENV = "PROD"
+
+    def get_checklist(self, release_id: UUID) -> Optional[Dict]:
+        """Checklist de uma release; None se não existir"""
+        checklists, _ = self.get_checklists([release_id])
+        return checklists[0] if checklists else None
+
+    def get_checklists(self, release_ids: List[UUID]) -> Tuple[List[Dict], List[str]]:
+        """
+        Checklists de várias releases: uma query de releases e uma avaliação
+        de policy (snapshot + freeze) por ambiente alvo.
+
+        Returns:
+            (checklists na ordem pedida, ids não encontrados)
+        """
+        releases = {release.id: release for release in self.repo.list_by_ids(release_ids)}
+        policy_service = get_policy_service()
+        policy = policy_service.snapshot()
+        frozen_by_env: Dict[str, bool] = {}
+
+        checklists, missing = [], []
+        for release_id in dict.fromkeys(release_ids):
+            release = releases.get(release_id)
+            if release is None:
+                missing.append(str(release_id))
+                continue
+            target_env = self.CHECKLIST_TARGET_ENV
+            if target_env not in frozen_by_env:
+                frozen_by_env[target_env] = policy_service.is_frozen_for_env(target_env, policy)
+            checklists.append(self._build_checklist(release, policy, target_env, frozen_by_env[target_env]))
+        return checklists, missing
+
+    @staticmethod
+    def _build_checklist(release, policy: PolicySnapshot, target_env: str, is_frozen: bool) -> Dict:
+        # Contador denormalizado de aprovações (mantido pelo ApprovalUseCase)
+        approved_count = release.approved_count
+        approvals_ok = approved_count >= policy.min_approvals
+        evidence_ok = bool(release.evidence_url)
+        score_ok = release.evidence_score >= policy.min_score
+        freeze_ok = not is_frozen
+
+        return {
+            'releaseId': str(release.id),
+            'approvalsOk': approvals_ok,
+            'evidenceOk': evidence_ok,
+            'scoreOk': score_ok,
+            'freezeOk': freeze_ok,
+            'ready': approvals_ok and evidence_ok and score_ok and freeze_ok,
+            'approvalCount': approved_count,
+            'minApprovals': policy.min_approvals,
+            'evidenceUrl': release.evidence_url or '',
+            'score': release.evidence_score,
+            'minScore': policy.min_score,
+            'isFrozen': is_frozen,
+            'freezeMessage': f"Janela de freeze ativa para {target_env}" if is_frozen else "",
+            'policyVersion': policy.version
+        }
 
     def update_status(self, release_id: UUID, status: str) -> ReleaseResponse:
         release = self.repo.update_status(release_id, status)
@@ -190,8 +221,7 @@ class ReleaseUseCase:
             raise ValueError(f"Conflict: Release was modified (version {release.version_row} != {request.version_row})")
         
         # Carregar nome da aplicação
-        application = self.app_repo.get_by_id(release.application_id)
-        app_name = application.name if application else "Unknown"
+        app_name = self.app_cache.get_name(self.app_repo, release.application_id)
         
         # Calcular score automaticamente se evidence_url fornecida
         evidence_score = request.evidence_score or 0
@@ -215,7 +245,7 @@ class ReleaseUseCase:
         )
         
         # Log de auditoria
-        self.audit_repo.create(
+        self.audit_repo.append(
             actor=self.actor_email,
             action="UPDATE",
             entity="RELEASE",
@@ -243,15 +273,13 @@ class ReleaseUseCase:
         from_env = release.env
         
         # Carregar informações da aplicação
-        application = self.app_repo.get_by_id(release.application_id)
-        app_name = application.name if application else "Unknown"
+        app_name = self.app_cache.get_name(self.app_repo, release.application_id)
         
         # VALIDAR POLICY
         policy_service = get_policy_service()
         
-        # Contar approvals
-        approvals = self.approval_repo.list_by_release(release_id)
-        approval_count = len([a for a in approvals if a.outcome == 'APPROVED'])
+        # Contador denormalizado mantido pelo ApprovalUseCase
+        approval_count = release.approved_count
         
         # Validar promoção com policy
         is_valid, message = policy_service.validate_promotion(
@@ -281,7 +309,7 @@ class ReleaseUseCase:
         )
         
         # Log de auditoria (usando from_env capturado antes da atualização)
-        self.audit_repo.create(
+        self.audit_repo.append(
             actor=self.actor_email,
             action="PROMOTE",
             entity="RELEASE",
@@ -309,8 +337,7 @@ class ReleaseUseCase:
             raise ValueError(f"Release já está rejeitada")
         
         # Carregar informações da aplicação
-        application = self.app_repo.get_by_id(release.application_id)
-        app_name = application.name if application else "Unknown"
+        app_name = self.app_cache.get_name(self.app_repo, release.application_id)
         
         # Atualizar status para REJECTED
         self.repo.update_status(release_id, 'REJECTED')
@@ -325,7 +352,7 @@ class ReleaseUseCase:
         )
         
         # Log de auditoria
-        self.audit_repo.create(
+        self.audit_repo.append(
             actor=self.actor_email,
             action="REJECT_RELEASE",
             entity="RELEASE",
@@ -362,8 +389,7 @@ class ReleaseUseCase:
             raise ValueError(f"Release precisa estar APPROVED para ser implantada")
         
         # Carregar informações da aplicação
-        application = self.app_repo.get_by_id(release.application_id)
-        app_name = application.name if application else "Unknown"
+        app_name = self.app_cache.get_name(self.app_repo, release.application_id)
         
         # Atualizar status para DEPLOYED
         self.repo.update_status(release_id, 'DEPLOYED')
@@ -378,7 +404,7 @@ class ReleaseUseCase:
         )
         
         # Log de auditoria
-        self.audit_repo.create(
+        self.audit_repo.append(
             actor=self.actor_email,
             action="DEPLOY",
             entity="RELEASE",
@@ -1,7 +1,12 @@
 from fastapi import HTTPException, status
-from jose import jwt, JWTError
+import base64
+import hashlib
+import jwt
 import os
-from typing import NamedTuple
+import time
+from typing import Callable, NamedTuple, Optional
+
+from src.core.cache import TTLCache
 
 
 class TokenPayload(NamedTuple):
@@ -13,15 +18,89 @@ JWT_SECRET = os.getenv("JWT_SECRET", "your_jwt_secret_here_change_in_prod")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 
 
+class InvalidTokenError(Exception):
+    """Token com assinatura inválida, expirado ou sem os claims obrigatórios"""
+
+
+class TokenVerifier:
+    """
+    Emissão e verificação dos JWT da API (PyJWT) com chave pré-carregada.
+
+    Claims verificados ficam num cache LRU limitado, indexado pelo SHA-256 do token
+    e válido até o `exp` do token (ou cache_ttl_seconds, o que vier antes): repetições
+    do mesmo token não refazem HMAC nem parsing de JSON.
+    """
+
+    def __init__(self, secret: str, algorithm: str = "HS256", cache_max_entries: int = 10000,
+                 cache_ttl_seconds: float = 300, clock: Callable[[], float] = time.time):
+        self.algorithm = algorithm
+        # Chave preparada uma vez (PyJWK), em vez de a cada decode
+        self._key = jwt.PyJWK.from_dict({
+            "kty": "oct",
+            "alg": algorithm,
+            "k": base64.urlsafe_b64encode(secret.encode()).decode().rstrip("="),
+        })
+        self._signing_key = self._key.key
+        self._cache = TTLCache(max_entries=cache_max_entries, ttl_seconds=cache_ttl_seconds)
+        self._clock = clock
+
+    def issue(self, claims: dict) -> str:
+        return jwt.encode(claims, self._signing_key, algorithm=self.algorithm)
+
+    def verify(self, token: str) -> TokenPayload:
+        digest = hashlib.sha256(token.encode()).digest()
+        cached = self._cache.get(digest)
+        if cached is not None:
+            return cached
+
+        try:
+            claims = jwt.decode(token, self._key, algorithms=[self.algorithm])
+        except jwt.InvalidTokenError as e:
+            raise InvalidTokenError(str(e))
+
+        email, name = claims.get("email"), claims.get("name")
+        if not email or not name:
+            raise InvalidTokenError("Claims inválidos")
+
+        payload = TokenPayload(email=email, name=name)
+        ttl = self._cache.ttl_seconds
+        if claims.get("exp") is not None:
+            ttl = min(ttl, float(claims["exp"]) - self._clock())
+        if ttl > 0:
+            self._cache.set(digest, payload, ttl_seconds=ttl)
+        return payload
+
+    def cache_stats(self) -> dict:
+        return self._cache.stats()
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+
+_token_verifier: Optional[TokenVerifier] = None
+
+
+def get_token_verifier() -> TokenVerifier:
+    """Factory para obter TokenVerifier (singleton por processo)"""
+    global _token_verifier
+    if _token_verifier is None:
+        _token_verifier = TokenVerifier(
+            JWT_SECRET, JWT_ALGORITHM,
+            cache_max_entries=int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "10000")),
+            cache_ttl_seconds=float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300"))
+        )
+    return _token_verifier
+
+
 def extract_user_from_token(authorization: str) -> TokenPayload:
     """Extrai dados do usuário do token JWT"""
-    
+
     if not authorization:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token não fornecido"
         )
-    
+
     try:
         scheme, token = authorization.split()
         if scheme.lower() != "bearer":
@@ -31,18 +110,10 @@ def extract_user_from_token(authorization: str) -> TokenPayload:
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token inválido"
         )
-    
+
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        email = payload.get("email")
-        name = payload.get("name")
-        
-        if not email or not name:
-            raise ValueError("Claims inválidos")
-        
-        return TokenPayload(email=email, name=name)
-    
-    except JWTError:
+        return get_token_verifier().verify(token)
+    except InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token inválido ou expirado"
@@ -1,8 +1,30 @@
 import yaml
 import os
-from datetime import datetime
+import hashlib
+import logging
+import threading
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache
 from pytz import timezone as pytz_timezone
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+MINUTES_PER_DAY = 24 * 60
+
+
+@lru_cache(maxsize=None)
+def _get_timezone(name: str):
+    return pytz_timezone(name)
+
+
+def _minute_of_day(hhmm: str) -> int:
+    hours, minutes = hhmm.split(":")
+    minute = int(hours) * 60 + int(minutes)
+    if not 0 <= minute < MINUTES_PER_DAY:
+        raise ValueError(f"Horário inválido: {hhmm}")
+    return minute
 
 
 class FreezeWindow:
@@ -12,34 +34,114 @@ class FreezeWindow:
         self.start = start  # HH:MM
         self.end = end      # HH:MM
         self.timezone_name = tz
+        # Pré-compilado: minutos do dia (inclusivos) e timezone em cache
+        self.start_minute = _minute_of_day(start)
+        self.end_minute = _minute_of_day(end)
+        self.tz = _get_timezone(tz)
+
+    def contains_minute(self, minute: int) -> bool:
+        if self.start_minute < self.end_minute:
+            # Normal window (e.g., 08:00 - 18:00)
+            return self.start_minute <= minute <= self.end_minute
+        # Wraparound window (e.g., 22:00 - 06:00)
+        return minute >= self.start_minute or minute <= self.end_minute
+
+    def is_frozen_at(self, instant: datetime) -> bool:
+        """Verifica se o instante (aware; naive é tratado como UTC) cai na janela"""
+        local = _to_local(instant, self.tz)
+        return self.contains_minute(local.hour * 60 + local.minute)
 
     def is_frozen_now(self) -> bool:
         """Verifica se está dentro da janela de congelamento agora"""
-        tz = pytz_timezone(self.timezone_name)
-        now = datetime.now(tz)
-        current_time = now.strftime("%H:%M")
-        
-        print(f"[FREEZE DEBUG] Checking {self.env}: current={current_time}, window={self.start}-{self.end}, tz={self.timezone_name}")
-        
-        if self.start < self.end:
-            # Normal window (e.g., 08:00 - 18:00)
-            is_frozen = self.start <= current_time <= self.end
-            print(f"[FREEZE DEBUG] Normal window: {is_frozen}")
-            return is_frozen
-        else:
-            # Wraparound window (e.g., 22:00 - 06:00)
-            is_frozen = current_time >= self.start or current_time <= self.end
-            print(f"[FREEZE DEBUG] Wraparound window: {is_frozen} (>={self.start}: {current_time >= self.start}, <={self.end}: {current_time <= self.end})")
-            return is_frozen
+        current_time = datetime.now(self.tz).strftime("%H:%M")
+        is_frozen = self.contains_minute(_minute_of_day(current_time))
+        logger.debug(
+            "Freeze check %s: current=%s, window=%s-%s, tz=%s, frozen=%s",
+            self.env, current_time, self.start, self.end, self.timezone_name, is_frozen
+        )
+        return is_frozen
 
     def __repr__(self):
         return f"FreezeWindow({self.env} {self.start}-{self.end} {self.timezone_name})"
 
 
+def _to_local(instant: datetime, tz) -> datetime:
+    if instant.tzinfo is None:
+        instant = instant.replace(tzinfo=dt_timezone.utc)
+    return instant.astimezone(tz)
+
+
+def compile_freeze_windows(windows: List[FreezeWindow]) -> Dict[str, List[Tuple[object, bytes]]]:
+    """
+    Pré-compila as janelas em um mapa por ambiente: [(tz, mapa de 1440 minutos)].
+
+    Janelas do mesmo ambiente e timezone são unidas num único mapa, então a
+    consulta custa uma conversão de timezone e um acesso por índice.
+    """
+    masks: Dict[Tuple[str, str], bytearray] = {}
+    zones = {}
+    for window in windows:
+        key = (window.env, window.timezone_name)
+        mask = masks.setdefault(key, bytearray(MINUTES_PER_DAY))
+        zones[key] = window.tz
+        for minute in range(MINUTES_PER_DAY):
+            if window.contains_minute(minute):
+                mask[minute] = 1
+
+    compiled: Dict[str, List[Tuple[object, bytes]]] = {}
+    for (env, tz_name), mask in masks.items():
+        compiled.setdefault(env, []).append((zones[(env, tz_name)], bytes(mask)))
+    return compiled
+
+
+class PolicySnapshot:
+    """
+    Policy compilada e imutável.
+
+    Cada reload gera um snapshot novo que substitui o anterior numa única
+    atribuição; leitores pegam a referência uma vez e nunca veem estado parcial.
+    """
+    __slots__ = (
+        "policy", "version", "min_approvals", "min_score", "global_timezone",
+        "freeze_windows", "frozen_minutes", "_last_check",
+    )
+
+    def __init__(self, policy: Dict, version: str, freeze_windows: List[FreezeWindow]):
+        self.policy = policy
+        self.version = version
+        self.min_approvals = policy.get("minApprovals", 1)
+        self.min_score = policy.get("minScore", 70)
+        self.global_timezone = policy.get("timezone", "America/Sao_Paulo")
+        self.freeze_windows = tuple(freeze_windows)
+        self.frozen_minutes = compile_freeze_windows(self.freeze_windows)
+        # Último resultado por ambiente, válido durante o mesmo minuto UTC
+        self._last_check: Dict[str, Tuple[int, bool]] = {}
+
+    def is_frozen_at(self, env: str, instant: datetime) -> bool:
+        if instant.tzinfo is None:
+            instant = instant.replace(tzinfo=dt_timezone.utc)
+        # Offsets de timezone só mudam em minutos cheios: a conversão (cara no pytz)
+        # é feita uma vez por minuto por ambiente
+        utc_minute = int(instant.timestamp()) // 60
+        last = self._last_check.get(env)
+        if last is not None and last[0] == utc_minute:
+            return last[1]
+
+        frozen = False
+        for tz, mask in self.frozen_minutes.get(env, ()):
+            local = instant.astimezone(tz)
+            if mask[local.hour * 60 + local.minute]:
+                frozen = True
+                break
+        self._last_check[env] = (utc_minute, frozen)
+        return frozen
+
+
 class PolicyService:
     """Service de domínio: Carrega e valida policy.yaml em runtime"""
     
     POLICY_FILE = "policy.yaml"
+    DEFAULT_VERSION = "default"
     
     DEFAULT_POLICY = {
         "minApprovals": 1,
@@ -56,64 +158,133 @@ class PolicyService:
     }
 
     def __init__(self):
-        self.policy = self._load_policy()
-        self.min_approvals = self.policy.get("minApprovals", 1)
-        self.min_score = self.policy.get("minScore", 70)
-        self.global_timezone = self.policy.get("timezone", "America/Sao_Paulo")
-        self.freeze_windows = self._parse_freeze_windows()
-
-    def _load_policy(self) -> Dict:
-        """Carrega policy.yaml se existir, caso contrário usa padrão"""
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+        self._file_signature = self._stat_policy_file()
+        self._snapshot = self._initial_snapshot()
+
+    # Leitura: sempre a partir do snapshot corrente
+
+    def snapshot(self) -> PolicySnapshot:
+        """Snapshot corrente; use-o para ler vários valores de forma consistente"""
+        return self._snapshot
+
+    @property
+    def policy(self) -> Dict:
+        return self._snapshot.policy
+
+    @property
+    def version(self) -> str:
+        return self._snapshot.version
+
+    @property
+    def min_approvals(self) -> int:
+        return self._snapshot.min_approvals
+
+    @property
+    def min_score(self) -> int:
+        return self._snapshot.min_score
+
+    @property
+    def global_timezone(self) -> str:
+        return self._snapshot.global_timezone
+
+    @property
+    def freeze_windows(self) -> Tuple[FreezeWindow, ...]:
+        return self._snapshot.freeze_windows
+
+    @property
+    def frozen_minutes(self) -> Dict[str, List[Tuple[object, bytes]]]:
+        return self._snapshot.frozen_minutes
+
+    # Carregamento
+
+    def _read_policy_file(self) -> Optional[Tuple[Dict, str]]:
+        """Lê e faz parse do policy.yaml: (policy, versão) ou None se não existir"""
+        if not os.path.exists(self.POLICY_FILE):
+            return None
+        with open(self.POLICY_FILE, 'r') as f:
+            content = f.read()
+        loaded = yaml.safe_load(content)
+        if not loaded:
+            return None
+        if not isinstance(loaded, dict):
+            raise ValueError("policy.yaml deve ser um mapeamento")
+        return loaded, hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+    def _initial_snapshot(self) -> PolicySnapshot:
+        """No boot, qualquer problema no arquivo cai para a policy padrão"""
         try:
-            if os.path.exists(self.POLICY_FILE):
-                with open(self.POLICY_FILE, 'r') as f:
-                    loaded = yaml.safe_load(f)
-                return loaded or self.DEFAULT_POLICY
-            else:
-                return self.DEFAULT_POLICY
+            loaded = self._read_policy_file()
         except Exception:
-            return self.DEFAULT_POLICY
+            logger.warning("policy.yaml inválido, usando policy padrão", exc_info=True)
+            loaded = None
+        if loaded is None:
+            return self._default_snapshot()
+        policy, version = loaded
+        return PolicySnapshot(policy, version, self._parse_freeze_windows(policy))
 
-    def _parse_freeze_windows(self) -> List[FreezeWindow]:
+    def _default_snapshot(self) -> PolicySnapshot:
+        policy = self.DEFAULT_POLICY
+        return PolicySnapshot(policy, self.DEFAULT_VERSION, self._parse_freeze_windows(policy))
+
+    def _parse_freeze_windows(self, policy: Dict, strict: bool = False) -> List[FreezeWindow]:
         """Parse freeze windows do policy"""
         windows = []
-        freeze_data = self.policy.get("freezeWindows", [])
+        freeze_data = policy.get("freezeWindows", [])
+        global_timezone = policy.get("timezone", "America/Sao_Paulo")
         
         if not isinstance(freeze_data, list):
+            if strict:
+                raise ValueError("freezeWindows deve ser uma lista")
             return windows
         
         for window in freeze_data:
             try:
-                tz = window.get("timezone", self.global_timezone)
+                tz = window.get("timezone", global_timezone)
                 windows.append(FreezeWindow(
                     env=window.get("env"),
                     start=window.get("start"),
                     end=window.get("end"),
                     tz=tz
                 ))
-            except Exception:
-                pass
+            except Exception as e:
+                if strict:
+                    raise ValueError(f"Freeze window inválida: {window}") from e
+                logger.warning("Freeze window inválida ignorada: %s", window)
         
         return windows
 
+    def _build_snapshot(self, policy: Dict, version: str) -> PolicySnapshot:
+        """Valida a policy por completo antes de compilar (usado no reload)"""
+        for key in ("minApprovals", "minScore"):
+            value = policy.get(key, 0)
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise ValueError(f"{key} deve ser um inteiro >= 0")
+        if not isinstance(policy.get("timezone", "UTC"), str):
+            raise ValueError("timezone deve ser uma string")
+        return PolicySnapshot(policy, version, self._parse_freeze_windows(policy, strict=True))
+
     def get_min_approvals(self) -> int:
         """Retorna minApprovals obrigatório"""
-        return self.min_approvals
+        return self._snapshot.min_approvals
 
     def get_min_score(self) -> int:
         """Retorna minScore obrigatório"""
-        return self.min_score
+        return self._snapshot.min_score
 
     def get_policy(self) -> Dict:
         """Retorna o dicionário da policy completa"""
-        return self.policy
+        return self._snapshot.policy
+
+    def is_frozen_at(self, env: str, instant: datetime, snapshot: Optional[PolicySnapshot] = None) -> bool:
+        """Verifica se o ambiente está em freeze window no instante (O(1), sem I/O)"""
+        return (snapshot or self._snapshot).is_frozen_at(env, instant)
 
-    def is_frozen_for_env(self, env: str) -> bool:
+    def is_frozen_for_env(self, env: str, snapshot: Optional[PolicySnapshot] = None) -> bool:
         """Verifica se ambiente está em freeze window agora"""
-        for window in self.freeze_windows:
-            if window.env == env:
-                return window.is_frozen_now()
-        return False
+        return self.is_frozen_at(env, datetime.now(dt_timezone.utc), snapshot)
 
     def validate_promotion(self, from_env: str, to_env: str, 
                           approval_count: int = 0, 
@@ -125,9 +296,10 @@ class PolicyService:
         Returns:
             (is_valid, message)
         """
+        policy = self._snapshot
         
         # 1. Verificar freeze window
-        if self.is_frozen_for_env(to_env):
+        if self.is_frozen_for_env(to_env, policy):
             return False, f"Ambiente {to_env} está congelado (freeze window ativa)"
         
         # 2. Regras por transição
@@ -136,29 +308,87 @@ class PolicyService:
         
         elif from_env == "PRE_PROD" and to_env == "PROD":
             # Verificar approvals
-            if approval_count < self.min_approvals:
-                return False, f"Requer {self.min_approvals} aprovação(ões), tem {approval_count}"
+            if approval_count < policy.min_approvals:
+                return False, f"Requer {policy.min_approvals} aprovação(ões), tem {approval_count}"
             
             # Verificar evidence URL
             if not evidence_url or evidence_url.strip() == "":
                 return False, "Evidence URL é obrigatória para PROD"
             
             # Verificar score
-            if evidence_score < self.min_score:
-                return False, f"Score mínimo é {self.min_score}, obteve {evidence_score}"
+            if evidence_score < policy.min_score:
+                return False, f"Score mínimo é {policy.min_score}, obteve {evidence_score}"
             
             return True, "Promoção PRE_PROD → PROD validada"
         
         else:
             return True, f"Promoção {from_env} → {to_env} permitida"
 
-    def reload_policy(self):
-        """Recarrega policy do arquivo"""
-        self.policy = self._load_policy()
-        self.min_approvals = self.policy.get("minApprovals", 1)
-        self.min_score = self.policy.get("minScore", 70)
-        self.global_timezone = self.policy.get("timezone", "America/Sao_Paulo")
-        self.freeze_windows = self._parse_freeze_windows()
+    # Reload
+
+    def reload_policy(self) -> bool:
+        """
+        Recarrega policy do arquivo.
+
+        Arquivo removido volta para a policy padrão; arquivo inválido mantém o
+        snapshot atual. Retorna True se um novo snapshot foi publicado.
+        """
+        with self._reload_lock:
+            try:
+                loaded = self._read_policy_file()
+                if loaded is None:
+                    snapshot = self._default_snapshot()
+                else:
+                    snapshot = self._build_snapshot(*loaded)
+            except Exception:
+                logger.warning(
+                    "Reload de policy.yaml rejeitado, mantendo versão %s",
+                    self._snapshot.version, exc_info=True
+                )
+                return False
+            previous = self._snapshot.version
+            self._snapshot = snapshot
+        logger.info("Policy recarregada: %s -> %s", previous, snapshot.version)
+        return True
+
+    def _stat_policy_file(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.POLICY_FILE)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_ino, st.st_size
+
+    def check_for_changes(self) -> bool:
+        """Recarrega se mtime/inode/tamanho do arquivo mudaram desde a última checagem"""
+        signature = self._stat_policy_file()
+        if signature == self._file_signature:
+            return False
+        self._file_signature = signature
+        return self.reload_policy()
+
+    def start_watching(self, interval_seconds: float):
+        """Inicia thread em background que observa o policy.yaml (fora do caminho das requisições)"""
+        if interval_seconds <= 0 or self._watcher is not None:
+            return
+        self._stop_watching.clear()
+
+        def watch():
+            while not self._stop_watching.wait(interval_seconds):
+                try:
+                    self.check_for_changes()
+                except Exception:
+                    logger.exception("Falha ao observar policy.yaml")
+
+        self._watcher = threading.Thread(target=watch, name="policy-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        """Para a thread de observação"""
+        if self._watcher is None:
+            return
+        self._stop_watching.set()
+        self._watcher.join(timeout=5)
+        self._watcher = None
 
 
 _policy_service: Optional[PolicyService] = None
@@ -170,3 +400,15 @@ def get_policy_service() -> PolicyService:
     if _policy_service is None:
         _policy_service = PolicyService()
     return _policy_service
+
+
+def start_policy_watcher():
+    """Startup: observa policy.yaml a cada POLICY_RELOAD_INTERVAL_SECONDS (0 desliga)"""
+    interval = float(os.getenv("POLICY_RELOAD_INTERVAL_SECONDS", "5"))
+    get_policy_service().start_watching(interval)
+
+
+def stop_policy_watcher():
+    """Shutdown: encerra a thread de observação"""
+    if _policy_service is not None:
+        _policy_service.stop_watching()
@@ -1,9 +1,58 @@
 from urllib.parse import urlparse
+from typing import Dict, Iterable, List
 import logging
+import os
+import re
+
+from src.core.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 
+# Pontos por categoria encontrada na URL (em maiúsculas)
+_CATEGORY_POINTS = {
+    "report": 20,     # TEST, REPORT, RESULTS, EVIDENCE
+    "pass": 30,       # PASS
+    "success": 20,    # SUCCESS
+    "extension": 10,  # .PDF, .HTML, .JSON, .XML, .PNG, .JPG
+}
+
+# Token -> categorias. As únicas sobreposições entre categorias diferentes são
+# PASS/RESULTS terminando no "S" inicial de SUCCESS; esses casos têm token próprio
+# para que um único passe sem sobreposição dê o mesmo resultado dos testes `in`.
+_TOKEN_CATEGORIES = {
+    "PASSUCCESS": ("pass", "success"),
+    "RESULTSUCCESS": ("report", "success"),
+    "TEST": ("report",),
+    "REPORT": ("report",),
+    "RESULTS": ("report",),
+    "EVIDENCE": ("report",),
+    "PASS": ("pass",),
+    "SUCCESS": ("success",),
+    ".PDF": ("extension",),
+    ".HTML": ("extension",),
+    ".JSON": ("extension",),
+    ".XML": ("extension",),
+    ".PNG": ("extension",),
+    ".JPG": ("extension",),
+}
+
+# Alternância literal em ordem (tokens compostos primeiro), compilada uma vez
+_KEYWORD_PATTERN = re.compile("|".join(re.escape(token) for token in _TOKEN_CATEGORIES))
+
+# Caminho rápido da validação: "scheme://host..." ASCII, sem colchetes nem \t\r\n,
+# é sempre aceito pelo urlparse com scheme e netloc preenchidos
+_SIMPLE_URL = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://[^/?#]")
+_NOT_SIMPLE_CHARS = re.compile(r"[\[\]\t\r\n]")
+
+
+# Memo de scores por (versão das regras, URL): o score é determinístico
+_score_cache = TTLCache(
+    max_entries=int(os.getenv("SCORE_CACHE_MAX_ENTRIES", "10000")),
+    ttl_seconds=float(os.getenv("SCORE_CACHE_TTL_SECONDS", "3600"))
+)
+
+
 class ScoringService:
     """Service de domínio: Cálculo de score de evidência (0-100)
     
@@ -19,6 +68,8 @@ class ScoringService:
     """
 
     MAX_SCORE = 100
+    # Incrementar ao mudar as regras acima: scores memorizados da versão anterior deixam de valer
+    RULES_VERSION = 1
 
     @staticmethod
     def calculate_score(evidence_url: str) -> int:
@@ -33,60 +84,90 @@ class ScoringService:
         Returns:
             Score entre 0 e 100
         """
-        score = 0
+        key = (ScoringService.RULES_VERSION, evidence_url)
+        cached = _score_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if ScoringService._is_valid_url(evidence_url):
+            final_score = ScoringService._score_valid_url(evidence_url)
+            logger.debug("Score calculado (determinístico): url=%s score=%s", evidence_url, final_score)
+        else:
+            logger.warning("Evidence URL inválida: %s", evidence_url)
+            final_score = 0
+        _score_cache.set(key, final_score)
+        return final_score
 
-        # 1. Valida URL
-        if not ScoringService._is_valid_url(evidence_url):
-            logger.warning(f"Evidence URL inválida: {evidence_url}")
-            return 0
+    @staticmethod
+    def calculate_scores(evidence_urls: Iterable[str]) -> List[int]:
+        """
+        Calcula o score de várias evidências, na mesma ordem da entrada.
+
+        URLs repetidas são pontuadas uma vez; inválidas recebem 0 e são
+        contabilizadas num único log por lote.
+        """
+        version = ScoringService.RULES_VERSION
+        scores: Dict[str, int] = {}
+        results = []
+        invalid = 0
+        for url in evidence_urls:
+            score = scores.get(url)
+            if score is None:
+                key = (version, url)
+                score = _score_cache.get(key)
+                if score is None:
+                    if ScoringService._is_valid_url(url):
+                        score = ScoringService._score_valid_url(url)
+                    else:
+                        score = 0
+                        invalid += 1
+                    _score_cache.set(key, score)
+                scores[url] = score
+            results.append(score)
+
+        if invalid:
+            logger.warning("%d evidence URL(s) inválida(s) no lote", invalid)
+        logger.debug("Scores calculados: %d URLs (%d distintas)", len(results), len(scores))
+        return results
 
-        # Converte para uppercase para busca
+    @staticmethod
+    def cache_stats() -> dict:
+        """Tamanho e hits/misses do memo de scores"""
+        return {**_score_cache.stats(), "rulesVersion": ScoringService.RULES_VERSION}
+
+    @staticmethod
+    def clear_cache() -> None:
+        _score_cache.clear()
+
+    @staticmethod
+    def _score_valid_url(evidence_url: str) -> int:
         url_upper = evidence_url.upper()
-        
-        # 2. URL com HTTPS (segurança): +20 pts
+
+        # URL com HTTPS (segurança): +20 pts; HTTP (menos seguro): +10 pts
         if url_upper.startswith("HTTPS://"):
-            score += 20
-            # logger.debug("URL com HTTPS", score_increment=20)
+            score = 20
         elif url_upper.startswith("HTTP://"):
-            score += 10  # HTTP (menos seguro): +10 pts
-            # logger.debug("URL com HTTP", score_increment=10)
-
-        # 3. Contém padrões de relatório/teste: +20 pts
-        if any(pattern in url_upper for pattern in ["TEST", "REPORT", "RESULTS", "EVIDENCE"]):
-            score += 20
-            # logger.debug("Contém padrão de teste/relatório", score_increment=20)
-
-        # 4. Contém "PASS": +30 pts
-        if "PASS" in url_upper:
-            score += 30
-            # logger.debug("Encontrado PASS na URL", score_increment=30)
-
-        # 5. Contém "SUCCESS": +20 pts
-        if "SUCCESS" in url_upper:
-            score += 20
-            # logger.debug("Encontrado SUCCESS na URL", score_increment=20)
-
-        # 6. Extensão de arquivo válida: +10 pts
-        if any(ext in url_upper for ext in [".PDF", ".HTML", ".JSON", ".XML", ".PNG", ".JPG"]):
-            score += 10
-            # logger.debug("Extensão de arquivo válida", score_increment=10)
-
-        # Limita ao máximo
-        final_score = min(score, ScoringService.MAX_SCORE)
-
-        logger.info(
-            "Score calculado (determinístico)",
-            url=evidence_url,
-            score=final_score,
-            has_pass="PASS" in url_upper,
-            has_success="SUCCESS" in url_upper
-        )
+            score = 10
+        else:
+            score = 0
 
-        return final_score
+        # Padrões de relatório/teste, PASS, SUCCESS e extensão: um passe só
+        found = set()
+        for token in _KEYWORD_PATTERN.findall(url_upper):
+            found.update(_TOKEN_CATEGORIES[token])
+        for category in found:
+            score += _CATEGORY_POINTS[category]
+
+        return min(score, ScoringService.MAX_SCORE)
 
     @staticmethod
     def _is_valid_url(url: str) -> bool:
         """Valida formato básico de URL"""
+        if isinstance(url, str):
+            if ":" not in url:
+                return False
+            if url.isascii() and _SIMPLE_URL.match(url) and not _NOT_SIMPLE_CHARS.search(url):
+                return True
         try:
             result = urlparse(url)
             return all([result.scheme, result.netloc])
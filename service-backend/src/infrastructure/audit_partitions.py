@@ -0,0 +1,316 @@
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional
+
+from sqlalchemy import column, select, table as table_clause, text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "audit_logs"
+# Recebe linhas sem partição mensal; ensure_partitions() as move para o mês certo
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+# Partições mensais: audit_logs_2026_10 cobre [2026-10-01, 2026-11-01)
+_PARTITION_NAME = re.compile(r"^audit_logs_(\d{4})_(\d{2})$")
+ARCHIVE_FORMATS = ("jsonl", "parquet")
+_EXPORT_COLUMNS = ("id", "actor", "action", "entity", "entity_id", "payload", "request_id", "created_at")
+_EXPORT_CHUNK = 5000
+
+
+def month_start(day: date) -> date:
+    return date(day.year, day.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    match = _PARTITION_NAME.match(name)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+class AuditPartition(NamedTuple):
+    name: str
+    month: date
+    attached: bool
+
+
+def partitions_to_archive(partitions: List[AuditPartition], retention_months: int,
+                          today: Optional[date] = None) -> List[AuditPartition]:
+    """Partições cujo mês inteiro é anterior à janela de retenção (mês corrente incluso)"""
+    if retention_months < 1:
+        raise ValueError("retention_months deve ser >= 1")
+    cutoff = add_months(month_start(today or datetime.utcnow().date()), -(retention_months - 1))
+    return sorted((p for p in partitions if p.month < cutoff), key=lambda p: p.month)
+
+
+def _json_default(value):
+    return value.isoformat() if isinstance(value, (datetime, date)) else str(value)
+
+
+def export_rows(session: Session, table: str, path: Path, fmt: str = "jsonl") -> int:
+    """
+    Exporta as linhas de `table` para `path` (JSONL gzip ou Parquet) em blocos, sem
+    carregar a tabela inteira. Escreve em arquivo temporário e renomeia no final.
+    """
+    if fmt not in ARCHIVE_FORMATS:
+        raise ValueError(f"Formato inválido: {fmt} (use {', '.join(ARCHIVE_FORMATS)})")
+    if fmt == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("Exportação parquet requer pyarrow instalado")
+
+    from src.infrastructure.orm.audit_log import AuditLogORM
+    # Mesmos tipos de audit_logs (JSON/UUID convertidos igual em qualquer driver)
+    source = table_clause(table, *(column(name, AuditLogORM.__table__.c[name].type) for name in _EXPORT_COLUMNS))
+    result = session.execute(
+        select(source).order_by(source.c.created_at, source.c.id),
+        execution_options={"stream_results": True}
+    )
+    tmp_path = path.with_name(path.name + ".tmp")
+    count = 0
+    if fmt == "jsonl":
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as out:
+            for chunk in result.mappings().partitions(_EXPORT_CHUNK):
+                for row in chunk:
+                    out.write(json.dumps(dict(row), default=_json_default, ensure_ascii=False))
+                    out.write("\n")
+                count += len(chunk)
+    else:
+        schema = pa.schema([(name, pa.string()) for name in _EXPORT_COLUMNS[:-1]]
+                           + [("created_at", pa.timestamp("us"))])
+        with pq.ParquetWriter(str(tmp_path), schema, compression="zstd") as writer:
+            for chunk in result.mappings().partitions(_EXPORT_CHUNK):
+                columns = {name: [] for name in _EXPORT_COLUMNS}
+                for row in chunk:
+                    for name in _EXPORT_COLUMNS:
+                        value = row[name]
+                        if name == "payload":
+                            value = json.dumps(value, default=_json_default, ensure_ascii=False)
+                        elif name != "created_at" and value is not None:
+                            value = str(value)
+                        columns[name].append(value)
+                writer.write_table(pa.table(columns, schema=schema))
+                count += len(chunk)
+    os.replace(tmp_path, path)
+    return count
+
+
+class AuditPartitionManager:
+    """
+    Gestão das partições mensais de audit_logs (Postgres, RANGE em created_at).
+
+    ensure_partitions() cria o mês corrente e os próximos `months_ahead`, além dos meses
+    de linhas que caíram na partição default, movendo-as para a partição mensal.
+    archive() desanexa partições fora da retenção, exporta para disco e as remove;
+    partições já desanexadas numa execução interrompida são retomadas.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None, months_ahead: int = 3):
+        self.session_factory = session_factory
+        self.months_ahead = months_ahead
+        self._worker: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _session(self) -> Session:
+        if self.session_factory is None:
+            from src.infrastructure.database import SessionLocal
+            self.session_factory = SessionLocal
+        return self.session_factory()
+
+    @staticmethod
+    def is_partitioned(session: Session) -> bool:
+        if session.get_bind().dialect.name != "postgresql":
+            return False
+        return session.execute(text(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :parent AND c.relnamespace = current_schema()::regnamespace"
+        ), {"parent": PARENT_TABLE}).first() is not None
+
+    @staticmethod
+    def list_partitions(session: Session) -> List[AuditPartition]:
+        rows = session.execute(text(
+            "SELECT c.relname, EXISTS ("
+            "  SELECT 1 FROM pg_inherits i JOIN pg_class p ON p.oid = i.inhparent"
+            "  WHERE i.inhrelid = c.oid AND p.relname = :parent"
+            ") FROM pg_class c "
+            "WHERE c.relkind IN ('r', 'p') AND c.relname ~ :pattern "
+            "AND c.relnamespace = current_schema()::regnamespace"
+        ), {"parent": PARENT_TABLE, "pattern": _PARTITION_NAME.pattern}).all()
+        partitions = [AuditPartition(name, partition_month(name), attached) for name, attached in rows]
+        return sorted(partitions, key=lambda p: p.month)
+
+    @staticmethod
+    def has_default_partition(session: Session) -> bool:
+        return session.execute(text(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :parent AND c.relnamespace = current_schema()::regnamespace "
+            "AND pt.partdefid <> 0"
+        ), {"parent": PARENT_TABLE}).first() is not None
+
+    @staticmethod
+    def default_months(session: Session) -> List[date]:
+        """Meses com linhas na partição default"""
+        return session.execute(text(
+            f"SELECT DISTINCT date_trunc('month', created_at)::date FROM {DEFAULT_PARTITION} ORDER BY 1"
+        )).scalars().all()
+
+    def ensure_partitions(self, today: Optional[date] = None) -> List[str]:
+        """
+        Cria as partições do mês corrente até months_ahead meses à frente e as dos meses
+        que tenham linhas na partição default
+        """
+        created = []
+        session = self._session()
+        try:
+            if not self.is_partitioned(session):
+                return created
+            existing = {p.name for p in self.list_partitions(session)}
+            has_default = self.has_default_partition(session)
+            first = month_start(today or datetime.utcnow().date())
+            months = {add_months(first, offset) for offset in range(self.months_ahead + 1)}
+            if has_default:
+                months.update(self.default_months(session))
+            for month in sorted(months):
+                name = partition_name(month)
+                if name in existing:
+                    continue
+                self._create_partition(session, month, has_default)
+                # Uma transação por mês: uma falha não desfaz os meses anteriores
+                session.commit()
+                created.append(name)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        if created:
+            logger.info("Partições de audit_logs criadas: %s", ", ".join(created))
+        return created
+
+    @staticmethod
+    def _create_partition(session: Session, month: date, has_default: bool) -> None:
+        name = partition_name(month)
+        create = (f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} "
+                  f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')")
+        bounds = {"start": month, "end": add_months(month, 1)}
+        in_range = "created_at >= :start AND created_at < :end"
+        stranded = has_default and session.execute(
+            text(f"SELECT count(*) FROM {DEFAULT_PARTITION} WHERE {in_range}"), bounds
+        ).scalar()
+        if not stranded:
+            session.execute(text(create))
+            return
+        # Com linhas do mês na default o CREATE falharia: desanexa a default, cria o mês,
+        # move as linhas e reanexa, tudo na mesma transação
+        columns = ", ".join(_EXPORT_COLUMNS)
+        session.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}"))
+        session.execute(text(create))
+        session.execute(text(
+            f"INSERT INTO {name} ({columns}) SELECT {columns} FROM {DEFAULT_PARTITION} WHERE {in_range}"
+        ), bounds)
+        session.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"), bounds)
+        session.execute(text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"))
+        logger.warning("%d audit logs movidos da partição default para %s", stranded, name)
+
+    def archive(self, retention_months: int, archive_dir: str, fmt: str = "jsonl",
+                today: Optional[date] = None, dry_run: bool = False) -> List[Path]:
+        """
+        Desanexa, exporta e remove as partições anteriores à retenção.
+
+        Returns:
+            Arquivos gerados (ou que seriam gerados, com dry_run)
+        """
+        target_dir = Path(archive_dir)
+        extension = "jsonl.gz" if fmt == "jsonl" else "parquet"
+        files = []
+        session = self._session()
+        try:
+            if not self.is_partitioned(session):
+                raise ValueError("audit_logs não é uma tabela particionada")
+            for partition in partitions_to_archive(self.list_partitions(session), retention_months, today):
+                path = target_dir / f"{partition.name}.{extension}"
+                files.append(path)
+                if dry_run:
+                    continue
+                target_dir.mkdir(parents=True, exist_ok=True)
+                if partition.attached:
+                    # Desanexar primeiro: as consultas deixam de ver a partição antes da exportação
+                    session.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition.name}"))
+                    session.commit()
+                count = export_rows(session, partition.name, path, fmt)
+                session.execute(text(f"DROP TABLE {partition.name}"))
+                session.commit()
+                logger.info("Partição %s arquivada em %s (%d registros)", partition.name, path, count)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        return files
+
+    # Manutenção em background
+
+    def start(self, interval_seconds: float):
+        if interval_seconds <= 0 or self._worker is not None:
+            return
+        self._stop.clear()
+
+        def run():
+            while True:
+                try:
+                    self.ensure_partitions()
+                except Exception:
+                    logger.exception("Falha ao criar partições de audit_logs")
+                if self._stop.wait(interval_seconds):
+                    break
+
+        self._worker = threading.Thread(target=run, name="audit-partitions", daemon=True)
+        self._worker.start()
+
+    def stop(self):
+        if self._worker is None:
+            return
+        self._stop.set()
+        self._worker.join(timeout=5)
+        self._worker = None
+
+
+_partition_manager: Optional[AuditPartitionManager] = None
+
+
+def get_audit_partition_manager() -> AuditPartitionManager:
+    """Factory para obter AuditPartitionManager (singleton por processo)"""
+    global _partition_manager
+    if _partition_manager is None:
+        _partition_manager = AuditPartitionManager(
+            months_ahead=int(os.getenv("AUDIT_PARTITIONS_AHEAD", "3"))
+        )
+    return _partition_manager
+
+
+def start_audit_partition_maintenance():
+    """Startup: garante partições futuras a cada AUDIT_PARTITION_CHECK_INTERVAL_SECONDS (0 desliga)"""
+    get_audit_partition_manager().start(
+        float(os.getenv("AUDIT_PARTITION_CHECK_INTERVAL_SECONDS", "21600"))
+    )
+
+
+def stop_audit_partition_maintenance():
+    """Shutdown: encerra a thread de manutenção"""
+    if _partition_manager is not None:
+        _partition_manager.stop()
@@ -0,0 +1,260 @@
+import logging
+import os
+import queue
+import threading
+import uuid
+from datetime import datetime
+from typing import Callable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.infrastructure.orm.audit_log_outbox import AuditLogOutboxORM
+from src.infrastructure.repositories.audit_log_repository import AuditLogRepository
+
+logger = logging.getLogger(__name__)
+
+SYNC = "sync"
+BUFFERED = "buffered"
+OUTBOX = "outbox"
+AUDIT_WRITER_MODES = (SYNC, BUFFERED, OUTBOX)
+
+# Chave em Session.info com os audit logs pendentes da transação (modo buffered)
+_PENDING_KEY = "pending_audit_logs"
+
+
+def _row(actor: str, action: str, entity: str, entity_id: UUID, payload: Optional[dict],
+         request_id: Optional[str]) -> dict:
+    # id e created_at definidos no momento da operação, não no momento da escrita
+    return {
+        "id": uuid.uuid4(),
+        "actor": actor,
+        "action": action,
+        "entity": entity,
+        "entity_id": str(entity_id),
+        "payload": payload or {},
+        "request_id": request_id,
+        "created_at": datetime.utcnow(),
+    }
+
+
+class AuditWriter:
+    """
+    Escrita de audit logs fora do caminho crítico das operações.
+
+    Modos (AUDIT_WRITER_MODE):
+    - sync: INSERT + flush em audit_logs na transação da operação (comportamento original)
+    - buffered: registros guardados na sessão e, após o commit, enfileirados para uma
+      thread que grava em lotes. Rollback descarta. Um lote que falha (failover, lock
+      timeout...) é retentado nas rodadas seguintes; após max_retries falhas seguidas é
+      descartado com log ERROR. Registros em fila também se perdem se o processo morrer.
+      Com a fila cheia (gravação falhando, thread parada ou inexistente em scripts), o
+      commit espera até put_timeout e então grava o excedente na própria requisição
+    - outbox: INSERT em audit_log_outbox (sem índices secundários, sem flush extra) na
+      mesma transação; uma thread move os registros para audit_logs em lotes. Durável
+    """
+
+    def __init__(self, mode: str = SYNC, session_factory: Optional[Callable[[], Session]] = None,
+                 batch_size: int = 500, flush_interval: float = 1.0, buffer_max: int = 10000,
+                 max_retries: int = 5, put_timeout: float = 1.0):
+        if mode not in AUDIT_WRITER_MODES:
+            raise ValueError(f"AUDIT_WRITER_MODE inválido: {mode} (use {', '.join(AUDIT_WRITER_MODES)})")
+        self.mode = mode
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.put_timeout = put_timeout
+        self._queue: "queue.Queue[dict]" = queue.Queue(maxsize=buffer_max)
+        self._worker: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._written = 0
+        self._failed = 0
+        # Lote do buffered que falhou e será retentado antes de novos registros da fila
+        self._retry_rows: List[dict] = []
+        self._retry_attempts = 0
+        # Referências fixas: event.remove precisa do mesmo objeto registrado
+        self._listeners = (("after_commit", self._on_commit), ("after_transaction_end", self._on_transaction_end))
+        if mode == BUFFERED:
+            for name, fn in self._listeners:
+                event.listen(Session, name, fn)
+
+    def write(self, session: Session, actor: str, action: str, entity: str, entity_id: UUID,
+              payload: dict = None, request_id: str = None) -> None:
+        if self.mode == SYNC:
+            AuditLogRepository(session).create(actor, action, entity, entity_id, payload, request_id)
+            return
+        row = _row(actor, action, entity, entity_id, payload, request_id)
+        if self.mode == OUTBOX:
+            row["audit_id"] = row.pop("id")
+            session.add(AuditLogOutboxORM(**row))
+        else:
+            if not session.in_transaction():
+                # Garante o after_transaction_end que descarta pendentes em rollback
+                session.begin()
+            session.info.setdefault(_PENDING_KEY, []).append(row)
+
+    # Modo buffered: só enfileira o que foi de fato commitado
+
+    def _on_commit(self, session: Session) -> None:
+        rows = session.info.pop(_PENDING_KEY, [])
+        for index, row in enumerate(rows):
+            try:
+                # Fila cheia segura a requisição por até put_timeout (backpressure), nunca indefinidamente
+                self._queue.put(row, timeout=self.put_timeout)
+            except queue.Full:
+                self._write_overflow(session, rows[index:])
+                return
+
+    def _write_overflow(self, session: Session, rows: List[dict]) -> None:
+        """Grava na requisição o que não coube na fila, em sessão própria no mesmo bind"""
+        logger.warning("Fila do AuditWriter cheia; gravando %d audit logs na requisição", len(rows))
+        direct = Session(bind=session.get_bind())
+        try:
+            AuditLogRepository(direct).insert_many(rows)
+            direct.commit()
+            self._written += len(rows)
+        except Exception:
+            direct.rollback()
+            self._failed += len(rows)
+            logger.exception("Falha ao gravar %d audit logs com a fila do AuditWriter cheia", len(rows))
+        finally:
+            direct.close()
+
+    @staticmethod
+    def _on_transaction_end(session: Session, transaction) -> None:
+        # Fim da transação raiz sem commit (rollback/close): descarta os pendentes
+        if transaction.parent is None:
+            session.info.pop(_PENDING_KEY, None)
+
+    # Escrita em lotes
+
+    def flush(self) -> int:
+        """Grava o que estiver pendente (fila do buffered ou outbox); retorna a quantidade"""
+        total = 0
+        while True:
+            count = self._flush_batch()
+            total += count
+            if count < self.batch_size:
+                return total
+
+    def _flush_batch(self) -> int:
+        if self.mode == BUFFERED:
+            rows, self._retry_rows = self._retry_rows or self._drain(self.batch_size), []
+            if not rows:
+                return 0
+            if self._run(lambda repo: repo.insert_many(rows), len(rows)) is None:
+                self._retry_later(rows)
+                return 0
+            self._retry_attempts = 0
+            return len(rows)
+        if self.mode == OUTBOX:
+            # Em falha os registros continuam no outbox para a próxima rodada
+            return self._run(lambda repo: repo.relay_outbox(self.batch_size)) or 0
+        return 0
+
+    def _retry_later(self, rows: List[dict]) -> None:
+        self._retry_attempts += 1
+        if self._retry_attempts <= self.max_retries:
+            self._retry_rows = rows
+            return
+        self._retry_attempts = 0
+        self._failed += len(rows)
+        logger.error("%d audit logs descartados após %d tentativas de gravação", len(rows), self.max_retries + 1)
+
+    def _drain(self, limit: int) -> List[dict]:
+        rows = []
+        while len(rows) < limit:
+            try:
+                rows.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return rows
+
+    def _run(self, operation, expected: int = 0) -> Optional[int]:
+        """Executa a operação em uma sessão própria; retorna None se falhar"""
+        if self.session_factory is None:
+            from src.infrastructure.database import SessionLocal
+            self.session_factory = SessionLocal
+        session = self.session_factory()
+        try:
+            count = operation(AuditLogRepository(session))
+            session.commit()
+        except Exception:
+            session.rollback()
+            logger.exception("Falha ao gravar lote de audit logs (%s)", self.mode)
+            return None
+        finally:
+            session.close()
+        count = expected if count is None else count
+        self._written += count
+        return count
+
+    def start(self) -> None:
+        if self.mode == SYNC or self._worker is not None:
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(self.flush_interval):
+                self.flush()
+            self.flush()
+
+        self._worker = threading.Thread(target=run, name=f"audit-writer-{self.mode}", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        if self._worker is None:
+            return
+        self._stop.set()
+        self._worker.join(timeout=30)
+        self._worker = None
+        lost = len(self._retry_rows) + self._queue.qsize()
+        if self.mode == BUFFERED and lost:
+            logger.error("%d audit logs não gravados no encerramento do AuditWriter", lost)
+
+    def close(self) -> None:
+        """Para a thread e remove os listeners de sessão"""
+        self.stop()
+        if self.mode == BUFFERED:
+            for name, fn in self._listeners:
+                event.remove(Session, name, fn)
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "queued": self._queue.qsize(),
+            "retrying": len(self._retry_rows),
+            "written": self._written,
+            "failed": self._failed,
+        }
+
+
+_audit_writer: Optional[AuditWriter] = None
+
+
+def get_audit_writer() -> AuditWriter:
+    """Factory para obter AuditWriter (singleton por processo)"""
+    global _audit_writer
+    if _audit_writer is None:
+        _audit_writer = AuditWriter(
+            mode=os.getenv("AUDIT_WRITER_MODE", SYNC).lower(),
+            batch_size=int(os.getenv("AUDIT_WRITER_BATCH_SIZE", "500")),
+            flush_interval=float(os.getenv("AUDIT_WRITER_FLUSH_INTERVAL_SECONDS", "1")),
+            buffer_max=int(os.getenv("AUDIT_WRITER_BUFFER_MAX", "10000")),
+            max_retries=int(os.getenv("AUDIT_WRITER_MAX_RETRIES", "5")),
+            put_timeout=float(os.getenv("AUDIT_WRITER_PUT_TIMEOUT_SECONDS", "1"))
+        )
+    return _audit_writer
+
+
+def start_audit_writer():
+    """Startup: inicia a thread de escrita em lotes (modos buffered e outbox)"""
+    get_audit_writer().start()
+
+
+def stop_audit_writer():
+    """Shutdown: grava o que estiver pendente e encerra a thread"""
+    if _audit_writer is not None:
+        _audit_writer.stop()
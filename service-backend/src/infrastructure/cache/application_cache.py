@@ -0,0 +1,60 @@
+import os
+from typing import Dict, Iterable, NamedTuple, Optional
+from uuid import UUID
+
+from src.core.cache import TTLCache
+
+
+class ApplicationSummary(NamedTuple):
+    id: UUID
+    name: str
+    owner_team: Optional[str]
+
+
+class ApplicationCache:
+    """Cache local (TTL + LRU) dos metadados de applications usados para enriquecer DTOs e audit logs"""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300.0):
+        self._cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    def get(self, repo, app_id: UUID) -> Optional[ApplicationSummary]:
+        return self.get_many(repo, [app_id]).get(app_id)
+
+    def get_name(self, repo, app_id: UUID, default: str = "Unknown") -> str:
+        summary = self.get(repo, app_id)
+        return summary.name if summary else default
+
+    def get_many(self, repo, app_ids: Iterable[UUID]) -> Dict[UUID, ApplicationSummary]:
+        """Resolve vários ids; os ausentes do cache são carregados com uma única query"""
+        app_ids = {app_id for app_id in app_ids if app_id is not None}
+        found = self._cache.get_many(app_ids)
+        missing = app_ids - found.keys()
+        if missing:
+            for app in repo.list_by_ids(missing):
+                summary = ApplicationSummary(id=app.id, name=app.name, owner_team=app.owner_team)
+                self._cache.set(app.id, summary)
+                found[app.id] = summary
+        return found
+
+    def invalidate(self, app_id: UUID) -> None:
+        self._cache.delete(app_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+_application_cache: Optional[ApplicationCache] = None
+
+
+def get_application_cache() -> ApplicationCache:
+    """Factory para obter ApplicationCache (singleton por processo)"""
+    global _application_cache
+    if _application_cache is None:
+        _application_cache = ApplicationCache(
+            max_entries=int(os.getenv("APP_CACHE_MAX_ENTRIES", "1024")),
+            ttl_seconds=float(os.getenv("APP_CACHE_TTL_SECONDS", "300"))
+        )
+    return _application_cache
@@ -0,0 +1,100 @@
+import os
+from typing import Dict, Iterable, NamedTuple, Optional
+from uuid import UUID
+
+from src.core.cache import TTLCache
+from src.domain.entities.user import UserRole
+
+
+class UserSummary(NamedTuple):
+    id: UUID
+    email: str
+    role: UserRole
+
+
+# Marcador de email inexistente (cache negativo)
+_UNKNOWN = object()
+
+
+class UserCache:
+    """
+    Cache local (TTL + LRU) de id/role por email, usado pelo /auth/me que o gateway
+    chama a cada requisição. Emails inexistentes também ficam em cache, com TTL
+    menor. Mudanças de role devem chamar invalidate(); entre processos, o TTL
+    limita o tempo de role desatualizada.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 60.0, negative_ttl_seconds: float = 10.0):
+        self._cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.negative_ttl_seconds = negative_ttl_seconds
+
+    def _lookup(self, emails: Iterable[str]):
+        emails = {email for email in emails if email}
+        cached = self._cache.get_many(emails)
+        found = {email: value for email, value in cached.items() if value is not _UNKNOWN}
+        missing = emails - cached.keys()
+        return found, missing
+
+    def _store(self, missing: set, users, found: Dict[str, Optional[UserSummary]]):
+        for user in users:
+            summary = UserSummary(id=user.id, email=user.email, role=user.role)
+            self._cache.set(user.email, summary)
+            found[user.email] = summary
+        for email in missing - found.keys():
+            self._cache.set(email, _UNKNOWN, ttl_seconds=self.negative_ttl_seconds)
+        return found
+
+    def get_many(self, repo, emails: Iterable[str]) -> Dict[str, UserSummary]:
+        """Resolve vários emails; os ausentes do cache são carregados com uma única query"""
+        found, missing = self._lookup(emails)
+        if missing:
+            self._store(missing, repo.list_by_emails(missing), found)
+        return found
+
+    async def get_many_async(self, repo, emails: Iterable[str]) -> Dict[str, UserSummary]:
+        """get_many com AsyncUserRepository"""
+        found, missing = self._lookup(emails)
+        if missing:
+            self._store(missing, await repo.list_by_emails(missing), found)
+        return found
+
+    def get(self, repo, email: str) -> Optional[UserSummary]:
+        return self.get_many(repo, [email]).get(email)
+
+    async def get_async(self, repo, email: str) -> Optional[UserSummary]:
+        return (await self.get_many_async(repo, [email])).get(email)
+
+    def get_roles(self, repo, emails: Iterable[str]) -> Dict[str, Optional[UserRole]]:
+        """Role por email (None para emails inexistentes)"""
+        emails = list(emails)
+        found = self.get_many(repo, emails)
+        return {email: found[email].role if email in found else None for email in emails}
+
+    async def get_roles_async(self, repo, emails: Iterable[str]) -> Dict[str, Optional[UserRole]]:
+        emails = list(emails)
+        found = await self.get_many_async(repo, emails)
+        return {email: found[email].role if email in found else None for email in emails}
+
+    def invalidate(self, email: str) -> None:
+        self._cache.delete(email)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+_user_cache: Optional[UserCache] = None
+
+
+def get_user_cache() -> UserCache:
+    """Factory para obter UserCache (singleton por processo)"""
+    global _user_cache
+    if _user_cache is None:
+        _user_cache = UserCache(
+            max_entries=int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000")),
+            ttl_seconds=float(os.getenv("USER_CACHE_TTL_SECONDS", "60")),
+            negative_ttl_seconds=float(os.getenv("USER_CACHE_NEGATIVE_TTL_SECONDS", "10"))
+        )
+    return _user_cache
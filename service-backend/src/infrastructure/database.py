@@ -1,39 +1,131 @@
+from fastapi import Request
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 import os
 from dotenv import load_dotenv
+from src.infrastructure.read_routing import must_read_primary, track_writes
+from src.infrastructure.pool_metrics import (
+    InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool, instrument_engine
+)
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "10"))
+DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "0"))
+DATABASE_POOL_TIMEOUT = float(os.getenv("DATABASE_POOL_TIMEOUT", "30"))
+DATABASE_POOL_RECYCLE = int(os.getenv("DATABASE_POOL_RECYCLE", "-1"))
+DATABASE_POOL_PRE_PING = os.getenv("DATABASE_POOL_PRE_PING", "false").lower() in ("1", "true", "yes")
+# Driver async (asyncpg); por padrão derivado de DATABASE_URL
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+# Réplica de leitura opcional; sem ela as leituras usam o primário
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+ASYNC_DATABASE_READ_URL = os.getenv("ASYNC_DATABASE_READ_URL")
+
+
+def _engine_options(poolclass) -> dict:
+    return {
+        "poolclass": poolclass,
+        "pool_size": DATABASE_POOL_SIZE,
+        "max_overflow": DATABASE_MAX_OVERFLOW,
+        "pool_timeout": DATABASE_POOL_TIMEOUT,
+        "pool_recycle": DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": DATABASE_POOL_PRE_PING,
+        "echo": os.getenv("ENVIRONMENT") == "development",
+    }
+
 
 # Create engine
-engine = create_engine(
-    DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=DATABASE_POOL_SIZE,
-    max_overflow=0,
-    echo=os.getenv("ENVIRONMENT") == "development"
-)
+engine = create_engine(DATABASE_URL, **_engine_options(InstrumentedQueuePool))
+instrument_engine(engine, "primary")
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+read_engine = engine
+if DATABASE_READ_URL:
+    read_engine = create_engine(DATABASE_READ_URL, **_engine_options(InstrumentedQueuePool))
+    instrument_engine(read_engine, "read")
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
 # Base class for models
 Base = declarative_base()
 
 
-def get_db():
+def get_db(request: Request):
     """Dependency para injetar session no FastAPI"""
     db = SessionLocal()
+    track_writes(db, request)
     try:
         yield db
     finally:
         db.close()
 
 
+def get_read_db(request: Request):
+    """Dependency para rotas somente leitura: réplica, ou primário logo após uma escrita do cliente"""
+    db = SessionLocal() if must_read_primary(request) else ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _async_url(url: str) -> str:
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+# Engines async criadas sob demanda (o driver asyncpg só é exigido por quem usa o stack async)
+_async_engines = {}
+_async_sessionmakers = {}
+
+
+def _async_database_url(read: bool) -> str:
+    if read and (ASYNC_DATABASE_READ_URL or DATABASE_READ_URL):
+        return ASYNC_DATABASE_READ_URL or _async_url(DATABASE_READ_URL)
+    return ASYNC_DATABASE_URL or _async_url(DATABASE_URL)
+
+
+def get_async_engine(read: bool = False):
+    url = _async_database_url(read)
+    if url not in _async_engines:
+        _async_engines[url] = create_async_engine(url, **_engine_options(InstrumentedAsyncAdaptedQueuePool))
+        is_replica = read and url != _async_database_url(read=False)
+        instrument_engine(_async_engines[url].sync_engine, "async-read" if is_replica else "async")
+    return _async_engines[url]
+
+
+def get_async_sessionmaker(read: bool = False):
+    engine = get_async_engine(read)
+    if engine not in _async_sessionmakers:
+        _async_sessionmakers[engine] = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    return _async_sessionmakers[engine]
+
+
+async def get_async_db(request: Request):
+    """Dependency para injetar AsyncSession no FastAPI"""
+    async with get_async_sessionmaker()() as db:
+        track_writes(db.sync_session, request)
+        yield db
+
+
+async def get_async_read_db(request: Request):
+    """Equivalente async de get_read_db"""
+    async with get_async_sessionmaker(read=not must_read_primary(request))() as db:
+        yield db
+
+
+async def dispose_async_engine():
+    for engine in list(_async_engines.values()):
+        await engine.dispose()
+    _async_engines.clear()
+    _async_sessionmakers.clear()
+
+
 def create_tables():
     """Cria todas as tabelas"""
     Base.metadata.create_all(bind=engine)
@@ -0,0 +1,238 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, NamedTuple, Optional, Union
+
+from sqlalchemy.orm import Session
+
+from src.core.cache import TTLCache
+from src.infrastructure.orm.idempotency_key import IdempotencyKey
+from src.infrastructure.repositories.idempotency_key_repository import IdempotencyKeyRepository
+
+logger = logging.getLogger(__name__)
+
+
+class StoredResponse(NamedTuple):
+    status_code: int
+    body: dict
+
+
+class Claim(NamedTuple):
+    """Reserva feita por begin(); claimed_at identifica o dono em complete()/release()"""
+    key: str
+    claimed_at: datetime
+    request_hash: Optional[str] = None
+
+
+class IdempotencyConflictError(Exception):
+    """A chave está em uso por outra requisição (em andamento ou para outra rota)"""
+
+
+class IdempotencyKeyReusedError(Exception):
+    """A chave já foi usada com outro corpo de requisição"""
+
+
+class IdempotencyStore:
+    """
+    Store de idempotência em camadas: cache LRU/TTL do processo na frente da
+    tabela idempotency_keys.
+
+    Fluxo: begin() reserva a chave (INSERT ... ON CONFLICT) ou devolve a resposta
+    já gravada; complete() grava a resposta; release() libera a reserva quando a
+    requisição falha. complete()/release() só alteram a reserva do próprio Claim:
+    se ela expirou (lock_ttl) e foi assumida por outra requisição, nada muda.
+    Só respostas finais vão para o cache local.
+
+    Usa sessões próprias (session_factory): os registros são confirmados fora da
+    transação da requisição.
+    """
+
+    def __init__(self, ttl: timedelta = timedelta(hours=24), lock_ttl: timedelta = timedelta(seconds=60),
+                 cache_max_entries: int = 10000, session_factory: Optional[Callable[[], Session]] = None):
+        self.session_factory = session_factory
+        self.ttl = ttl
+        # Reserva de uma requisição que morreu antes do complete() pode ser assumida após lock_ttl
+        self.lock_ttl = lock_ttl
+        self._cache = TTLCache(max_entries=cache_max_entries, ttl_seconds=ttl.total_seconds())
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_sweeping = threading.Event()
+
+    @staticmethod
+    def request_hash(body: bytes) -> str:
+        """SHA-256 do corpo; uma repetição com outro corpo não recebe a resposta gravada"""
+        return hashlib.sha256(body).hexdigest()
+
+    @staticmethod
+    def scoped_key(actor: str, method: str, path: str, client_key: str) -> str:
+        """Chave armazenada: Idempotency-Key do cliente escopada por ator, método e rota"""
+        return hashlib.sha256(f"{actor}\n{method}\n{path}\n{client_key}".encode()).hexdigest()
+
+    @contextmanager
+    def _session(self):
+        if self.session_factory is None:
+            from src.infrastructure.database import SessionLocal
+            self.session_factory = SessionLocal
+        session = self.session_factory()
+        try:
+            yield session
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def begin(self, key: str, method: str, path: str, request_hash: Optional[str] = None) -> Union[Claim, StoredResponse]:
+        """
+        Reserva a chave para esta requisição.
+
+        Returns:
+            Claim se a reserva foi feita (executar a requisição), ou a resposta gravada
+        Raises:
+            IdempotencyConflictError se a chave está em andamento ou pertence a outra rota
+            IdempotencyKeyReusedError se a resposta gravada é de outro corpo de requisição
+        """
+        cached = self._cache.get(key)
+        if cached is not None:
+            return self._replay(cached, method, path, request_hash)
+
+        with self._session() as session:
+            return self._begin(session, key, method, path, request_hash)
+
+    def _begin(self, session: Session, key: str, method: str, path: str,
+               request_hash: Optional[str]) -> Union[Claim, StoredResponse]:
+        repo = IdempotencyKeyRepository(session)
+        claimed_at = repo.claim(key, method, path, datetime.utcnow() + self.lock_ttl, request_hash)
+        session.commit()
+        if claimed_at is not None:
+            return Claim(key, claimed_at, request_hash)
+
+        record = repo.get_by_key(key)
+        if record is None:
+            # Expirou entre o claim e a leitura; tenta reservar de novo
+            claimed_at = repo.claim(key, method, path, datetime.utcnow() + self.lock_ttl, request_hash)
+            session.commit()
+            if claimed_at is not None:
+                return Claim(key, claimed_at, request_hash)
+            record = repo.get_by_key(key)
+        if record is None or record.status_code == IdempotencyKey.IN_PROGRESS:
+            raise IdempotencyConflictError(f"Requisição com Idempotency-Key {key} em andamento")
+
+        entry = (record.request_method, record.request_path, record.request_hash,
+                 StoredResponse(int(record.status_code), json.loads(record.response_body)))
+        self._remember(key, entry, record.expires_at)
+        return self._replay(entry, method, path, request_hash)
+
+    def complete(self, claim: Claim, method: str, path: str, status_code: int, body: dict) -> bool:
+        """Grava a resposta final (tabela + cache local); False se a reserva foi perdida"""
+        expires_at = datetime.utcnow() + self.ttl
+        with self._session() as session:
+            completed = IdempotencyKeyRepository(session).complete(
+                claim.key, claim.claimed_at, body, str(status_code), expires_at
+            )
+            session.commit()
+        if not completed:
+            logger.warning("Reserva idempotente de %s %s expirou antes do fim da requisição; resposta não gravada",
+                           method, path)
+            return False
+        self._remember(claim.key, (method, path, claim.request_hash, StoredResponse(status_code, body)), expires_at)
+        return True
+
+    def release(self, claim: Claim) -> bool:
+        """Libera a reserva de uma requisição que falhou, permitindo nova tentativa"""
+        with self._session() as session:
+            released = IdempotencyKeyRepository(session).delete(claim.key, claim.claimed_at)
+            session.commit()
+        if not released:
+            logger.warning("Reserva idempotente %s expirou antes da liberação; mantida para o novo dono", claim.key)
+        return released
+
+    def _remember(self, key: str, entry: tuple, expires_at: datetime) -> None:
+        remaining = (expires_at - datetime.utcnow()).total_seconds()
+        if remaining > 0:
+            self._cache.set(key, entry, ttl_seconds=remaining)
+
+    @staticmethod
+    def _replay(entry: tuple, method: str, path: str, request_hash: Optional[str]) -> StoredResponse:
+        stored_method, stored_path, stored_hash, response = entry
+        if (stored_method, stored_path) != (method, path):
+            raise IdempotencyConflictError(
+                f"Idempotency-Key já usada em {stored_method} {stored_path}"
+            )
+        if stored_hash and request_hash and stored_hash != request_hash:
+            raise IdempotencyKeyReusedError("Idempotency-Key já usada com outro corpo de requisição")
+        return response
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+    # Limpeza em background
+
+    def sweep(self, batch_size: int = 1000) -> int:
+        """Remove registros expirados em lotes, um commit por lote"""
+        removed = 0
+        with self._session() as session:
+            repo = IdempotencyKeyRepository(session)
+            while True:
+                count = repo.delete_expired_batch(batch_size)
+                session.commit()
+                removed += count
+                if count < batch_size:
+                    break
+        if removed:
+            logger.info("Idempotency keys expiradas removidas: %d", removed)
+        return removed
+
+    def start_sweeper(self, interval_seconds: float, batch_size: int = 1000):
+        if interval_seconds <= 0 or self._sweeper is not None:
+            return
+        self._stop_sweeping.clear()
+
+        def run():
+            while not self._stop_sweeping.wait(interval_seconds):
+                try:
+                    self.sweep(batch_size)
+                except Exception:
+                    logger.exception("Falha na limpeza de idempotency keys")
+
+        self._sweeper = threading.Thread(target=run, name="idempotency-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self):
+        if self._sweeper is None:
+            return
+        self._stop_sweeping.set()
+        self._sweeper.join(timeout=5)
+        self._sweeper = None
+
+
+_idempotency_store: Optional[IdempotencyStore] = None
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """Factory para obter IdempotencyStore (singleton por processo)"""
+    global _idempotency_store
+    if _idempotency_store is None:
+        _idempotency_store = IdempotencyStore(
+            ttl=timedelta(hours=float(os.getenv("IDEMPOTENCY_TTL_HOURS", "24"))),
+            lock_ttl=timedelta(seconds=float(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "60"))),
+            cache_max_entries=int(os.getenv("IDEMPOTENCY_CACHE_MAX_ENTRIES", "10000"))
+        )
+    return _idempotency_store
+
+
+def start_idempotency_sweeper():
+    """Startup: remove chaves expiradas a cada IDEMPOTENCY_SWEEP_INTERVAL_SECONDS (0 desliga)"""
+    get_idempotency_store().start_sweeper(
+        interval_seconds=float(os.getenv("IDEMPOTENCY_SWEEP_INTERVAL_SECONDS", "300")),
+        batch_size=int(os.getenv("IDEMPOTENCY_SWEEP_BATCH_SIZE", "1000"))
+    )
+
+
+def stop_idempotency_sweeper():
+    """Shutdown: encerra a thread de limpeza"""
+    if _idempotency_store is not None:
+        _idempotency_store.stop_sweeper()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 import uuid
@@ -12,3 +12,8 @@ class ApplicationORM(Base):
     owner_team = Column(String(255))
     repo_url = Column(String(255))
     created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        # Paginação keyset (created_at DESC, id DESC) da listagem
+        Index("ix_applications_created_id", "created_at", "id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, CheckConstraint, Text, Index, UniqueConstraint
+from sqlalchemy import Column, String, DateTime, ForeignKey, CheckConstraint, Text, Index, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 import uuid
@@ -17,4 +17,14 @@ class ApprovalORM(Base):
     __table_args__ = (
         # Garantir que cada usuário pode aprovar/rejeitar uma release apenas uma vez
         UniqueConstraint('release_id', 'approver_email', name='uq_approval_release_approver'),
+        # Anti-join da caixa de entrada: "o aprovador já decidiu sobre esta release?"
+        Index('ix_approvals_release_approver_decided', 'release_id', 'approver_email',
+              postgresql_where=text('outcome IS NOT NULL')),
+        # Histórico de decisões do aprovador, paginado por (created_at, id)
+        Index('ix_approvals_approver_outcome_created', 'approver_email', 'outcome', 'created_at', 'id'),
+        # Paginação keyset de GET /approvals (sem filtro ou só por intervalo de criação)
+        Index('ix_approvals_created_id', 'created_at', 'id'),
+        # GET /approvals filtrado por release / por outcome, na ordem do keyset
+        Index('ix_approvals_release_created_id', 'release_id', 'created_at', 'id'),
+        Index('ix_approvals_outcome_created_id', 'outcome', 'created_at', 'id'),
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, JSON
+from sqlalchemy import Column, String, DateTime, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 import uuid
@@ -14,4 +14,13 @@ class AuditLogORM(Base):
     entity_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     payload = Column(JSON, nullable=False)
     request_id = Column(String(255))
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    # Chave de partição (RANGE mensal no Postgres), por isso também na PK
+    created_at = Column(DateTime, primary_key=True, nullable=False, default=datetime.utcnow, index=True)
+
+    __table_args__ = (
+        # Paginação keyset (created_at DESC, id DESC) das listagens
+        Index("ix_audit_logs_created_id", "created_at", "id"),
+        Index("ix_audit_logs_entity_created_id", "entity", "entity_id", "created_at", "id"),
+        Index("ix_audit_logs_actor_created_id", "actor", "created_at", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, BigInteger, Integer, String, DateTime, JSON
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+from src.infrastructure.database import Base
+
+
+class AuditLogOutboxORM(Base):
+    """
+    Outbox transacional de audit logs: gravado na mesma transação da operação,
+    só com a PK, e movido para audit_logs em lotes pelo relay do AuditWriter.
+    """
+    __tablename__ = "audit_log_outbox"
+
+    # Ordem de chegada; BIGSERIAL no Postgres
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    audit_id = Column(UUID(as_uuid=True), nullable=False)
+    actor = Column(String(255), nullable=False)
+    action = Column(String(100), nullable=False)
+    entity = Column(String(100), nullable=False)
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    payload = Column(JSON, nullable=False)
+    request_id = Column(String(255))
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Text, Enum
+from sqlalchemy import Column, String, DateTime, Text, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime, timedelta
 import uuid
@@ -8,15 +8,24 @@ from src.infrastructure.database import Base
 class IdempotencyKey(Base):
     """Armazena requisições idempotentes para deduplicação"""
     __tablename__ = "idempotency_keys"
+
+    # status_code de uma chave reservada cuja requisição ainda não terminou
+    IN_PROGRESS = "102"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     key = Column(String(255), unique=True, nullable=False, index=True)
     request_method = Column(String(10), nullable=False)
     request_path = Column(String(500), nullable=False)
+    request_hash = Column(String(64), nullable=True)  # SHA-256 do corpo da requisição
     response_body = Column(Text, nullable=False)  # JSON serializado
     status_code = Column(String(3), nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     expires_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        # Limpeza em lotes dos registros expirados
+        Index('ix_idempotency_keys_expires_at', 'expires_at'),
+    )
     
     def __repr__(self):
         return f"<IdempotencyKey {self.key}>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, CheckConstraint, UniqueConstraint
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, CheckConstraint, UniqueConstraint, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 import uuid
@@ -15,6 +15,9 @@ class ReleaseORM(Base):
     evidence_url = Column(String(500))
     evidence_score = Column(Integer, default=0)
     version_row = Column(Integer, nullable=False, default=0)
+    # Contadores denormalizados de approvals, mantidos pelo ApprovalUseCase na mesma transação
+    approved_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rejected_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     deployed_at = Column(DateTime)
 
@@ -23,4 +26,10 @@ class ReleaseORM(Base):
         CheckConstraint("env IN ('DEV', 'PRE_PROD', 'PROD')", name="ck_release_env"),
         CheckConstraint("status IN ('PENDING', 'APPROVED', 'DEPLOYED', 'REJECTED')", name="ck_release_status"),
         CheckConstraint("evidence_score >= 0 AND evidence_score <= 100", name="ck_release_score"),
+        # Varredura ordenada da caixa de entrada (releases aprováveis, fora de PROD)
+        Index("ix_releases_pending_inbox", "created_at", "id", postgresql_where=text("env <> 'PROD'")),
+        # Paginação keyset (created_at DESC, id DESC) das listagens
+        Index("ix_releases_created_id", "created_at", "id"),
+        Index("ix_releases_application_created_id", "application_id", "created_at", "id"),
+        Index("ix_releases_status_created_id", "status", "created_at", "id"),
     )
@@ -0,0 +1,167 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+SAMPLE_SIZE = 1024
+
+
+def _summary(samples) -> dict:
+    values = sorted(samples)
+    if not values:
+        return {"count": 0, "p50Ms": None, "p95Ms": None, "maxMs": None}
+    return {
+        "count": len(values),
+        "p50Ms": round(values[len(values) // 2], 3),
+        "p95Ms": round(values[max(int(len(values) * 0.95) - 1, 0)], 3),
+        "maxMs": round(values[-1], 3),
+    }
+
+
+class PoolMetrics:
+    """Contadores e amostras (janela das últimas SAMPLE_SIZE) de um pool de conexões"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool = None
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.wait_ms = deque(maxlen=SAMPLE_SIZE)
+        self.hold_ms = deque(maxlen=SAMPLE_SIZE)
+        self.lifetime_s = deque(maxlen=SAMPLE_SIZE)
+
+    def record_wait(self, elapsed_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+                self.wait_ms.append(elapsed_ms)
+
+    def record_hold(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.hold_ms.append(elapsed_ms)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def record_close(self, lifetime_s: float, invalidated: bool = False) -> None:
+        with self._lock:
+            self.lifetime_s.append(lifetime_s * 1000)
+            if invalidated:
+                self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        pool = self.pool
+        with self._lock:
+            lifetime = _summary(self.lifetime_s)
+            data = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "checkoutWait": _summary(self.wait_ms),
+                "checkoutHold": _summary(self.hold_ms),
+                "connectionLifetime": {
+                    "count": lifetime["count"],
+                    "p50S": lifetime["p50Ms"] and round(lifetime["p50Ms"] / 1000, 3),
+                    "maxS": lifetime["maxMs"] and round(lifetime["maxMs"] / 1000, 3),
+                },
+            }
+        if pool is not None and hasattr(pool, "checkedout"):
+            data.update({
+                "size": pool.size(),
+                "inUse": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "maxOverflow": pool._max_overflow,
+                "timeoutS": pool.timeout(),
+            })
+        return data
+
+
+class _TimedCheckout:
+    """Mede o tempo de espera por uma conexão (inclui abrir uma de overflow) e os timeouts"""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_wait((time.perf_counter() - started) * 1000, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait((time.perf_counter() - started) * 1000)
+        return entry
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics is not None:
+            self.metrics.pool = pool
+        return pool
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+_registry: Dict[str, PoolMetrics] = {}
+
+
+def instrument_engine(engine, name: str) -> PoolMetrics:
+    """Liga os eventos do pool de `engine` (sync ou a sync_engine de uma AsyncEngine) às métricas"""
+    metrics = PoolMetrics(name)
+    pool = engine.pool
+    metrics.pool = pool
+    if isinstance(pool, _TimedCheckout):
+        pool.metrics = metrics
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, record):
+        record.info["connected_at"] = time.monotonic()
+        metrics.record_connect()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, record, proxy):
+        record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, record):
+        started = record.info.pop("checked_out_at", None)
+        if started is not None:
+            metrics.record_hold((time.perf_counter() - started) * 1000)
+
+    def _closed(record, invalidated):
+        connected_at = record.info.pop("connected_at", None)
+        if connected_at is not None:
+            metrics.record_close(time.monotonic() - connected_at, invalidated)
+
+    @event.listens_for(engine, "close")
+    def _on_close(dbapi_connection, record):
+        _closed(record, invalidated=False)
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, record, exception):
+        _closed(record, invalidated=True)
+
+    _registry[name] = metrics
+    return metrics
+
+
+def get_pool_metrics() -> Dict[str, dict]:
+    return {name: metrics.snapshot() for name, metrics in _registry.items()}
@@ -0,0 +1,75 @@
+import hashlib
+import os
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core.cache import TTLCache
+
+# Janela em que um cliente que acabou de escrever continua lendo do primário
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+READ_CONSISTENCY_HEADER = "X-Read-Consistency"
+
+_recent_writers = TTLCache(max_entries=10000, ttl_seconds=READ_YOUR_WRITES_SECONDS)
+
+
+def _client_key(request) -> Optional[str]:
+    """Identifica o cliente pelo hash do header Authorization (o gateway repassa apenas ele)"""
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        return None
+    return hashlib.sha256(authorization.encode()).hexdigest()
+
+
+def record_write(request) -> None:
+    key = _client_key(request)
+    if key:
+        _recent_writers.set(key, True)
+
+
+def must_read_primary(request) -> bool:
+    """Leituras vão ao primário se pedidas explicitamente ou logo após uma escrita do mesmo cliente"""
+    if request.headers.get(READ_CONSISTENCY_HEADER, "").lower() == "primary":
+        return True
+    key = _client_key(request)
+    return key is not None and _recent_writers.get(key, False)
+
+
+def track_writes(session, request) -> None:
+    """
+    Associa a sessão à requisição: só um commit com alterações (flush ou INSERT/UPDATE/
+    DELETE executado pela sessão) marca a requisição como escrita. POSTs somente leitura
+    (cálculo de score, checklists, login) não prendem o cliente ao primário.
+    """
+    session.info["request"] = request
+
+
+def request_wrote(request) -> bool:
+    return getattr(request.state, "wrote", False)
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, flush_context):
+    if "request" in session.info:
+        session.info["pending_write"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _do_orm_execute(orm_execute_state):
+    session = orm_execute_state.session
+    if "request" in session.info and (
+        orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete
+    ):
+        session.info["pending_write"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    if session.info.pop("pending_write", False):
+        session.info["request"].state.wrote = True
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session):
+    session.info.pop("pending_write", None)
@@ -1,6 +1,9 @@
 from uuid import UUID
+from typing import Iterable, Optional
 from sqlalchemy.orm import Session
 from src.infrastructure.orm.application import ApplicationORM
+from src.infrastructure.repositories.keyset import paginate
+from src.infrastructure.repositories.counting import CountMode, TotalCount, count_rows
 
 
 class ApplicationRepository:
@@ -16,14 +19,21 @@ class ApplicationRepository:
     def get_by_id(self, app_id: UUID) -> ApplicationORM:
         return self.session.query(ApplicationORM).filter(ApplicationORM.id == app_id).first()
 
+    def list_by_ids(self, app_ids: Iterable[UUID]):
+        app_ids = list(app_ids)
+        if not app_ids:
+            return []
+        return self.session.query(ApplicationORM).filter(ApplicationORM.id.in_(app_ids)).all()
+
     def get_by_name(self, name: str) -> ApplicationORM:
         return self.session.query(ApplicationORM).filter(ApplicationORM.name == name).first()
 
-    def list_all(self, skip: int = 0, limit: int = 100):
-        return self.session.query(ApplicationORM).offset(skip).limit(limit).all()
+    def list_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+        return paginate(self.session.query(ApplicationORM), ApplicationORM.created_at, ApplicationORM.id, skip, limit, cursor)
     
-    def count_all(self) -> int:
-        return self.session.query(ApplicationORM).count()
+    def count_all(self, mode: CountMode = CountMode.EXACT) -> TotalCount:
+        return count_rows(self.session, self.session.query(ApplicationORM), mode,
+                          cache_key="applications:all", table=ApplicationORM.__tablename__)
 
     def update(self, app_id: UUID, name: str = None, owner_team: str = None, repo_url: str = None) -> ApplicationORM:
         app = self.get_by_id(app_id)
@@ -1,6 +1,66 @@
 from uuid import UUID
+from datetime import datetime, timezone
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 from src.infrastructure.orm.approval import ApprovalORM
+from src.infrastructure.orm.release import ReleaseORM
+from src.infrastructure.orm.application import ApplicationORM
+from src.infrastructure.repositories.keyset import keyset_window, paginate, split_page
+from src.infrastructure.repositories.counting import CountMode, TotalCount, count_rows
+from src.infrastructure.repositories.projection import RELEASE_LISTING
+
+
+class ApprovalFilter(NamedTuple):
+    """
+    Filtros de GET /approvals, aplicados no SQL.
+
+    outcome aceita APPROVED, REJECTED ou PENDING (sem decisão); o intervalo
+    de criação é [created_from, created_to).
+    """
+    release_id: Optional[UUID] = None
+    approver_email: Optional[str] = None
+    outcome: Optional[str] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+    PENDING = "PENDING"
+    OUTCOMES = ("APPROVED", "REJECTED", PENDING)
+
+    def normalized(self) -> "ApprovalFilter":
+        """Valida e normaliza (outcome em maiúsculas, datas em UTC naive como na coluna)"""
+        outcome = self.outcome.upper() if self.outcome else None
+        if outcome is not None and outcome not in self.OUTCOMES:
+            raise ValueError(f"outcome inválido: {self.outcome} (use {', '.join(self.OUTCOMES)})")
+        created_from, created_to = _naive_utc(self.created_from), _naive_utc(self.created_to)
+        if created_from and created_to and created_from >= created_to:
+            raise ValueError("created_from deve ser anterior a created_to")
+        return self._replace(outcome=outcome, created_from=created_from, created_to=created_to)
+
+    def criteria(self) -> list:
+        criteria = []
+        if self.release_id is not None:
+            criteria.append(ApprovalORM.release_id == self.release_id)
+        if self.approver_email:
+            criteria.append(ApprovalORM.approver_email == self.approver_email)
+        if self.outcome == self.PENDING:
+            criteria.append(ApprovalORM.outcome.is_(None))
+        elif self.outcome:
+            criteria.append(ApprovalORM.outcome == self.outcome)
+        if self.created_from:
+            criteria.append(ApprovalORM.created_at >= self.created_from)
+        if self.created_to:
+            criteria.append(ApprovalORM.created_at < self.created_to)
+        return criteria
+
+    def cache_key(self) -> str:
+        return "approvals:" + "|".join("" if value is None else str(value) for value in self)
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
 
 
 class ApprovalRepository:
@@ -21,17 +81,51 @@ class ApprovalRepository:
     def get_by_id(self, approval_id: UUID) -> ApprovalORM:
         return self.session.query(ApprovalORM).filter(ApprovalORM.id == approval_id).first()
 
-    def list_all(self, skip: int = 0, limit: int = 100):
-        return self.session.query(ApprovalORM).offset(skip).limit(limit).all()
+    def list_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None,
+                 filters: Optional[ApprovalFilter] = None):
+        query = self.session.query(ApprovalORM)
+        if filters:
+            query = query.filter(*filters.criteria())
+        return paginate(query, ApprovalORM.created_at, ApprovalORM.id, skip, limit, cursor)
     
-    def count_all(self) -> int:
-        return self.session.query(ApprovalORM).count()
+    def count_all(self, mode: CountMode = CountMode.EXACT, filters: Optional[ApprovalFilter] = None) -> TotalCount:
+        query = self.session.query(ApprovalORM)
+        criteria = filters.criteria() if filters else []
+        if criteria:
+            # Estimativa filtrada vem do EXPLAIN, não do reltuples da tabela
+            return count_rows(self.session, query.filter(*criteria), mode, cache_key=filters.cache_key())
+        return count_rows(self.session, query, mode, cache_key="approvals:all", table=ApprovalORM.__tablename__)
 
     def list_by_release(self, release_id: UUID):
         return self.session.query(ApprovalORM).filter(
             ApprovalORM.release_id == release_id
         ).all()
 
+    def count_outcomes_by_release(self, release_ids: Iterable[UUID]) -> Dict[UUID, Tuple[int, int]]:
+        """
+        Contagem de aprovações/rejeições para várias releases em uma query agrupada.
+
+        Returns:
+            {release_id: (approval_count, rejection_count)}; releases sem approvals ficam de fora
+        """
+        release_ids = list(release_ids)
+        if not release_ids:
+            return {}
+        return {
+            release_id: (approved, rejected)
+            for release_id, approved, rejected in self.session.execute(self.outcomes_by_release_statement(release_ids))
+        }
+
+    @staticmethod
+    def outcomes_by_release_statement(release_ids):
+        return select(
+            ApprovalORM.release_id,
+            func.count().filter(ApprovalORM.outcome == 'APPROVED'),
+            func.count().filter(ApprovalORM.outcome == 'REJECTED')
+        ).where(
+            ApprovalORM.release_id.in_(release_ids)
+        ).group_by(ApprovalORM.release_id)
+
     def get_by_release_and_approver(self, release_id: UUID, approver_email: str) -> ApprovalORM:
         return self.session.query(ApprovalORM).filter(
             ApprovalORM.release_id == release_id,
@@ -57,3 +151,66 @@ class ApprovalRepository:
         return self.session.query(ApprovalORM).filter(
             ApprovalORM.release_id == release_id
         ).order_by(ApprovalORM.created_at.desc()).first()
+
+    def list_decided_by_approver(self, approver_email: str, outcome: str, skip: int = 0,
+                                 limit: int = 100, cursor: Optional[str] = None):
+        """
+        Histórico de decisões do aprovador (approvals -> releases -> applications) em uma query.
+
+        Ordena por decisão mais recente; com `cursor` usa keyset em (created_at, id)
+        da approval e ignora `skip`. O total vem de COUNT(*) OVER () sobre as
+        decisões do aprovador, antes do recorte do cursor.
+
+        Returns:
+            ([(Row da projeção RELEASE_LISTING, application_name)], total, next_cursor)
+        """
+        stmt = self.decided_by_approver_statement(approver_email, outcome, skip, limit, cursor)
+        rows = self.session.execute(stmt).all()
+        if rows:
+            total = rows[0].total
+        else:
+            total = self.count_decided_by_approver(approver_email, outcome)
+        page, next_cursor = self.split_decided_page(rows, limit)
+        return page, total, next_cursor
+
+    @staticmethod
+    def decided_by_approver_statement(approver_email: str, outcome: str, skip: int = 0,
+                                      limit: int = 100, cursor: Optional[str] = None):
+        """SELECT do histórico (colunas de RELEASE_LISTING, application_name, decided_at, decision_id, total) com `limit + 1` linhas"""
+        decided = select(
+            ApprovalORM.id,
+            ApprovalORM.release_id,
+            ApprovalORM.created_at,
+            func.count().over().label('total')
+        ).where(
+            ApprovalORM.approver_email == approver_email,
+            ApprovalORM.outcome == outcome
+        ).subquery()
+
+        stmt = RELEASE_LISTING.select(
+            ApplicationORM.name.label('application_name'),
+            decided.c.created_at.label('decided_at'),
+            decided.c.id.label('decision_id'),
+            decided.c.total
+        ).join(
+            decided, decided.c.release_id == ReleaseORM.id
+        ).outerjoin(
+            ApplicationORM, ApplicationORM.id == ReleaseORM.application_id
+        )
+        return keyset_window(stmt, decided.c.created_at, decided.c.id, skip, limit, cursor)
+
+    @staticmethod
+    def split_decided_page(rows, limit: int):
+        """Returns: ([(Row da projeção RELEASE_LISTING, application_name)], next_cursor)"""
+        rows, next_cursor = split_page(rows, limit, lambda row: (row.decided_at, row.decision_id))
+        return [(row, row.application_name) for row in rows], next_cursor
+
+    @staticmethod
+    def count_decided_by_approver_statement(approver_email: str, outcome: str):
+        return select(func.count()).select_from(ApprovalORM).where(
+            ApprovalORM.approver_email == approver_email,
+            ApprovalORM.outcome == outcome
+        )
+
+    def count_decided_by_approver(self, approver_email: str, outcome: str) -> int:
+        return self.session.execute(self.count_decided_by_approver_statement(approver_email, outcome)).scalar_one()
@@ -0,0 +1,26 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.repositories.approval_repository import ApprovalRepository
+
+
+class AsyncApprovalRepository:
+    """Leituras de approvals sobre AsyncSession; reaproveita os SELECTs de ApprovalRepository"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def list_decided_by_approver(self, approver_email: str, outcome: str, skip: int = 0,
+                                       limit: int = 100, cursor: Optional[str] = None):
+        """Returns: ([(Row da projeção RELEASE_LISTING, application_name)], total, next_cursor)"""
+        stmt = ApprovalRepository.decided_by_approver_statement(approver_email, outcome, skip, limit, cursor)
+        rows = (await self.session.execute(stmt)).all()
+        if rows:
+            total = rows[0].total
+        else:
+            total = await self.count_decided_by_approver(approver_email, outcome)
+        page, next_cursor = ApprovalRepository.split_decided_page(rows, limit)
+        return page, total, next_cursor
+
+    async def count_decided_by_approver(self, approver_email: str, outcome: str) -> int:
+        stmt = ApprovalRepository.count_decided_by_approver_statement(approver_email, outcome)
+        return (await self.session.execute(stmt)).scalar_one()
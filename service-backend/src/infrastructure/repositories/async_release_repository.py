@@ -0,0 +1,57 @@
+from uuid import UUID
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.orm.release import ReleaseORM
+from src.infrastructure.repositories.release_repository import ReleaseRepository
+from src.infrastructure.repositories.keyset import keyset_window, split_page
+from src.infrastructure.repositories.counting import CountMode, TotalCount, count_rows_async
+
+
+class AsyncReleaseRepository:
+    """Leituras de releases sobre AsyncSession; reaproveita os SELECTs de ReleaseRepository"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _list(self, criteria, skip: int, limit: int, cursor: Optional[str]):
+        stmt = keyset_window(
+            ReleaseRepository.listing_statement(*criteria),
+            ReleaseORM.created_at, ReleaseORM.id, skip, limit, cursor
+        )
+        rows = (await self.session.execute(stmt)).all()
+        rows, next_cursor = split_page(rows, limit, lambda row: (row.created_at, row.id))
+        return [(row, row.application_name) for row in rows], next_cursor
+
+    async def list_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+        """Returns: ([(Row da projeção RELEASE_LISTING, application_name)], next_cursor)"""
+        return await self._list((), skip, limit, cursor)
+
+    async def list_by_application(self, application_id: UUID, skip: int = 0, limit: int = 100,
+                                  cursor: Optional[str] = None):
+        """Returns: ([(Row da projeção RELEASE_LISTING, application_name)], next_cursor)"""
+        return await self._list((ReleaseORM.application_id == application_id,), skip, limit, cursor)
+
+    async def count_all(self, mode: CountMode = CountMode.EXACT) -> TotalCount:
+        return await count_rows_async(self.session, select(ReleaseORM), mode,
+                                      cache_key="releases:all", table=ReleaseORM.__tablename__)
+
+    async def count_by_application(self, application_id: UUID, mode: CountMode = CountMode.EXACT) -> TotalCount:
+        stmt = select(ReleaseORM).where(ReleaseORM.application_id == application_id)
+        return await count_rows_async(self.session, stmt, mode, cache_key=f"releases:application:{application_id}")
+
+    async def list_pending_for_approver(self, approver_email: str, skip: int = 0, limit: int = 100):
+        """Returns: ([(Row da projeção RELEASE_LISTING, application_name)], total)"""
+        stmt = ReleaseRepository.pending_for_approver_statement(approver_email, skip, limit)
+        rows = (await self.session.execute(stmt)).all()
+        if rows:
+            total = rows[0].total
+        elif skip > 0:
+            total = await self.count_pending_for_approver(approver_email)
+        else:
+            total = 0
+        return [(row, row.application_name) for row in rows], total
+
+    async def count_pending_for_approver(self, approver_email: str) -> int:
+        stmt = ReleaseRepository.count_pending_for_approver_statement(approver_email)
+        return (await self.session.execute(stmt)).scalar_one()
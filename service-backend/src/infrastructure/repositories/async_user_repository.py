@@ -0,0 +1,19 @@
+from typing import Iterable, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.orm.user import UserORM
+from src.infrastructure.repositories.user_repository import UserRepository
+
+
+class AsyncUserRepository:
+    """Leituras de users sobre AsyncSession; reaproveita os SELECTs de UserRepository"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_email(self, email: str) -> UserORM | None:
+        result = await self.session.execute(UserRepository.by_email_statement(email))
+        return result.scalars().first()
+
+    async def list_by_emails(self, emails: Iterable[str]) -> List[UserORM]:
+        result = await self.session.execute(UserRepository.by_emails_statement(emails))
+        return list(result.scalars())
@@ -1,6 +1,12 @@
 from uuid import UUID
+from typing import List, Optional
+from sqlalchemy import delete, insert, select
 from sqlalchemy.orm import Session
 from src.infrastructure.orm.audit_log import AuditLogORM
+from src.infrastructure.orm.audit_log_outbox import AuditLogOutboxORM
+from src.infrastructure.repositories.keyset import paginate_rows
+from src.infrastructure.repositories.counting import CountMode, TotalCount, count_rows
+from src.infrastructure.repositories.projection import AUDIT_LOG_LISTING, Projection
 
 
 class AuditLogRepository:
@@ -21,32 +27,73 @@ class AuditLogRepository:
         self.session.flush()
         return log
 
-    def list_by_entity(self, entity: str, entity_id: UUID, skip: int = 0, limit: int = 100):
-        return self.session.query(AuditLogORM).filter(
-            AuditLogORM.entity == entity,
-            AuditLogORM.entity_id == str(entity_id)
-        ).order_by(AuditLogORM.created_at.desc()).offset(skip).limit(limit).all()
+    def append(self, actor: str, action: str, entity: str, entity_id: UUID,
+               payload: dict = None, request_id: str = None) -> None:
+        """Registra um audit log pelo AuditWriter configurado (AUDIT_WRITER_MODE)"""
+        from src.infrastructure.audit_writer import get_audit_writer
+        get_audit_writer().write(self.session, actor, action, entity, entity_id, payload, request_id)
+
+    def insert_many(self, rows: List[dict]) -> None:
+        """INSERT multi-linha (executemany / insertmanyvalues) de audit logs já montados"""
+        if rows:
+            self.session.execute(insert(AuditLogORM), rows)
+
+    def relay_outbox(self, limit: int) -> int:
+        """Move até `limit` registros do outbox para audit_logs na transação corrente"""
+        query = select(AuditLogOutboxORM).order_by(AuditLogOutboxORM.id).limit(limit)
+        if self.session.get_bind().dialect.name == "postgresql":
+            # Vários workers drenam o outbox sem disputar as mesmas linhas
+            query = query.with_for_update(skip_locked=True)
+        pending = self.session.execute(query).scalars().all()
+        if not pending:
+            return 0
+        self.insert_many([
+            {
+                "id": row.audit_id,
+                "actor": row.actor,
+                "action": row.action,
+                "entity": row.entity,
+                "entity_id": row.entity_id,
+                "payload": row.payload,
+                "request_id": row.request_id,
+                "created_at": row.created_at,
+            }
+            for row in pending
+        ])
+        self.session.execute(
+            delete(AuditLogOutboxORM).where(AuditLogOutboxORM.id.in_([row.id for row in pending]))
+        )
+        return len(pending)
+
+    def _list(self, projection: Projection, criteria, skip: int, limit: int, cursor: Optional[str]):
+        """Returns: ([Row da projeção], next_cursor)"""
+        stmt = projection.select().where(*criteria)
+        return paginate_rows(self.session, stmt, AuditLogORM.created_at, AuditLogORM.id, skip, limit, cursor)
+
+    def list_by_entity(self, entity: str, entity_id: UUID, skip: int = 0, limit: int = 100,
+                       cursor: Optional[str] = None, projection: Projection = AUDIT_LOG_LISTING):
+        criteria = (AuditLogORM.entity == entity, AuditLogORM.entity_id == str(entity_id))
+        return self._list(projection, criteria, skip, limit, cursor)
     
-    def count_by_entity(self, entity: str, entity_id: UUID) -> int:
-        return self.session.query(AuditLogORM).filter(
+    def count_by_entity(self, entity: str, entity_id: UUID, mode: CountMode = CountMode.EXACT) -> TotalCount:
+        query = self.session.query(AuditLogORM).filter(
             AuditLogORM.entity == entity,
             AuditLogORM.entity_id == str(entity_id)
-        ).count()
+        )
+        return count_rows(self.session, query, mode, cache_key=f"audit_logs:entity:{entity}:{entity_id}")
 
-    def list_by_actor(self, actor: str, skip: int = 0, limit: int = 100):
-        return self.session.query(AuditLogORM).filter(
-            AuditLogORM.actor == actor
-        ).order_by(AuditLogORM.created_at.desc()).offset(skip).limit(limit).all()
+    def list_by_actor(self, actor: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None,
+                      projection: Projection = AUDIT_LOG_LISTING):
+        return self._list(projection, (AuditLogORM.actor == actor,), skip, limit, cursor)
     
-    def count_by_actor(self, actor: str) -> int:
-        return self.session.query(AuditLogORM).filter(
-            AuditLogORM.actor == actor
-        ).count()
-
-    def list_all(self, skip: int = 0, limit: int = 100):
-        return self.session.query(AuditLogORM).order_by(
-            AuditLogORM.created_at.desc()
-        ).offset(skip).limit(limit).all()
+    def count_by_actor(self, actor: str, mode: CountMode = CountMode.EXACT) -> TotalCount:
+        query = self.session.query(AuditLogORM).filter(AuditLogORM.actor == actor)
+        return count_rows(self.session, query, mode, cache_key=f"audit_logs:actor:{actor}")
+
+    def list_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None,
+                 projection: Projection = AUDIT_LOG_LISTING):
+        return self._list(projection, (), skip, limit, cursor)
     
-    def count_all(self) -> int:
-        return self.session.query(AuditLogORM).count()
+    def count_all(self, mode: CountMode = CountMode.EXACT) -> TotalCount:
+        return count_rows(self.session, self.session.query(AuditLogORM), mode,
+                          cache_key="audit_logs:all", table=AuditLogORM.__tablename__)
@@ -0,0 +1,109 @@
+import os
+from enum import Enum
+from typing import NamedTuple, Optional
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from src.core.cache import TTLCache
+
+
+class CountMode(str, Enum):
+    """Estratégia de cálculo do total das listagens paginadas"""
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+
+
+class TotalCount(NamedTuple):
+    value: int
+    exact: bool
+
+
+COUNT_CACHE_TTL_SECONDS = float(os.getenv("COUNT_CACHE_TTL_SECONDS", "30"))
+# Abaixo deste volume estimado o COUNT(*) exato é barato e é usado no lugar da estimativa
+COUNT_ESTIMATE_MIN_ROWS = int(os.getenv("COUNT_ESTIMATE_MIN_ROWS", "1000"))
+
+_count_cache = TTLCache(max_entries=1024, ttl_seconds=COUNT_CACHE_TTL_SECONDS)
+
+
+class _ExplainJSON(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) de um SELECT, mantendo os bind params do statement"""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_ExplainJSON, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+_RELTUPLES = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)")
+
+
+def _plan_rows(plan) -> int:
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _estimate(session, query, table: Optional[str]) -> Optional[int]:
+    if table:
+        # Tabela inteira: estatística do catálogo, sem planejar a query
+        reltuples = session.execute(_RELTUPLES, {"table": table}).scalar()
+        if reltuples is not None and reltuples >= 0:
+            return int(reltuples)
+    return _plan_rows(session.execute(_ExplainJSON(query.statement)).scalar())
+
+
+def count_rows(session, query, mode: CountMode = CountMode.EXACT, cache_key: Optional[str] = None,
+               table: Optional[str] = None) -> TotalCount:
+    """
+    Total de linhas de uma query de listagem segundo o modo pedido.
+
+    - exact: COUNT(*)
+    - estimated: pg_class.reltuples (tabela inteira, `table`) ou linhas estimadas pelo EXPLAIN;
+      cai para o exato em bancos não-PostgreSQL ou quando a estimativa é pequena
+    - cached: COUNT(*) reaproveitado por COUNT_CACHE_TTL_SECONDS sob `cache_key`
+    """
+    if mode == CountMode.CACHED and cache_key:
+        cached = _count_cache.get(cache_key)
+        if cached is not None:
+            return TotalCount(cached, False)
+        value = query.count()
+        _count_cache.set(cache_key, value)
+        return TotalCount(value, True)
+
+    if mode == CountMode.ESTIMATED and session.get_bind().dialect.name == "postgresql":
+        estimate = _estimate(session, query, table)
+        if estimate is not None and estimate >= COUNT_ESTIMATE_MIN_ROWS:
+            return TotalCount(estimate, False)
+
+    return TotalCount(query.count(), True)
+
+
+async def count_rows_async(session, stmt, mode: CountMode = CountMode.EXACT, cache_key: Optional[str] = None,
+                           table: Optional[str] = None) -> TotalCount:
+    """Equivalente de count_rows para AsyncSession; `stmt` é o Select da listagem"""
+    exact = select(func.count()).select_from(stmt.order_by(None).subquery())
+
+    if mode == CountMode.CACHED and cache_key:
+        cached = _count_cache.get(cache_key)
+        if cached is not None:
+            return TotalCount(cached, False)
+        value = (await session.execute(exact)).scalar_one()
+        _count_cache.set(cache_key, value)
+        return TotalCount(value, True)
+
+    if mode == CountMode.ESTIMATED and session.bind.dialect.name == "postgresql":
+        estimate = None
+        if table:
+            reltuples = (await session.execute(_RELTUPLES, {"table": table})).scalar()
+            if reltuples is not None and reltuples >= 0:
+                estimate = int(reltuples)
+        if estimate is None:
+            estimate = _plan_rows((await session.execute(_ExplainJSON(stmt))).scalar())
+        if estimate >= COUNT_ESTIMATE_MIN_ROWS:
+            return TotalCount(estimate, False)
+
+    return TotalCount((await session.execute(exact)).scalar_one(), True)
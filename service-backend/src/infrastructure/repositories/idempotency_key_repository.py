@@ -1,10 +1,16 @@
+from sqlalchemy import select, delete, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from src.infrastructure.orm.idempotency_key import IdempotencyKey
 from datetime import datetime
+from typing import Optional
 import json
+import uuid
 
 
 class IdempotencyKeyRepository:
+    """Acesso à tabela idempotency_keys; transação controlada por quem chama (sem commit aqui)"""
+
     def __init__(self, session: Session):
         self.session = session
     
@@ -15,24 +21,78 @@ class IdempotencyKeyRepository:
             IdempotencyKey.expires_at > datetime.utcnow()
         ).first()
         return record
-    
-    def create(self, key: str, request_method: str, request_path: str, response_body: dict, status_code: str):
-        """Criar novo registro de idempotency"""
-        record = IdempotencyKey(
+
+    def claim(self, key: str, request_method: str, request_path: str, expires_at: datetime,
+              request_hash: Optional[str] = None) -> Optional[datetime]:
+        """
+        Reserva a chave atomicamente (INSERT ... ON CONFLICT).
+
+        Insere um registro "em andamento" ou assume um registro expirado com a
+        mesma chave. Retorna o created_at da reserva (token do dono, exigido por
+        complete/delete) ou None se outra requisição já detém uma chave válida.
+        """
+        now = datetime.utcnow()
+        values = dict(
+            id=uuid.uuid4(),
             key=key,
             request_method=request_method,
             request_path=request_path,
-            response_body=json.dumps(response_body),
-            status_code=status_code,
-            expires_at=IdempotencyKey.create_default_expiry()
+            request_hash=request_hash,
+            response_body="",
+            status_code=IdempotencyKey.IN_PROGRESS,
+            created_at=now,
+            expires_at=expires_at
         )
-        self.session.add(record)
-        self.session.commit()
-        return record
-    
-    def cleanup_expired(self):
-        """Remover registros expirados (manutenção)"""
-        self.session.query(IdempotencyKey).filter(
-            IdempotencyKey.expires_at <= datetime.utcnow()
-        ).delete()
-        self.session.commit()
+        insert = postgresql.insert if self.session.get_bind().dialect.name == "postgresql" else sqlite.insert
+        stmt = insert(IdempotencyKey).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[IdempotencyKey.key],
+            set_={name: stmt.excluded[name] for name in values if name not in ("id", "key")},
+            where=IdempotencyKey.expires_at <= now
+        ).returning(IdempotencyKey.created_at)
+        return self.session.execute(stmt).scalar_one_or_none()
+
+    @staticmethod
+    def _owned(key: str, claimed_at: datetime):
+        """
+        Reserva ainda em andamento e do mesmo dono: após lock_ttl outra requisição pode
+        assumir a chave (novo created_at), e o dono antigo não deve mais alterá-la
+        """
+        return (
+            IdempotencyKey.key == key,
+            IdempotencyKey.status_code == IdempotencyKey.IN_PROGRESS,
+            IdempotencyKey.created_at == claimed_at,
+        )
+
+    def complete(self, key: str, claimed_at: datetime, response_body: dict, status_code: str,
+                 expires_at: datetime) -> bool:
+        """Grava a resposta final de uma chave reservada; False se a reserva não é mais deste dono"""
+        result = self.session.execute(
+            update(IdempotencyKey)
+            .where(*self._owned(key, claimed_at))
+            .values(response_body=json.dumps(response_body), status_code=status_code, expires_at=expires_at)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    def delete(self, key: str, claimed_at: datetime) -> bool:
+        """Libera uma reserva; False se ela não é mais deste dono"""
+        result = self.session.execute(
+            delete(IdempotencyKey)
+            .where(*self._owned(key, claimed_at))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    def delete_expired_batch(self, limit: int = 1000, now: Optional[datetime] = None) -> int:
+        """Remove até `limit` registros expirados; retorna quantos removeu"""
+        expired = (
+            select(IdempotencyKey.id)
+            .where(IdempotencyKey.expires_at <= (now or datetime.utcnow()))
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = self.session.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.id.in_(expired)).execution_options(synchronize_session=False)
+        )
+        return result.rowcount
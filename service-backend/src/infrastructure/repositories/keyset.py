@@ -0,0 +1,99 @@
+import base64
+import json
+from datetime import datetime
+from typing import Callable, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import and_, tuple_, literal
+
+
+class InvalidCursorError(ValueError):
+    """Levantada quando o cursor de paginação não pode ser decodificado"""
+
+
+def encode_cursor(created_at: datetime, row_id) -> Optional[str]:
+    """Cursor opaco (base64 url-safe) com a posição (created_at, id) da última linha"""
+    if created_at is None or row_id is None:
+        return None
+    raw = json.dumps([created_at.isoformat(), str(row_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, TypeError):
+        raise InvalidCursorError("Cursor de paginação inválido")
+
+
+def after_cursor(created_at_column, id_column, cursor: str):
+    """Predicado keyset para ordenação (created_at DESC, id DESC)"""
+    created_at, row_id = decode_cursor(cursor)
+    # Redundante com a tupla, mas permite partition pruning por created_at
+    return and_(
+        created_at_column <= literal(created_at, created_at_column.type),
+        tuple_(created_at_column, id_column) < tuple_(
+            literal(created_at, created_at_column.type),
+            literal(row_id, id_column.type)
+        )
+    )
+
+
+def keyset_window(stmt, created_at_column, id_column, skip: int = 0, limit: int = 100,
+                  cursor: Optional[str] = None):
+    """
+    Ordena por (created_at DESC, id DESC) e recorta a página por cursor (keyset)
+    ou, sem cursor, por offset (modo de compatibilidade). Aceita Query ou Select.
+
+    Pede `limit + 1` linhas para saber se existe próxima página sem COUNT.
+    """
+    stmt = stmt.order_by(created_at_column.desc(), id_column.desc())
+    if cursor:
+        stmt = stmt.filter(after_cursor(created_at_column, id_column, cursor))
+    else:
+        stmt = stmt.offset(skip)
+    return stmt.limit(limit + 1)
+
+
+def split_page(items, limit: int, position: Callable):
+    """
+    Separa a linha excedente de keyset_window e gera o cursor da próxima página.
+
+    `position(item)` devolve (created_at, id) do item.
+    """
+    items = list(items)
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, encode_cursor(*position(items[-1]))
+
+
+def paginate(query, created_at_column, id_column, skip: int = 0, limit: int = 100,
+             cursor: Optional[str] = None):
+    """
+    Página de entidades ORM de uma Query, ordenada por (created_at DESC, id DESC).
+
+    Returns:
+        (items, next_cursor)
+    """
+    items = keyset_window(query, created_at_column, id_column, skip, limit, cursor).all()
+    return split_page(
+        items, limit,
+        lambda item: (getattr(item, created_at_column.key), getattr(item, id_column.key))
+    )
+
+
+def paginate_rows(session, stmt, created_at_column, id_column, skip: int = 0, limit: int = 100,
+                  cursor: Optional[str] = None):
+    """
+    Página de linhas (Row) de um SELECT Core, ordenada por (created_at DESC, id DESC).
+
+    Returns:
+        (rows, next_cursor)
+    """
+    rows = session.execute(keyset_window(stmt, created_at_column, id_column, skip, limit, cursor)).all()
+    return split_page(
+        rows, limit,
+        lambda row: (getattr(row, created_at_column.key), getattr(row, id_column.key))
+    )
@@ -0,0 +1,62 @@
+from sqlalchemy import select
+
+from src.infrastructure.orm.release import ReleaseORM
+from src.infrastructure.orm.audit_log import AuditLogORM
+
+
+class Projection:
+    """
+    Colunas lidas por uma listagem. O SELECT é Core: as linhas saem como Row (acesso
+    por atributo, como a entidade), sem identity map, sem instrumentação e sem
+    carregar/desserializar colunas fora da projeção.
+    """
+
+    def __init__(self, *columns):
+        self.columns = columns
+
+    @property
+    def names(self) -> tuple:
+        return tuple(column.key for column in self.columns)
+
+    def without(self, *names: str) -> "Projection":
+        unknown = set(names) - set(self.names)
+        if unknown:
+            raise ValueError(f"Colunas fora da projeção: {', '.join(sorted(unknown))}")
+        return Projection(*(column for column in self.columns if column.key not in names))
+
+    def select(self, *extra):
+        """SELECT das colunas da projeção, seguidas de `extra` (labels de joins, janelas...)"""
+        return select(*self.columns, *extra)
+
+
+# GET /releases, /releases/application/{id} e caixas do aprovador (/approvals/*/current):
+# só o que ReleaseResponse usa
+RELEASE_LISTING = Projection(
+    ReleaseORM.id,
+    ReleaseORM.application_id,
+    ReleaseORM.version,
+    ReleaseORM.env,
+    ReleaseORM.status,
+    ReleaseORM.evidence_url,
+    ReleaseORM.evidence_score,
+    ReleaseORM.version_row,
+    ReleaseORM.created_at,
+    ReleaseORM.deployed_at,
+    ReleaseORM.approved_count,
+    ReleaseORM.rejected_count,
+)
+
+# GET /audit-logs, /audit-logs/entity/{type}/{id}, /audit-logs/actor/{email}
+AUDIT_LOG_LISTING = Projection(
+    AuditLogORM.id,
+    AuditLogORM.actor,
+    AuditLogORM.action,
+    AuditLogORM.entity,
+    AuditLogORM.entity_id,
+    AuditLogORM.payload,
+    AuditLogORM.request_id,
+    AuditLogORM.created_at,
+)
+
+# Mesmas rotas com includePayload=false: o JSON de payload nem sai do banco
+AUDIT_LOG_SUMMARY = AUDIT_LOG_LISTING.without("payload")
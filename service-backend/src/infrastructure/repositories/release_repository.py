@@ -1,7 +1,14 @@
 from uuid import UUID
+from typing import Optional, Tuple
+from sqlalchemy import select, exists, func, and_, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from src.infrastructure.orm.release import ReleaseORM
+from src.infrastructure.orm.approval import ApprovalORM
+from src.infrastructure.orm.application import ApplicationORM
+from src.infrastructure.repositories.keyset import paginate_rows
+from src.infrastructure.repositories.projection import RELEASE_LISTING
+from src.infrastructure.repositories.counting import CountMode, TotalCount, count_rows
 
 
 class ReleaseRepository:
@@ -25,6 +32,13 @@ class ReleaseRepository:
     def get_by_id(self, release_id: UUID) -> ReleaseORM:
         return self.session.query(ReleaseORM).filter(ReleaseORM.id == release_id).first()
 
+    def list_by_ids(self, release_ids) -> list:
+        """Carrega várias releases em uma única query (ordem não garantida)"""
+        ids = list(set(release_ids))
+        if not ids:
+            return []
+        return self.session.query(ReleaseORM).filter(ReleaseORM.id.in_(ids)).all()
+
     def get_by_app_version_env(self, application_id: UUID, version: str, env: str) -> ReleaseORM:
         return self.session.query(ReleaseORM).filter(
             ReleaseORM.application_id == application_id,
@@ -32,31 +46,88 @@ class ReleaseRepository:
             ReleaseORM.env == env
         ).first()
 
-    def list_by_application(self, application_id: UUID, skip: int = 0, limit: int = 100):
-        return self.session.query(ReleaseORM).filter(
-            ReleaseORM.application_id == application_id
-        ).offset(skip).limit(limit).all()
+    def list_by_application(self, application_id: UUID, skip: int = 0, limit: int = 100,
+                            cursor: Optional[str] = None):
+        stmt = RELEASE_LISTING.select().where(ReleaseORM.application_id == application_id)
+        return paginate_rows(self.session, stmt, ReleaseORM.created_at, ReleaseORM.id, skip, limit, cursor)
     
-    def count_by_application(self, application_id: UUID) -> int:
-        return self.session.query(ReleaseORM).filter(
-            ReleaseORM.application_id == application_id
-        ).count()
+    def count_by_application(self, application_id: UUID, mode: CountMode = CountMode.EXACT) -> TotalCount:
+        query = self.session.query(ReleaseORM).filter(ReleaseORM.application_id == application_id)
+        return count_rows(self.session, query, mode, cache_key=f"releases:application:{application_id}")
 
-    def list_by_status(self, status: str, skip: int = 0, limit: int = 100):
-        return self.session.query(ReleaseORM).filter(
-            ReleaseORM.status == status
-        ).offset(skip).limit(limit).all()
+    def list_by_status(self, status: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+        stmt = RELEASE_LISTING.select().where(ReleaseORM.status == status)
+        return paginate_rows(self.session, stmt, ReleaseORM.created_at, ReleaseORM.id, skip, limit, cursor)
     
-    def count_by_status(self, status: str) -> int:
-        return self.session.query(ReleaseORM).filter(
-            ReleaseORM.status == status
-        ).count()
+    def count_by_status(self, status: str, mode: CountMode = CountMode.EXACT) -> TotalCount:
+        query = self.session.query(ReleaseORM).filter(ReleaseORM.status == status)
+        return count_rows(self.session, query, mode, cache_key=f"releases:status:{status}")
 
-    def list_all(self, skip: int = 0, limit: int = 100):
-        return self.session.query(ReleaseORM).offset(skip).limit(limit).all()
+    def list_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+        """Returns: ([Row da projeção RELEASE_LISTING], next_cursor)"""
+        return paginate_rows(self.session, RELEASE_LISTING.select(), ReleaseORM.created_at, ReleaseORM.id,
+                             skip, limit, cursor)
     
-    def count_all(self) -> int:
-        return self.session.query(ReleaseORM).count()
+    def count_all(self, mode: CountMode = CountMode.EXACT) -> TotalCount:
+        return count_rows(self.session, self.session.query(ReleaseORM), mode,
+                          cache_key="releases:all", table=ReleaseORM.__tablename__)
+
+    @staticmethod
+    def _pending_for_approver_criteria(approver_email: str):
+        """Releases fora de PROD sem decisão (APPROVED/REJECTED) do aprovador (anti-join)"""
+        decided = exists().where(
+            ApprovalORM.release_id == ReleaseORM.id,
+            ApprovalORM.approver_email == approver_email,
+            ApprovalORM.outcome.isnot(None)
+        )
+        return and_(ReleaseORM.env != 'PROD', ~decided)
+
+    @classmethod
+    def pending_for_approver_statement(cls, approver_email: str, skip: int = 0, limit: int = 100):
+        """SELECT (colunas de RELEASE_LISTING, application_name, total) da caixa de entrada; compartilhado com o repositório async"""
+        return RELEASE_LISTING.select(
+            ApplicationORM.name.label('application_name'),
+            func.count().over().label('total')
+        ).outerjoin(
+            ApplicationORM, ApplicationORM.id == ReleaseORM.application_id
+        ).where(
+            cls._pending_for_approver_criteria(approver_email)
+        ).order_by(
+            ReleaseORM.created_at.desc(), ReleaseORM.id.desc()
+        ).offset(skip).limit(limit)
+
+    @classmethod
+    def count_pending_for_approver_statement(cls, approver_email: str):
+        return select(func.count()).select_from(ReleaseORM).where(
+            cls._pending_for_approver_criteria(approver_email)
+        )
+
+    @staticmethod
+    def listing_statement(*criteria):
+        """SELECT (colunas de RELEASE_LISTING, application_name) para as listagens paginadas por keyset"""
+        return RELEASE_LISTING.select(ApplicationORM.name.label('application_name')).outerjoin(
+            ApplicationORM, ApplicationORM.id == ReleaseORM.application_id
+        ).where(*criteria)
+
+    def list_pending_for_approver(self, approver_email: str, skip: int = 0, limit: int = 100):
+        """
+        Caixa de entrada do aprovador: filtra, conta e pagina no banco em uma única query.
+
+        Returns:
+            ([(Row da projeção RELEASE_LISTING, application_name)], total)
+        """
+        rows = self.session.execute(self.pending_for_approver_statement(approver_email, skip, limit)).all()
+        if rows:
+            total = rows[0].total
+        elif skip > 0:
+            # Página além do fim: a janela não traz o total, conta separadamente
+            total = self.count_pending_for_approver(approver_email)
+        else:
+            total = 0
+        return [(row, row.application_name) for row in rows], total
+
+    def count_pending_for_approver(self, approver_email: str) -> int:
+        return self.session.execute(self.count_pending_for_approver_statement(approver_email)).scalar_one()
 
     def update_status(self, release_id: UUID, status: str) -> ReleaseORM:
         release = self.get_by_id(release_id)
@@ -65,6 +136,24 @@ class ReleaseRepository:
             self.session.flush()
         return release
 
+    def adjust_approval_counters(self, release_id: UUID, approved: int = 0, rejected: int = 0) -> Tuple[int, int]:
+        """
+        Incrementa/decrementa os contadores de approvals atomicamente (UPDATE ... SET x = x + n).
+
+        Returns:
+            (approved_count, rejected_count) após a atualização
+        """
+        stmt = update(ReleaseORM).where(
+            ReleaseORM.id == release_id
+        ).values(
+            approved_count=ReleaseORM.approved_count + approved,
+            rejected_count=ReleaseORM.rejected_count + rejected
+        ).returning(ReleaseORM.approved_count, ReleaseORM.rejected_count)
+        row = self.session.execute(stmt).one_or_none()
+        if row is None:
+            raise ValueError(f"Release {release_id} not found")
+        return row[0], row[1]
+
     def update_environment(self, release_id: UUID, new_env: str) -> ReleaseORM:
         release = self.get_by_id(release_id)
         if release:
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 from uuid import UUID
+from typing import Iterable, List
 from src.infrastructure.orm.user import UserORM
 from src.domain.entities.user import User, UserRole
 
@@ -9,8 +10,19 @@ class UserRepository:
     def __init__(self, session: Session):
         self.session = session
 
+    @staticmethod
+    def by_email_statement(email: str):
+        return select(UserORM).where(UserORM.email == email).limit(1)
+
+    @staticmethod
+    def by_emails_statement(emails: Iterable[str]):
+        return select(UserORM).where(UserORM.email.in_(list(emails)))
+
     def get_by_email(self, email: str) -> UserORM | None:
-        return self.session.query(UserORM).filter(UserORM.email == email).first()
+        return self.session.execute(self.by_email_statement(email)).scalars().first()
+
+    def list_by_emails(self, emails: Iterable[str]) -> List[UserORM]:
+        return list(self.session.execute(self.by_emails_statement(emails)).scalars())
 
     def get_by_id(self, user_id: UUID) -> UserORM | None:
         return self.session.query(UserORM).filter(UserORM.id == user_id).first()
@@ -18,3 +30,10 @@ class UserRepository:
     def get_role_by_email(self, email: str) -> UserRole | None:
         user = self.get_by_email(email)
         return user.role if user else None
+
+    def update_role(self, email: str, role: UserRole) -> UserORM | None:
+        user = self.get_by_email(email)
+        if user:
+            user.role = role
+            self.session.flush()
+        return user
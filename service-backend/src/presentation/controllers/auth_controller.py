@@ -1,29 +1,29 @@
 from fastapi import APIRouter, Depends, Header, Request
-from sqlalchemy.orm import Session
-import jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta, timezone
 import os
 
-from src.infrastructure.database import get_db
-from src.infrastructure.repositories.user_repository import UserRepository
-from src.application.services.auth_service import AuthService
+from src.infrastructure.database import get_async_db
+from src.infrastructure.repositories.async_user_repository import AsyncUserRepository
+from src.infrastructure.cache.user_cache import get_user_cache
+from src.application.services.auth_service import AsyncAuthService
 from src.application.dtos.auth_dtos import LoginRequest, LoginData, UserData
-from src.application.dtos.api_response import ApiResponse
-from src.core.auth import extract_user_from_token
+from src.presentation.utils.json_response import success_json
+from src.application.exceptions import UserNotFoundError
+from src.core.auth import extract_user_from_token, get_token_verifier
 
 router = APIRouter(tags=["Auth"])
 
-JWT_SECRET = os.getenv("JWT_SECRET", "your_jwt_secret_here_change_in_prod")
-JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 JWT_EXPIRATION_HOURS = int(os.getenv("JWT_EXPIRATION_HOURS", "24"))
 
 
 @router.post("/auth/login")
-async def login(request_obj: Request, request: LoginRequest, session: Session = Depends(get_db)):
+async def login(request_obj: Request, request: LoginRequest, session: AsyncSession = Depends(get_async_db)):
     request_id = getattr(request_obj.state, 'request_id', None)
     
-    auth_service = AuthService(session)
-    user = auth_service.authenticate(request.email, request.password)
+    # Busca async e bcrypt no executor dedicado: o event loop segue atendendo outras requisições
+    auth_service = AsyncAuthService(session)
+    user = await auth_service.authenticate(request.email, request.password)
     
     now = datetime.now(timezone.utc)
     payload = {
@@ -35,7 +35,7 @@ async def login(request_obj: Request, request: LoginRequest, session: Session =
         "exp": now + timedelta(hours=JWT_EXPIRATION_HOURS)
     }
 
-    token = jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    token = get_token_verifier().issue(payload)
 
     login_data = LoginData(
         access_token=token,
@@ -48,13 +48,13 @@ async def login(request_obj: Request, request: LoginRequest, session: Session =
         )
     )
     
-    return ApiResponse.success_response(login_data.model_dump(), request_id)
+    return success_json(login_data.model_dump(), request_id)
 
 
 @router.get("/auth/me")
 async def get_current_user(
     request_obj: Request,
-    session: Session = Depends(get_db),
+    session: AsyncSession = Depends(get_async_db),
     authorization: str = Header(None)
 ):
     """
@@ -67,15 +67,16 @@ async def get_current_user(
     # Extrai email do token JWT
     token_payload = extract_user_from_token(authorization)
 
-    # Busca role e id no banco
-    user_repo = UserRepository(session)
-    user = user_repo.get_by_email(token_payload.email)
+    # Role e id pelo cache de usuários (o banco só é consultado em miss)
+    user = await get_user_cache().get_async(AsyncUserRepository(session), token_payload.email)
+    if not user:
+        raise UserNotFoundError(f"Usuário {token_payload.email} não encontrado")
 
     user_data = UserData(
         id=str(user.id),
         email=token_payload.email,
         name=token_payload.name,
-        role=user.role.value if user else None
+        role=user.role.value
     )
     
-    return ApiResponse.success_response(user_data.model_dump(), request_id)
+    return success_json(user_data.model_dump(), request_id)
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import logging
+from uuid import uuid4
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+
+from src.application.dtos.api_response import ApiResponse
+from src.core.auth import extract_user_from_token
+from src.infrastructure.idempotency_store import (
+    get_idempotency_store, IdempotencyConflictError, IdempotencyKeyReusedError, StoredResponse
+)
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = {"POST", "PUT"}
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+
+# POSTs que só leem/calculam: repetir é seguro e gravar a resposta só a deixaria velha
+READ_ONLY_ROUTES = {
+    ("POST", "/auth/login"),
+    ("POST", "/releases/calculate-score"),
+    ("POST", "/releases/calculate-score:batch"),
+    ("POST", "/releases/checklist:batch"),
+}
+
+
+def _actor(authorization: str) -> str:
+    """Email do token; token inválido fica escopado pelo próprio header (a rota responde 401)"""
+    try:
+        return extract_user_from_token(authorization).email
+    except HTTPException:
+        return "auth:" + hashlib.sha256(authorization.encode()).hexdigest()
+
+
+def _error(request: Request, status_code: int, code: str, message: str) -> JSONResponse:
+    request_id = getattr(request.state, 'request_id', str(uuid4()))
+    response = ApiResponse.error_response(code=code, message=message, request_id=request_id)
+    return JSONResponse(status_code=status_code, content=response.model_dump(exclude_none=True))
+
+
+async def idempotency_middleware(request: Request, call_next):
+    """
+    Idempotência para POST/PUT autenticados com header Idempotency-Key.
+
+    A chave é escopada por ator + método + rota. A primeira requisição reserva a
+    chave; respostas 2xx JSON são gravadas e devolvidas nas repetições
+    (header Idempotent-Replayed). Repetição com outro corpo recebe 422. Erros
+    liberam a reserva para nova tentativa. Rotas de READ_ONLY_ROUTES ficam de fora.
+    """
+    client_key = request.headers.get(IDEMPOTENCY_HEADER)
+    authorization = request.headers.get("Authorization")
+    method, path = request.method, request.url.path
+    if (method not in IDEMPOTENT_METHODS or not client_key or not authorization
+            or (method, path) in READ_ONLY_ROUTES):
+        return await call_next(request)
+
+    if len(client_key) > MAX_KEY_LENGTH:
+        return _error(request, status.HTTP_400_BAD_REQUEST, "INVALID_IDEMPOTENCY_KEY",
+                      f"{IDEMPOTENCY_HEADER} deve ter no máximo {MAX_KEY_LENGTH} caracteres")
+
+    store = get_idempotency_store()
+    key = store.scoped_key(_actor(authorization), method, path, client_key)
+    body = await request.body()
+
+    # Starlette 0.27: o corpo já lido precisa ser reentregue à rota
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    request._receive = receive
+
+    try:
+        claim = await run_in_threadpool(store.begin, key, method, path, store.request_hash(body))
+    except IdempotencyConflictError as e:
+        return _error(request, status.HTTP_409_CONFLICT, "IDEMPOTENCY_CONFLICT", str(e))
+    except IdempotencyKeyReusedError as e:
+        return _error(request, status.HTTP_422_UNPROCESSABLE_ENTITY, "IDEMPOTENCY_KEY_REUSED", str(e))
+    if isinstance(claim, StoredResponse):
+        return JSONResponse(status_code=claim.status_code, content=claim.body,
+                            headers={"Idempotent-Replayed": "true"})
+
+    try:
+        response = await call_next(request)
+    except Exception:
+        await run_in_threadpool(store.release, claim)
+        raise
+
+    content_type = response.headers.get("content-type", "")
+    if not (200 <= response.status_code < 300 and content_type.startswith("application/json")):
+        await run_in_threadpool(store.release, claim)
+        return response
+
+    raw = b"".join([chunk async for chunk in response.body_iterator])
+    try:
+        await run_in_threadpool(store.complete, claim, method, path, response.status_code, json.loads(raw))
+    except Exception:
+        # A operação já foi feita; a reserva expira sozinha após o lock_ttl
+        logger.exception("Falha ao gravar resposta idempotente de %s %s", method, path)
+
+    return Response(content=raw, status_code=response.status_code,
+                    headers=dict(response.headers), media_type=response.media_type)
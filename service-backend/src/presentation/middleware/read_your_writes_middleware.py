@@ -0,0 +1,13 @@
+from fastapi import Request
+from src.infrastructure.read_routing import record_write, request_wrote
+
+
+async def read_your_writes_middleware(request: Request, call_next):
+    """
+    Marca o cliente após uma requisição bem-sucedida que efetivamente gravou no banco
+    (commit com alterações, ver track_writes) para que as próximas leituras usem o primário
+    """
+    response = await call_next(request)
+    if response.status_code < 400 and request_wrote(request):
+        record_write(request)
+    return response
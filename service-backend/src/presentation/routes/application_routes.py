@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from uuid import UUID
+from typing import Optional
 from src.infrastructure.database import get_db
 from src.application.usecases.application_usecase import ApplicationUseCase
 from src.application.dtos.application_dtos import ApplicationRequest, ApplicationResponse
-from src.application.dtos.api_response import ApiResponse
+from src.presentation.utils.json_response import dump_models, success_json
+from src.infrastructure.repositories.keyset import InvalidCursorError
+from src.infrastructure.repositories.counting import CountMode
 
 router = APIRouter(prefix="/applications", tags=["Applications"])
 
@@ -14,7 +17,7 @@ def create_application(request: ApplicationRequest, db = Depends(get_db)):
         use_case = ApplicationUseCase(db)
         result = use_case.create(request)
         dto = ApplicationResponse.from_orm(result)
-        return ApiResponse.success_response(dto.model_dump(by_alias=True), None).model_dump()
+        return success_json(dto.model_dump(by_alias=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -27,7 +30,7 @@ def get_application(app_id: UUID, db = Depends(get_db)):
         use_case = ApplicationUseCase(db)
         result = use_case.get_by_id(app_id)
         dto = ApplicationResponse.from_orm(result)
-        return ApiResponse.success_response(dto.model_dump(by_alias=True), None).model_dump()
+        return success_json(dto.model_dump(by_alias=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
@@ -35,17 +38,23 @@ def get_application(app_id: UUID, db = Depends(get_db)):
 
 
 @router.get("", response_model=dict)
-def list_applications(skip: int = Query(0), limit: int = Query(100), db = Depends(get_db)):
+def list_applications(skip: int = Query(0), limit: int = Query(100), cursor: Optional[str] = Query(None),
+                      include_total: bool = Query(True, alias="includeTotal"),
+                      count_mode: CountMode = Query(CountMode.EXACT, alias="countMode"), db = Depends(get_db)):
     try:
         use_case = ApplicationUseCase(db)
-        result = use_case.list_all(skip, limit)
+        result = use_case.list_all(skip, limit, cursor, include_total, count_mode)
         response_data = {
-            'data': [ApplicationResponse.from_orm(r).model_dump(by_alias=True) for r in result.data],
+            'data': dump_models(result.data),
             'total': result.total,
+            'totalExact': result.total_exact,
             'skip': result.skip,
-            'limit': result.limit
+            'limit': result.limit,
+            'nextCursor': result.next_cursor
         }
-        return ApiResponse.success_response(response_data, None).model_dump()
+        return success_json(response_data)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -56,7 +65,7 @@ def update_application(app_id: UUID, request: ApplicationRequest, db = Depends(g
         use_case = ApplicationUseCase(db)
         result = use_case.update(app_id, request)
         dto = ApplicationResponse.from_orm(result)
-        return ApiResponse.success_response(dto.model_dump(by_alias=True), None).model_dump()
+        return success_json(dto.model_dump(by_alias=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
@@ -68,7 +77,7 @@ def delete_application(app_id: UUID, db = Depends(get_db)):
     try:
         use_case = ApplicationUseCase(db)
         use_case.delete(app_id)
-        return ApiResponse.success_response({"deleted": True}, None).model_dump()
+        return success_json({"deleted": True})
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
@@ -1,17 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Body, Header, Query
 from uuid import UUID
 from typing import Optional
-from src.infrastructure.database import get_db
+from datetime import datetime
+from src.infrastructure.database import get_db, get_async_read_db
+from src.application.usecases.async_release_usecase import AsyncReleaseUseCase
 from src.application.usecases.approval_usecase import ApprovalUseCase
 from src.application.dtos.approval_dtos import ApprovalRequest, ApprovalResponse
-from src.application.dtos.api_response import ApiResponse
+from src.presentation.utils.json_response import dump_models, success_json
 from src.presentation.utils.auth import extract_user_from_token
+from src.infrastructure.repositories.keyset import InvalidCursorError
+from src.infrastructure.repositories.counting import CountMode
+from src.infrastructure.repositories.approval_repository import ApprovalFilter
 
 router = APIRouter(prefix="/approvals", tags=["Approvals"])
 
 
 @router.get("/pending/current", response_model=dict)
-def list_pending_releases_current_user(skip: int = Query(0), limit: int = Query(10), authorization: str = Header(None), db = Depends(get_db)):
+async def list_pending_releases_current_user(skip: int = Query(0), limit: int = Query(10), authorization: str = Header(None), db = Depends(get_async_read_db)):
     """Lista releases PENDENTES de aprovação do usuário logado"""
     try:
         if not authorization:
@@ -21,16 +26,16 @@ def list_pending_releases_current_user(skip: int = Query(0), limit: int = Query(
         token_payload = extract_user_from_token(authorization)
         approver_email = token_payload.email
         
-        from src.application.usecases.release_usecase import ReleaseUseCase
-        use_case = ReleaseUseCase(db)
-        result = use_case.list_pending_for_user(approver_email, skip, limit)
+        use_case = AsyncReleaseUseCase(db)
+        result = await use_case.list_pending_for_user(approver_email, skip, limit)
         response_data = {
-            'data': [r.model_dump(by_alias=True) for r in result.data],
+            'data': dump_models(result.data),
             'total': result.total,
+            'totalExact': result.total_exact,
             'skip': result.skip,
             'limit': result.limit
         }
-        return ApiResponse.success_response(response_data, None).model_dump()
+        return success_json(response_data)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
     except Exception as e:
@@ -38,7 +43,7 @@ def list_pending_releases_current_user(skip: int = Query(0), limit: int = Query(
 
 
 @router.get("/approved/current", response_model=dict)
-def list_approved_releases_current_user(skip: int = Query(0), limit: int = Query(10), authorization: str = Header(None), db = Depends(get_db)):
+async def list_approved_releases_current_user(skip: int = Query(0), limit: int = Query(10), cursor: Optional[str] = Query(None), authorization: str = Header(None), db = Depends(get_async_read_db)):
     """Lista releases APROVADOS pelo usuário logado"""
     try:
         if not authorization:
@@ -48,16 +53,19 @@ def list_approved_releases_current_user(skip: int = Query(0), limit: int = Query
         token_payload = extract_user_from_token(authorization)
         approver_email = token_payload.email
         
-        from src.application.usecases.release_usecase import ReleaseUseCase
-        use_case = ReleaseUseCase(db)
-        result = use_case.list_approved_by_user(approver_email, skip, limit)
+        use_case = AsyncReleaseUseCase(db)
+        result = await use_case.list_approved_by_user(approver_email, skip, limit, cursor)
         response_data = {
-            'data': [r.model_dump(by_alias=True) for r in result.data],
+            'data': dump_models(result.data),
             'total': result.total,
+            'totalExact': result.total_exact,
             'skip': result.skip,
-            'limit': result.limit
+            'limit': result.limit,
+            'nextCursor': result.next_cursor
         }
-        return ApiResponse.success_response(response_data, None).model_dump()
+        return success_json(response_data)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
     except Exception as e:
@@ -65,7 +73,7 @@ def list_approved_releases_current_user(skip: int = Query(0), limit: int = Query
 
 
 @router.get("/rejected/current", response_model=dict)
-def list_rejected_releases_current_user(skip: int = Query(0), limit: int = Query(10), authorization: str = Header(None), db = Depends(get_db)):
+async def list_rejected_releases_current_user(skip: int = Query(0), limit: int = Query(10), cursor: Optional[str] = Query(None), authorization: str = Header(None), db = Depends(get_async_read_db)):
     """Lista releases REJEITADOS pelo usuário logado"""
     try:
         if not authorization:
@@ -75,16 +83,19 @@ def list_rejected_releases_current_user(skip: int = Query(0), limit: int = Query
         token_payload = extract_user_from_token(authorization)
         approver_email = token_payload.email
         
-        from src.application.usecases.release_usecase import ReleaseUseCase
-        use_case = ReleaseUseCase(db)
-        result = use_case.list_rejected_by_user(approver_email, skip, limit)
+        use_case = AsyncReleaseUseCase(db)
+        result = await use_case.list_rejected_by_user(approver_email, skip, limit, cursor)
         response_data = {
-            'data': [r.model_dump(by_alias=True) for r in result.data],
+            'data': dump_models(result.data),
             'total': result.total,
+            'totalExact': result.total_exact,
             'skip': result.skip,
-            'limit': result.limit
+            'limit': result.limit,
+            'nextCursor': result.next_cursor
         }
-        return ApiResponse.success_response(response_data, None).model_dump()
+        return success_json(response_data)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
     except Exception as e:
@@ -92,7 +103,15 @@ def list_rejected_releases_current_user(skip: int = Query(0), limit: int = Query
 
 
 @router.get("", response_model=dict)
-def list_approvals(skip: int = 0, limit: int = 100, authorization: str = Header(None), db = Depends(get_db)):
+def list_approvals(skip: int = 0, limit: int = 100, cursor: Optional[str] = Query(None),
+                   include_total: bool = Query(True, alias="includeTotal"),
+                   count_mode: CountMode = Query(CountMode.EXACT, alias="countMode"),
+                   release_id: Optional[UUID] = Query(None),
+                   approver_email: Optional[str] = Query(None),
+                   outcome: Optional[str] = Query(None, description="APPROVED, REJECTED ou PENDING"),
+                   created_from: Optional[datetime] = Query(None, description="Início (inclusivo) do intervalo de criação"),
+                   created_to: Optional[datetime] = Query(None, description="Fim (exclusivo) do intervalo de criação"),
+                   authorization: str = Header(None), db = Depends(get_db)):
     try:
         if not authorization:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token não fornecido")
@@ -100,9 +119,21 @@ def list_approvals(skip: int = 0, limit: int = 100, authorization: str = Header(
         token_payload = extract_user_from_token(authorization)
         actor_email = token_payload.email
         use_case = ApprovalUseCase(db, actor_email)
-        results = use_case.list_all(skip, limit)
-        dtos = [r.model_dump(by_alias=True) for r in results]
-        return ApiResponse.success_response(dtos, None).model_dump()
+        filters = ApprovalFilter(release_id, approver_email, outcome, created_from, created_to)
+        result = use_case.list_all(skip, limit, cursor, include_total, count_mode, filters)
+        response_data = {
+            'data': dump_models(result.data),
+            'total': result.total,
+            'totalExact': result.total_exact,
+            'skip': result.skip,
+            'limit': result.limit,
+            'nextCursor': result.next_cursor
+        }
+        return success_json(response_data)
+    except HTTPException:
+        raise
+    except (InvalidCursorError, ValueError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -117,7 +148,7 @@ def create_approval(release_id: UUID, request: ApprovalRequest, authorization: s
         actor_email = token_payload.email
         use_case = ApprovalUseCase(db, actor_email)
         result = use_case.create(release_id, request.approver_email, request)
-        return ApiResponse.success_response(result.model_dump(by_alias=True), None).model_dump()
+        return success_json(result.model_dump(by_alias=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -134,7 +165,7 @@ def get_approval(approval_id: UUID, authorization: str = Header(None), db = Depe
         actor_email = token_payload.email
         use_case = ApprovalUseCase(db, actor_email)
         result = use_case.get_by_id(approval_id)
-        return ApiResponse.success_response(result.model_dump(by_alias=True), None).model_dump()
+        return success_json(result.model_dump(by_alias=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
@@ -154,7 +185,7 @@ def approve_release(release_id: UUID, authorization: str = Header(None), body: O
         
         use_case = ApprovalUseCase(db, approver_email)
         result = use_case.approve(release_id, approver_email, notes)
-        return ApiResponse.success_response(result.model_dump(by_alias=True), None).model_dump()
+        return success_json(result.model_dump(by_alias=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -174,7 +205,7 @@ def reject_release(release_id: UUID, authorization: str = Header(None), body: Op
         
         use_case = ApprovalUseCase(db, approver_email)
         result = use_case.reject(release_id, approver_email, notes)
-        return ApiResponse.success_response(result.model_dump(by_alias=True), None).model_dump()
+        return success_json(result.model_dump(by_alias=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -192,7 +223,7 @@ def update_approval(approval_id: UUID, body: dict = Body(...), authorization: st
         actor_email = token_payload.email
         use_case = ApprovalUseCase(db, actor_email)
         result = use_case.update_outcome(approval_id, body.get('outcome'), body.get('notes'))
-        return ApiResponse.success_response(result.model_dump(by_alias=True), None).model_dump()
+        return success_json(result.model_dump(by_alias=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -209,8 +240,8 @@ def list_approvals_by_release(release_id: UUID, authorization: str = Header(None
         actor_email = token_payload.email
         use_case = ApprovalUseCase(db, actor_email)
         results = use_case.list_by_release(release_id)
-        dtos = [r.model_dump(by_alias=True) for r in results]
-        return ApiResponse.success_response(dtos, None).model_dump()
+        dtos = dump_models(results)
+        return success_json(dtos)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -220,7 +251,7 @@ def list_pending_by_approver(approver_email: str, db = Depends(get_db)):
     try:
         use_case = ApprovalUseCase(db)
         results = use_case.list_pending_by_approver(approver_email)
-        dtos = [r.model_dump(by_alias=True) for r in results]
-        return ApiResponse.success_response(dtos, None).model_dump()
+        dtos = dump_models(results)
+        return success_json(dtos)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
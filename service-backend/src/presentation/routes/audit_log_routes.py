@@ -1,8 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from uuid import UUID
-from src.infrastructure.database import get_db
+from typing import Optional
+from src.infrastructure.database import get_read_db
 from src.application.usecases.audit_log_usecase import AuditLogUseCase
-from src.application.dtos.api_response import ApiResponse
+from src.presentation.utils.json_response import dump_models, success_json
+from src.infrastructure.repositories.keyset import InvalidCursorError
+from src.infrastructure.repositories.counting import CountMode
 
 router = APIRouter(prefix="/audit-logs", tags=["Audit Logs"])
 
@@ -11,49 +14,74 @@ router = APIRouter(prefix="/audit-logs", tags=["Audit Logs"])
 def list_audit_logs(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1),
-    db = Depends(get_db)
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True, alias="includeTotal"),
+    count_mode: CountMode = Query(CountMode.EXACT, alias="countMode"),
+    include_payload: bool = Query(True, alias="includePayload"),
+    db = Depends(get_read_db)
 ):
     try:
         use_case = AuditLogUseCase(db)
-        result = use_case.list_all(skip, limit)
+        result = use_case.list_all(skip, limit, cursor, include_total, count_mode, include_payload)
         response_data = {
-            'data': [r.model_dump(by_alias=True) for r in result.data],
+            'data': dump_models(result.data),
             'total': result.total,
+            'totalExact': result.total_exact,
             'skip': result.skip,
-            'limit': result.limit
+            'limit': result.limit,
+            'nextCursor': result.next_cursor
         }
-        return ApiResponse.success_response(response_data, None).model_dump()
+        return success_json(response_data)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
 @router.get("/entity/{entity_type}/{entity_id}", response_model=dict)
-def list_audit_logs_by_entity(entity_type: str, entity_id: UUID, skip: int = Query(0), limit: int = Query(100), db = Depends(get_db)):
+def list_audit_logs_by_entity(entity_type: str, entity_id: UUID, skip: int = Query(0), limit: int = Query(100),
+                              cursor: Optional[str] = Query(None), include_total: bool = Query(True, alias="includeTotal"),
+                              count_mode: CountMode = Query(CountMode.EXACT, alias="countMode"),
+                              include_payload: bool = Query(True, alias="includePayload"),
+                              db = Depends(get_read_db)):
     try:
         use_case = AuditLogUseCase(db)
-        result = use_case.list_by_entity(entity_type, entity_id, skip, limit)
+        result = use_case.list_by_entity(entity_type, entity_id, skip, limit, cursor, include_total, count_mode,
+                                         include_payload)
         response_data = {
-            'data': [r.model_dump(by_alias=True) for r in result.data],
+            'data': dump_models(result.data),
             'total': result.total,
+            'totalExact': result.total_exact,
             'skip': result.skip,
-            'limit': result.limit
+            'limit': result.limit,
+            'nextCursor': result.next_cursor
         }
-        return ApiResponse.success_response(response_data, None).model_dump()
+        return success_json(response_data)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
 @router.get("/actor/{actor_email}", response_model=dict)
-def list_audit_logs_by_actor(actor_email: str, skip: int = Query(0), limit: int = Query(100), db = Depends(get_db)):
+def list_audit_logs_by_actor(actor_email: str, skip: int = Query(0), limit: int = Query(100),
+                             cursor: Optional[str] = Query(None), include_total: bool = Query(True, alias="includeTotal"),
+                             count_mode: CountMode = Query(CountMode.EXACT, alias="countMode"),
+                             include_payload: bool = Query(True, alias="includePayload"),
+                             db = Depends(get_read_db)):
     try:
         use_case = AuditLogUseCase(db)
-        result = use_case.list_by_actor(actor_email, skip, limit)
+        result = use_case.list_by_actor(actor_email, skip, limit, cursor, include_total, count_mode, include_payload)
         response_data = {
-            'data': [r.model_dump(by_alias=True) for r in result.data],
+            'data': dump_models(result.data),
             'total': result.total,
+            'totalExact': result.total_exact,
             'skip': result.skip,
-            'limit': result.limit
+            'limit': result.limit,
+            'nextCursor': result.next_cursor
         }
-        return ApiResponse.success_response(response_data, None).model_dump()
+        return success_json(response_data)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
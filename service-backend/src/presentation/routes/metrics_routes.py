@@ -0,0 +1,52 @@
+from fastapi import APIRouter, HTTPException, status, Header
+from src.presentation.utils.json_response import success_json
+from src.infrastructure.pool_metrics import get_pool_metrics
+from src.infrastructure.cache.application_cache import get_application_cache
+from src.infrastructure.cache.user_cache import get_user_cache
+from src.infrastructure.audit_writer import get_audit_writer
+from src.core.auth import extract_user_from_token, get_token_verifier
+from src.domain.services.scoring_service import ScoringService
+
+# Estado interno do processo (saturação de pools, caches, falhas de auditoria): exige token
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("/db-pool", response_model=dict)
+def get_db_pool_metrics(authorization: str = Header(None)):
+    """Estado e latências dos pools de conexão (primário, réplica e async)"""
+    try:
+        extract_user_from_token(authorization)
+        return success_json(get_pool_metrics())
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/caches", response_model=dict)
+def get_cache_metrics(authorization: str = Header(None)):
+    """Tamanho e hits/misses dos caches em memória do processo"""
+    try:
+        extract_user_from_token(authorization)
+        return success_json({
+            'applications': get_application_cache().stats(),
+            'users': get_user_cache().stats(),
+            'evidenceScores': ScoringService.cache_stats(),
+            'verifiedTokens': get_token_verifier().cache_stats()
+        })
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/audit-writer", response_model=dict)
+def get_audit_writer_metrics(authorization: str = Header(None)):
+    """Modo do AuditWriter, registros em fila e gravados/falhos em lote"""
+    try:
+        extract_user_from_token(authorization)
+        return success_json(get_audit_writer().stats())
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
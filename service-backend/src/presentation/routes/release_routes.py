@@ -1,15 +1,23 @@
+import os
 from fastapi import APIRouter, Depends, HTTPException, status, Body, Query, Header
 from uuid import UUID
-from src.infrastructure.database import get_db
+from typing import Optional
+from src.infrastructure.database import get_db, get_read_db, get_async_read_db
 from src.application.usecases.release_usecase import ReleaseUseCase
+from src.application.usecases.async_release_usecase import AsyncReleaseUseCase
 from src.application.usecases.release_event_usecase import ReleaseEventUseCase
 from src.application.dtos.release_dtos import ReleaseRequest, ReleaseResponse
-from src.application.dtos.api_response import ApiResponse
+from src.presentation.utils.json_response import dump_models, success_json
+from src.infrastructure.repositories.keyset import InvalidCursorError
+from src.infrastructure.repositories.counting import CountMode
 from src.core.auth import extract_user_from_token
 from src.domain.services.scoring_service import ScoringService
 
 router = APIRouter(prefix="/releases", tags=["Releases"])
 
+CHECKLIST_BATCH_MAX = int(os.getenv("CHECKLIST_BATCH_MAX", "200"))
+SCORE_BATCH_MAX = int(os.getenv("SCORE_BATCH_MAX", "10000"))
+
 
 @router.post("", response_model=dict)
 def create_release(request: ReleaseRequest, db = Depends(get_db), authorization: str = Header(None)):
@@ -18,7 +26,7 @@ def create_release(request: ReleaseRequest, db = Depends(get_db), authorization:
         actor_email = token_payload.email
         use_case = ReleaseUseCase(db, actor_email)
         result = use_case.create(request)
-        return ApiResponse.success_response(result.model_dump(by_alias=True), None).model_dump()
+        return success_json(result.model_dump(by_alias=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -26,22 +34,28 @@ def create_release(request: ReleaseRequest, db = Depends(get_db), authorization:
 
 
 @router.get("", response_model=dict)
-def list_all_releases(skip: int = Query(0), limit: int = Query(100), authorization: str = Header(None), db = Depends(get_db)):
+async def list_all_releases(skip: int = Query(0), limit: int = Query(100), cursor: Optional[str] = Query(None),
+                            include_total: bool = Query(True, alias="includeTotal"),
+                            count_mode: CountMode = Query(CountMode.EXACT, alias="countMode"),
+                            authorization: str = Header(None), db = Depends(get_async_read_db)):
     try:
         if not authorization:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token não fornecido")
         
-        token_payload = extract_user_from_token(authorization)
-        actor_email = token_payload.email
-        use_case = ReleaseUseCase(db, actor_email)
-        result = use_case.list_all(skip, limit)
+        extract_user_from_token(authorization)
+        use_case = AsyncReleaseUseCase(db)
+        result = await use_case.list_all(skip, limit, cursor, include_total, count_mode)
         response_data = {
-            'data': [r.model_dump(by_alias=True) for r in result.data],
+            'data': dump_models(result.data),
             'total': result.total,
+            'totalExact': result.total_exact,
             'skip': result.skip,
-            'limit': result.limit
+            'limit': result.limit,
+            'nextCursor': result.next_cursor
         }
-        return ApiResponse.success_response(response_data, None).model_dump()
+        return success_json(response_data)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -56,7 +70,7 @@ def get_release(release_id: UUID, authorization: str = Header(None), db = Depend
         actor_email = token_payload.email
         use_case = ReleaseUseCase(db, actor_email)
         result = use_case.get_by_id(release_id)
-        return ApiResponse.success_response(result.model_dump(by_alias=True), None).model_dump()
+        return success_json(result.model_dump(by_alias=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
@@ -64,22 +78,28 @@ def get_release(release_id: UUID, authorization: str = Header(None), db = Depend
 
 
 @router.get("/application/{app_id}", response_model=dict)
-def list_releases_by_application(app_id: UUID, skip: int = Query(0), limit: int = Query(100), authorization: str = Header(None), db = Depends(get_db)):
+async def list_releases_by_application(app_id: UUID, skip: int = Query(0), limit: int = Query(100), cursor: Optional[str] = Query(None),
+                                        include_total: bool = Query(True, alias="includeTotal"),
+                                        count_mode: CountMode = Query(CountMode.EXACT, alias="countMode"),
+                                        authorization: str = Header(None), db = Depends(get_async_read_db)):
     try:
         if not authorization:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token não fornecido")
         
-        token_payload = extract_user_from_token(authorization)
-        actor_email = token_payload.email
-        use_case = ReleaseUseCase(db, actor_email)
-        result = use_case.list_by_application(app_id, skip, limit)
+        extract_user_from_token(authorization)
+        use_case = AsyncReleaseUseCase(db)
+        result = await use_case.list_by_application(app_id, skip, limit, cursor, include_total, count_mode)
         response_data = {
-            'data': [r.model_dump(by_alias=True) for r in result.data],
+            'data': dump_models(result.data),
             'total': result.total,
+            'totalExact': result.total_exact,
             'skip': result.skip,
-            'limit': result.limit
+            'limit': result.limit,
+            'nextCursor': result.next_cursor
         }
-        return ApiResponse.success_response(response_data, None).model_dump()
+        return success_json(response_data)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -91,7 +111,7 @@ def update_release(release_id: UUID, request: ReleaseRequest, db = Depends(get_d
         actor_email = token_payload.email
         use_case = ReleaseUseCase(db, actor_email)
         result = use_case.update(release_id, request)
-        return ApiResponse.success_response(result.model_dump(by_alias=True), None).model_dump()
+        return success_json(result.model_dump(by_alias=True))
     except ValueError as e:
         error_msg = str(e)
         # Retornar 409 para conflitos de versão
@@ -112,7 +132,7 @@ def update_release_status(release_id: UUID, status: str, authorization: str = He
         actor_email = token_payload.email
         use_case = ReleaseUseCase(db, actor_email)
         result = use_case.update_status(release_id, status)
-        return ApiResponse.success_response(result.model_dump(by_alias=True), None).model_dump()
+        return success_json(result.model_dump(by_alias=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
@@ -129,7 +149,7 @@ def delete_release(release_id: UUID, authorization: str = Header(None), db = Dep
         actor_email = token_payload.email
         use_case = ReleaseUseCase(db, actor_email)
         use_case.delete(release_id)
-        return ApiResponse.success_response({"deleted": True}, None).model_dump()
+        return success_json({"deleted": True})
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
@@ -137,25 +157,23 @@ def delete_release(release_id: UUID, authorization: str = Header(None), db = Dep
 
 
 @router.get("/{release_id}/timeline", response_model=dict)
-def get_release_timeline(release_id: UUID, authorization: str = Header(None), db = Depends(get_db)):
+def get_release_timeline(release_id: UUID, authorization: str = Header(None), db = Depends(get_read_db)):
     try:
         if not authorization:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token não fornecido")
         
         use_case = ReleaseEventUseCase(db)
         events = use_case.get_timeline(release_id)
-        dtos = [e.model_dump(by_alias=True) for e in events]
-        return ApiResponse.success_response(dtos, None).model_dump()
+        dtos = dump_models(events)
+        return success_json(dtos)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
 @router.post("/{release_id}/promote", response_model=dict)
-def promote_release(release_id: UUID, body: dict = Body(...), db = Depends(get_db), authorization: str = Header(None), idempotency_key: str = Header(None)):
+def promote_release(release_id: UUID, body: dict = Body(...), db = Depends(get_db), authorization: str = Header(None)):
+    # Idempotency-Key é tratado pelo idempotency_middleware
     try:
-        from src.infrastructure.repositories.idempotency_key_repository import IdempotencyKeyRepository
-        import json
-        
         target_env = body.get('targetEnv')
         token_payload = extract_user_from_token(authorization)
         actor_email = token_payload.email
@@ -163,14 +181,6 @@ def promote_release(release_id: UUID, body: dict = Body(...), db = Depends(get_d
         if not target_env:
             raise ValueError("targetEnv é obrigatório")
         
-        # IDEMPOTENCY: Verificar se requisição já foi processada
-        idempotency_repo = IdempotencyKeyRepository(db)
-        if idempotency_key:
-            existing = idempotency_repo.get_by_key(idempotency_key)
-            if existing:
-                # Retornar resposta anterior
-                return json.loads(existing.response_body)
-        
         use_case = ReleaseUseCase(db, actor_email)
         
         # Promote release (updates environment in place, not creating new)
@@ -183,19 +193,9 @@ def promote_release(release_id: UUID, body: dict = Body(...), db = Depends(get_d
             'status': promoted_release.model_dump(by_alias=True)['status']
         }
         
-        response = ApiResponse.success_response(response_data, None).model_dump()
-        
-        # IDEMPOTENCY: Armazenar resposta
-        if idempotency_key:
-            idempotency_repo.create(
-                key=idempotency_key,
-                request_method="POST",
-                request_path=f"/releases/{release_id}/promote",
-                response_body=response,
-                status_code="200"
-            )
-        
-        return response
+        return success_json(response_data)
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -223,7 +223,7 @@ def reject_release(release_id: UUID, body: dict = Body(default={}, description="
         use_case = ReleaseUseCase(db, actor_email)
         rejected_release = use_case.reject_release(release_id, notes)
         
-        return ApiResponse.success_response(rejected_release.model_dump(by_alias=True), None).model_dump()
+        return success_json(rejected_release.model_dump(by_alias=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -252,7 +252,7 @@ def deploy_release(release_id: UUID, body: dict = Body(default={}, description="
         use_case = ReleaseUseCase(db, actor_email)
         deployed_release = use_case.deploy_release(release_id, notes)
         
-        return ApiResponse.success_response(deployed_release.model_dump(by_alias=True), None).model_dump()
+        return success_json(deployed_release.model_dump(by_alias=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -268,72 +268,78 @@ def calculate_evidence_score(body: dict = Body(...)):
             raise ValueError("evidenceUrl é obrigatória")
         
         score = ScoringService.calculate_score(evidence_url)
-        return ApiResponse.success_response({
+        return success_json({
             'evidenceUrl': evidence_url,
             'score': score
-        }, None).model_dump()
+        })
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
-@router.get("/{release_id}/checklist", response_model=dict)
-def get_pre_launch_checklist(release_id: UUID, authorization: str = Header(None), db = Depends(get_db)):
-    """Retorna checklist de pré-lançamento para PRE_PROD → PROD"""
+@router.post("/calculate-score:batch", response_model=dict)
+def calculate_evidence_scores(body: dict = Body(...)):
+    """Calcula scores determinísticos para várias evidence URLs em uma chamada"""
     try:
-        from src.domain.services.policy_service import get_policy_service
-        from src.infrastructure.repositories.approval_repository import ApprovalRepository
-        from src.infrastructure.repositories.release_repository import ReleaseRepository
+        evidence_urls = body.get('evidenceUrls')
+        if not isinstance(evidence_urls, list) or not evidence_urls:
+            raise ValueError("evidenceUrls deve ser uma lista não vazia")
+        if len(evidence_urls) > SCORE_BATCH_MAX:
+            raise ValueError(f"Máximo de {SCORE_BATCH_MAX} URLs por chamada")
+        if not all(isinstance(url, str) for url in evidence_urls):
+            raise ValueError("evidenceUrls deve conter apenas strings")
         
+        scores = ScoringService.calculate_scores(evidence_urls)
+        return success_json({
+            'data': [{'evidenceUrl': url, 'score': score} for url, score in zip(evidence_urls, scores)]
+        })
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.post("/checklist:batch", response_model=dict)
+def get_pre_launch_checklists(body: dict = Body(...), authorization: str = Header(None), db = Depends(get_read_db)):
+    """Retorna checklists de pré-lançamento de várias releases em uma chamada"""
+    try:
         token_payload = extract_user_from_token(authorization)
         
-        # Carregar release
-        release_repo = ReleaseRepository(db)
-        release = release_repo.get_by_id(release_id)
-        if not release:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Release {release_id} não encontrado")
-        
-        # Carregar policy
-        policy_service = get_policy_service()
-        min_approvals = policy_service.get_min_approvals()
-        min_score = policy_service.get_min_score()
-        
-        # Contar aprovações
-        approval_repo = ApprovalRepository(db)
-        approvals = approval_repo.list_by_release(release_id)
-        approved_count = len([a for a in approvals if a.outcome == 'APPROVED'])
-        
-        # Verificar freeze window
-        is_frozen = policy_service.is_frozen_for_env('PROD')
-        freeze_message = f"Janela de freeze ativa para PROD" if is_frozen else ""
+        release_ids = body.get('releaseIds')
+        if not isinstance(release_ids, list) or not release_ids:
+            raise ValueError("releaseIds deve ser uma lista não vazia")
+        if len(release_ids) > CHECKLIST_BATCH_MAX:
+            raise ValueError(f"Máximo de {CHECKLIST_BATCH_MAX} releases por chamada")
+        release_ids = [UUID(str(release_id)) for release_id in release_ids]
         
-        # Montar checklist
-        approvals_ok = approved_count >= min_approvals
-        evidence_ok = bool(release.evidence_url)
-        score_ok = release.evidence_score >= min_score
-        freeze_ok = not is_frozen
+        checklists, missing = ReleaseUseCase(db).get_checklists(release_ids)
+        return success_json({
+            'data': checklists,
+            'missing': missing
+        })
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/{release_id}/checklist", response_model=dict)
+def get_pre_launch_checklist(release_id: UUID, authorization: str = Header(None), db = Depends(get_read_db)):
+    """Retorna checklist de pré-lançamento para PRE_PROD → PROD"""
+    try:
+        token_payload = extract_user_from_token(authorization)
         
-        checklist = {
-            'approvalsOk': approvals_ok,
-            'evidenceOk': evidence_ok,
-            'scoreOk': score_ok,
-            'freezeOk': freeze_ok,
-            'ready': approvals_ok and evidence_ok and score_ok and freeze_ok,
-            'approvalCount': approved_count,
-            'minApprovals': min_approvals,
-            'evidenceUrl': release.evidence_url or '',
-            'score': release.evidence_score,
-            'minScore': min_score,
-            'isFrozen': is_frozen,
-            'freezeMessage': freeze_message
-        }
+        checklist = ReleaseUseCase(db).get_checklist(release_id)
+        if checklist is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Release {release_id} não encontrado")
         
-        return ApiResponse.success_response(checklist, None).model_dump()
+        return success_json(checklist)
     except HTTPException:
         raise
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
-
@@ -0,0 +1,50 @@
+import json
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from src.application.dtos.api_response import ApiResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson faz parte do requirements.txt
+    orjson = None
+
+
+def render_json(content: Any) -> bytes:
+    """
+    Serializa o conteúdo em uma única passada. Tipos nativos (datetime, UUID, Enum)
+    saem direto do orjson; o resto (DTOs, Decimal, set...) cai no jsonable_encoder,
+    com a mesma saída que o FastAPI produziria.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse renderizada com orjson, sem o jsonable_encoder do FastAPI na frente"""
+
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_type) -> TypeAdapter:
+    return TypeAdapter(List[model_type])
+
+
+def dump_models(models: Iterable) -> list:
+    """Dump (by_alias) de uma página de DTOs em uma única chamada ao pydantic-core"""
+    models = list(models)
+    if not models:
+        return []
+    return _list_adapter(type(models[0])).dump_python(models, by_alias=True)
+
+
+def success_json(data: Any, request_id: Optional[str] = None) -> FastJSONResponse:
+    """Envelope ApiResponse de sucesso renderizado direto para bytes"""
+    return FastJSONResponse(ApiResponse.success_body(data, request_id))
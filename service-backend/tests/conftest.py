@@ -1,8 +1,10 @@
 import pytest
+from fastapi import Request
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event, String, TypeDecorator
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 from sqlalchemy.dialects import postgresql
 import uuid
 
@@ -34,14 +36,21 @@ class SQLiteUUID(TypeDecorator):
 postgresql.UUID = SQLiteUUID
 
 from main import app
-from src.infrastructure.database import Base, get_db
+from src.infrastructure.database import Base, get_db, get_read_db, get_async_read_db
+from src.infrastructure.read_routing import track_writes
 from src.infrastructure.orm.user import UserORM
 
 
+@pytest.fixture
+def db_path(tmp_path):
+    # Em arquivo (não :memory:) para que a engine aiosqlite de get_async_read_db veja os mesmos dados
+    return tmp_path / "test.sqlite"
+
+
 @pytest.fixture(scope='function')
-def test_db():
+def test_db(db_path):
     engine = create_engine(
-        'sqlite:///:memory:',
+        f'sqlite:///{db_path}',
         connect_args={'check_same_thread': False},
         poolclass=StaticPool,
     )
@@ -63,11 +72,25 @@ def test_db():
 
 
 @pytest.fixture
-def client(test_db):
-    def override_get_db():
+def client(test_db, db_path):
+    # NullPool: o TestClient roda em outro event loop, nenhuma conexão aiosqlite fica entre requests
+    async_read_sessions = async_sessionmaker(create_async_engine(f'sqlite+aiosqlite:///{db_path}', poolclass=NullPool),
+                                             class_=AsyncSession, expire_on_commit=False)
+
+    def override_get_db(request: Request):
+        track_writes(test_db, request)
         return test_db
+
+    def override_get_read_db():
+        return test_db
+
+    async def override_get_async_read_db():
+        async with async_read_sessions() as db:
+            yield db
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_read_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_read_db
     yield TestClient(app)
     app.dependency_overrides.clear()
 
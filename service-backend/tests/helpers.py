@@ -1,4 +1,6 @@
+import jwt
 from src.application.services.auth_service import AuthService
+from src.core.auth import JWT_SECRET, JWT_ALGORITHM
 from src.infrastructure.orm.user import UserORM
 from src.domain.entities.user import UserRole
 
@@ -15,3 +17,9 @@ def create_test_user(db_session, email='teste@example.com', password='senha123')
     db_session.add(user)
     db_session.commit()
     return user
+
+
+def auth_header(email='teste@example.com', name='Teste User'):
+    """Header Authorization com um JWT válido para as rotas"""
+    token = jwt.encode({'email': email, 'name': name, 'sub': email}, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    return {'Authorization': f'Bearer {token}'}
@@ -0,0 +1,83 @@
+"""
+Testes do cache de metadados de applications
+"""
+from uuid import uuid4
+from sqlalchemy import event
+
+from src.core.cache import TTLCache
+from src.infrastructure.orm.application import ApplicationORM
+from src.infrastructure.repositories.application_repository import ApplicationRepository
+from src.infrastructure.cache.application_cache import ApplicationCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = TTLCache(max_entries=10, ttl_seconds=5, clock=clock)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        clock.now = 6
+        assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+def _app(test_db, name):
+    app = ApplicationORM(id=uuid4(), name=name, owner_team="team", repo_url="https://github.com/test/app")
+    test_db.add(app)
+    test_db.commit()
+    return app.id
+
+
+class TestApplicationCache:
+    def test_get_many_loads_misses_in_one_query(self, test_db):
+        ids = [_app(test_db, f"app-{i}") for i in range(3)]
+        cache = ApplicationCache()
+        repo = ApplicationRepository(test_db)
+
+        statements = []
+        engine = test_db.get_bind()
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            first = cache.get_many(repo, ids)
+            second = cache.get_many(repo, ids)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert {s.name for s in first.values()} == {"app-0", "app-1", "app-2"}
+        assert second == first
+        assert len(statements) == 1
+
+    def test_invalidate_after_rename(self, test_db):
+        from src.application.usecases.application_usecase import ApplicationUseCase
+        from src.application.dtos.application_dtos import ApplicationRequest
+        from src.infrastructure.cache.application_cache import get_application_cache
+
+        app_id = _app(test_db, "old-name")
+        repo = ApplicationRepository(test_db)
+        cache = get_application_cache()
+        assert cache.get_name(repo, app_id) == "old-name"
+
+        ApplicationUseCase(test_db).update(app_id, ApplicationRequest(
+            name="new-name", ownerTeam="team", repoUrl="https://github.com/test/app"
+        ))
+
+        assert cache.get_name(repo, app_id) == "new-name"
+
+    def test_unknown_application(self, test_db):
+        assert ApplicationCache().get_name(ApplicationRepository(test_db), uuid4()) == "Unknown"
@@ -0,0 +1,90 @@
+"""
+Testes dos filtros de GET /approvals (release, aprovador, outcome, intervalo de criação)
+"""
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta, timezone
+
+from src.infrastructure.orm.application import ApplicationORM
+from src.infrastructure.orm.release import ReleaseORM
+from src.infrastructure.orm.approval import ApprovalORM
+from src.infrastructure.repositories.approval_repository import ApprovalFilter
+from src.application.usecases.approval_usecase import ApprovalUseCase
+from tests.helpers import auth_header
+
+
+BASE = datetime(2026, 10, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def approvals(test_db):
+    application = ApplicationORM(id=uuid4(), name="filter-app", owner_team="team")
+    releases = [ReleaseORM(id=uuid4(), application_id=application.id, version=f"v{i}.0.0", env="PRE_PROD")
+                for i in range(2)]
+    test_db.add(application)
+    test_db.flush()
+    test_db.add_all(releases)
+    test_db.flush()
+    rows = [
+        ApprovalORM(release_id=releases[0].id, approver_email="a@test.com", outcome="APPROVED", created_at=BASE),
+        ApprovalORM(release_id=releases[0].id, approver_email="b@test.com", outcome="REJECTED",
+                    created_at=BASE + timedelta(days=1)),
+        ApprovalORM(release_id=releases[1].id, approver_email="a@test.com", outcome=None,
+                    created_at=BASE + timedelta(days=2)),
+    ]
+    test_db.add_all(rows)
+    test_db.commit()
+    return releases, rows
+
+
+def _ids(page):
+    return {a.id for a in page.data}
+
+
+class TestApprovalFilter:
+
+    def test_filters_by_release(self, test_db, approvals):
+        releases, rows = approvals
+        page = ApprovalUseCase(test_db).list_all(filters=ApprovalFilter(release_id=releases[0].id))
+        assert page.total == 2
+        assert _ids(page) == {str(rows[0].id), str(rows[1].id)}
+
+    def test_filters_by_approver_and_outcome(self, test_db, approvals):
+        _, rows = approvals
+        uc = ApprovalUseCase(test_db)
+        assert _ids(uc.list_all(filters=ApprovalFilter(approver_email="a@test.com", outcome="approved"))) == {str(rows[0].id)}
+        assert _ids(uc.list_all(filters=ApprovalFilter(outcome="PENDING"))) == {str(rows[2].id)}
+
+    def test_created_range_is_half_open_and_accepts_aware_datetimes(self, test_db, approvals):
+        _, rows = approvals
+        filters = ApprovalFilter(created_from=BASE.replace(tzinfo=timezone.utc) + timedelta(hours=3),
+                                 created_to=BASE + timedelta(days=2))
+        page = ApprovalUseCase(test_db).list_all(filters=filters)
+        assert page.total == 1
+        assert _ids(page) == {str(rows[1].id)}
+
+    def test_rejects_invalid_filters(self, test_db):
+        uc = ApprovalUseCase(test_db)
+        with pytest.raises(ValueError):
+            uc.list_all(filters=ApprovalFilter(outcome="MAYBE"))
+        with pytest.raises(ValueError):
+            uc.list_all(filters=ApprovalFilter(created_from=BASE, created_to=BASE))
+
+    def test_cache_key_depends_on_filters(self):
+        assert ApprovalFilter(outcome="APPROVED").cache_key() != ApprovalFilter(outcome="REJECTED").cache_key()
+
+
+class TestApprovalFilterRoute:
+
+    def test_release_id_query_param_is_applied(self, client, approvals):
+        releases, _ = approvals
+        response = client.get(f"/approvals?release_id={releases[1].id}", headers=auth_header())
+
+        assert response.status_code == 200
+        body = response.json()["data"]
+        assert body["total"] == 1
+        assert [a["releaseId"] for a in body["data"]] == [str(releases[1].id)]
+
+    def test_invalid_outcome_is_bad_request(self, client):
+        response = client.get("/approvals?outcome=MAYBE", headers=auth_header())
+        assert response.status_code == 400
@@ -0,0 +1,117 @@
+"""
+Testes das caixas de entrada do aprovador (pendentes / aprovados / rejeitados)
+"""
+import pytest
+from uuid import uuid4
+
+from src.infrastructure.orm.application import ApplicationORM
+from src.infrastructure.orm.release import ReleaseORM
+from src.infrastructure.orm.approval import ApprovalORM
+from src.application.usecases.release_usecase import ReleaseUseCase
+
+
+APPROVER = "approver@test.com"
+
+
+@pytest.fixture
+def app(test_db):
+    application = ApplicationORM(
+        id=uuid4(), name="inbox-test-app",
+        owner_team="team", repo_url="https://github.com/test/app"
+    )
+    test_db.add(application)
+    test_db.commit()
+    return application
+
+
+def _release(test_db, app, version, env="DEV"):
+    release = ReleaseORM(id=uuid4(), application_id=app.id, version=version, env=env)
+    test_db.add(release)
+    test_db.commit()
+    return release
+
+
+def _decide(test_db, release, outcome, email=APPROVER):
+    test_db.add(ApprovalORM(release_id=release.id, approver_email=email, outcome=outcome))
+    test_db.commit()
+
+
+class TestPendingInbox:
+    """Releases que o aprovador ainda não decidiu"""
+
+    def test_excludes_prod_and_decided_releases(self, test_db, app):
+        pending = _release(test_db, app, "v1.0.0")
+        _release(test_db, app, "v1.1.0", env="PROD")
+        approved = _release(test_db, app, "v1.2.0", env="PRE_PROD")
+        _decide(test_db, approved, "APPROVED")
+
+        result = ReleaseUseCase(test_db).list_pending_for_user(APPROVER)
+
+        assert result.total == 1
+        assert [r.id for r in result.data] == [str(pending.id)]
+        assert result.data[0].application_name == "inbox-test-app"
+
+    def test_other_approver_and_undecided_rows_stay_pending(self, test_db, app):
+        release = _release(test_db, app, "v2.0.0")
+        _decide(test_db, release, "APPROVED", email="other@test.com")
+        _decide(test_db, release, None)
+
+        result = ReleaseUseCase(test_db).list_pending_for_user(APPROVER)
+
+        assert result.total == 1
+
+    def test_paginates_in_database(self, test_db, app):
+        for i in range(5):
+            _release(test_db, app, f"v3.{i}.0")
+
+        uc = ReleaseUseCase(test_db)
+        first = uc.list_pending_for_user(APPROVER, skip=0, limit=2)
+        last = uc.list_pending_for_user(APPROVER, skip=4, limit=2)
+        beyond = uc.list_pending_for_user(APPROVER, skip=10, limit=2)
+
+        assert first.total == 5 and len(first.data) == 2
+        assert last.total == 5 and len(last.data) == 1
+        assert beyond.total == 5 and beyond.data == []
+
+
+class TestDecisionHistory:
+    """Releases aprovadas/rejeitadas pelo aprovador"""
+
+    def test_splits_by_outcome(self, test_db, app):
+        approved = _release(test_db, app, "v4.0.0")
+        rejected = _release(test_db, app, "v4.1.0")
+        _decide(test_db, approved, "APPROVED")
+        _decide(test_db, rejected, "REJECTED")
+        _decide(test_db, rejected, "APPROVED", email="other@test.com")
+
+        uc = ReleaseUseCase(test_db)
+        approved_page = uc.list_approved_by_user(APPROVER)
+        rejected_page = uc.list_rejected_by_user(APPROVER)
+
+        assert approved_page.total == 1
+        assert approved_page.data[0].id == str(approved.id)
+        assert approved_page.data[0].application_name == "inbox-test-app"
+        assert rejected_page.total == 1
+        assert rejected_page.data[0].id == str(rejected.id)
+
+    def test_keyset_pages_cover_history_once(self, test_db, app):
+        releases = [_release(test_db, app, f"v5.{i}.0") for i in range(5)]
+        for release in releases:
+            _decide(test_db, release, "APPROVED")
+
+        uc = ReleaseUseCase(test_db)
+        seen, cursor = [], None
+        for _ in range(5):
+            page = uc.list_approved_by_user(APPROVER, limit=2, cursor=cursor)
+            assert page.total == 5
+            seen.extend(r.id for r in page.data)
+            cursor = page.next_cursor
+            if not cursor:
+                break
+
+        assert sorted(seen) == sorted(str(r.id) for r in releases)
+
+    def test_invalid_cursor_raises(self, test_db, app):
+        from src.infrastructure.repositories.keyset import InvalidCursorError
+        with pytest.raises(InvalidCursorError):
+            ReleaseUseCase(test_db).list_approved_by_user(APPROVER, cursor="not-a-cursor")
@@ -0,0 +1,72 @@
+"""
+Testes das rotas de listagem servidas pelo stack async (get_async_read_db)
+"""
+import pytest
+from uuid import uuid4
+
+from src.infrastructure.orm.application import ApplicationORM
+from src.infrastructure.orm.release import ReleaseORM
+from src.infrastructure.orm.approval import ApprovalORM
+from tests.helpers import auth_header
+
+
+APPROVER = "approver@test.com"
+
+
+@pytest.fixture
+def seeded(test_db):
+    app = ApplicationORM(id=uuid4(), name="routes-app", owner_team="team")
+    other = ApplicationORM(id=uuid4(), name="other-app", owner_team="team")
+    test_db.add_all([app, other])
+    releases = [ReleaseORM(id=uuid4(), application_id=app.id, version=f"v{i}.0.0", env="DEV") for i in range(4)]
+    releases[1].approved_count, releases[2].rejected_count = 1, 1
+    test_db.add_all(releases)
+    test_db.add(ReleaseORM(id=uuid4(), application_id=other.id, version="v9.0.0", env="DEV"))
+    test_db.flush()
+    test_db.add_all([
+        ApprovalORM(release_id=releases[1].id, approver_email=APPROVER, outcome="APPROVED"),
+        ApprovalORM(release_id=releases[2].id, approver_email=APPROVER, outcome="REJECTED"),
+    ])
+    test_db.commit()
+    return {"app_id": app.id, "approved": str(releases[1].id), "rejected": str(releases[2].id)}
+
+
+def _page(client, path, **params):
+    response = client.get(path, params=params, headers=auth_header(APPROVER, "Approver"))
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+class TestAsyncListRoutes:
+
+    def test_list_all_releases(self, client, seeded):
+        first = _page(client, "/releases", limit=3)
+        rest = _page(client, "/releases", limit=3, cursor=first["nextCursor"])
+
+        assert first["total"] == 5
+        assert len(first["data"]) == 3 and len(rest["data"]) == 2
+        assert rest["nextCursor"] is None
+
+    def test_list_by_application(self, client, seeded):
+        page = _page(client, f"/releases/application/{seeded['app_id']}")
+
+        assert page["total"] == 4
+        assert {r["applicationName"] for r in page["data"]} == {"routes-app"}
+        approved = next(r for r in page["data"] if r["id"] == seeded["approved"])
+        assert approved["approvalCount"] == 1 and approved["rejectionCount"] == 0
+
+    def test_pending_inbox(self, client, seeded):
+        page = _page(client, "/approvals/pending/current")
+
+        assert page["total"] == 3
+        assert seeded["approved"] not in [r["id"] for r in page["data"]]
+
+    def test_approved_inbox(self, client, seeded):
+        page = _page(client, "/approvals/approved/current")
+
+        assert [r["id"] for r in page["data"]] == [seeded["approved"]]
+
+    def test_rejected_inbox(self, client, seeded):
+        page = _page(client, "/approvals/rejected/current")
+
+        assert [r["id"] for r in page["data"]] == [seeded["rejected"]]
@@ -0,0 +1,94 @@
+"""
+Testes do stack async (AsyncSession) das listagens e caixas do aprovador
+"""
+import pytest
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+pytest.importorskip("aiosqlite")
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.infrastructure.database import Base
+from src.infrastructure.orm.application import ApplicationORM
+from src.infrastructure.orm.release import ReleaseORM
+from src.infrastructure.orm.approval import ApprovalORM
+from src.application.usecases.release_usecase import ReleaseUseCase
+from src.application.usecases.async_release_usecase import AsyncReleaseUseCase
+
+
+APPROVER = "approver@test.com"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "aurora.sqlite"
+
+
+@pytest.fixture
+def sync_db(db_path):
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+    engine.dispose()
+
+
+@pytest.fixture
+async def async_db(db_path, sync_db):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as db:
+        yield db
+    await engine.dispose()
+
+
+@pytest.fixture
+def seeded(sync_db):
+    app = ApplicationORM(id=uuid4(), name="async-app", owner_team="team")
+    sync_db.add(app)
+    releases = [
+        ReleaseORM(id=uuid4(), application_id=app.id, version=f"v{i}.0.0", env="PROD" if i == 0 else "DEV")
+        for i in range(6)
+    ]
+    sync_db.add_all(releases)
+    sync_db.add_all([
+        ApprovalORM(release_id=releases[1].id, approver_email=APPROVER, outcome="APPROVED"),
+        ApprovalORM(release_id=releases[2].id, approver_email=APPROVER, outcome="REJECTED"),
+        ApprovalORM(release_id=releases[3].id, approver_email="other@test.com", outcome="APPROVED"),
+    ])
+    sync_db.commit()
+    return app.id
+
+
+def _ids(page):
+    return [r.id for r in page.data]
+
+
+class TestAsyncReleaseUseCase:
+
+    async def test_listings_match_sync_use_case(self, sync_db, async_db, seeded):
+        sync_uc, async_uc = ReleaseUseCase(sync_db), AsyncReleaseUseCase(async_db)
+
+        expected = sync_uc.list_all(limit=4)
+        page = await async_uc.list_all(limit=4)
+        assert _ids(page) == _ids(expected)
+        assert page.total == expected.total == 6
+        assert [r.approval_count for r in page.data] == [r.approval_count for r in expected.data]
+
+        next_page = await async_uc.list_by_application(seeded, limit=4, cursor=page.next_cursor)
+        assert _ids(next_page) == _ids(sync_uc.list_by_application(seeded, limit=4, cursor=page.next_cursor))
+        assert next_page.data[0].application_name == "async-app"
+
+    async def test_approver_inbox_matches_sync_use_case(self, sync_db, async_db, seeded):
+        sync_uc, async_uc = ReleaseUseCase(sync_db), AsyncReleaseUseCase(async_db)
+
+        pending = await async_uc.list_pending_for_user(APPROVER)
+        approved = await async_uc.list_approved_by_user(APPROVER)
+        rejected = await async_uc.list_rejected_by_user(APPROVER)
+
+        assert pending.total == 3
+        assert _ids(pending) == _ids(sync_uc.list_pending_for_user(APPROVER))
+        assert _ids(approved) == _ids(sync_uc.list_approved_by_user(APPROVER))
+        assert _ids(rejected) == _ids(sync_uc.list_rejected_by_user(APPROVER))
+        assert approved.total == rejected.total == 1
@@ -0,0 +1,80 @@
+"""
+Testes da gestão de partições de audit_logs (cálculo de meses, retenção e exportação)
+"""
+import gzip
+import json
+import pytest
+from datetime import date, datetime
+from uuid import uuid4
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.orm.audit_log import AuditLogORM
+from src.infrastructure.audit_partitions import (
+    AuditPartition, AuditPartitionManager, add_months, export_rows, partition_month,
+    partition_name, partitions_to_archive
+)
+
+
+def _partition(year, month, attached=True):
+    day = date(year, month, 1)
+    return AuditPartition(partition_name(day), day, attached)
+
+
+class TestPartitionMonths:
+
+    def test_add_months_crosses_years(self):
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_name_round_trip(self):
+        assert partition_name(date(2026, 3, 1)) == "audit_logs_2026_03"
+        assert partition_month("audit_logs_2026_03") == date(2026, 3, 1)
+        assert partition_month("audit_logs_unpartitioned") is None
+
+
+class TestRetention:
+
+    def test_keeps_current_month_and_retention_window(self):
+        partitions = [_partition(2025, 9), _partition(2025, 11, attached=False),
+                      _partition(2025, 12), _partition(2026, 10), _partition(2026, 12)]
+
+        to_archive = partitions_to_archive(partitions, retention_months=10, today=date(2026, 10, 18))
+
+        # Retenção de 10 meses em 2026-10: mantém 2026-01 em diante
+        assert [p.name for p in to_archive] == ["audit_logs_2025_09", "audit_logs_2025_11", "audit_logs_2025_12"]
+
+    def test_invalid_retention(self):
+        with pytest.raises(ValueError):
+            partitions_to_archive([], retention_months=0)
+
+
+class TestExport:
+
+    def test_exports_gzip_jsonl(self, test_db, tmp_path):
+        for i in range(3):
+            test_db.add(AuditLogORM(id=uuid4(), actor="a@test.com", action="CREATE", entity="RELEASE",
+                                    entity_id=uuid4(), payload={"i": i}, created_at=datetime(2025, 1, i + 1)))
+        test_db.commit()
+        path = tmp_path / "audit_logs_2025_01.jsonl.gz"
+
+        assert export_rows(test_db, "audit_logs", path) == 3
+
+        with gzip.open(path, "rt") as archived:
+            rows = [json.loads(line) for line in archived]
+        assert [row["payload"] for row in rows] == [{"i": 0}, {"i": 1}, {"i": 2}]
+        assert rows[0]["created_at"].startswith("2025-01-01")
+        assert not (tmp_path / "audit_logs_2025_01.jsonl.gz.tmp").exists()
+
+    def test_invalid_format(self, test_db, tmp_path):
+        with pytest.raises(ValueError):
+            export_rows(test_db, "audit_logs", tmp_path / "x", fmt="csv")
+
+
+class TestManagerOutsidePostgres:
+
+    def test_ensure_is_noop_and_archive_refuses(self, test_db, tmp_path):
+        manager = AuditPartitionManager(sessionmaker(bind=test_db.get_bind()))
+
+        assert manager.ensure_partitions() == []
+        with pytest.raises(ValueError):
+            manager.archive(12, str(tmp_path))
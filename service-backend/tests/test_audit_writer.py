@@ -0,0 +1,151 @@
+"""
+Testes do AuditWriter (modos sync, buffered e outbox)
+"""
+import pytest
+from uuid import uuid4, UUID
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.orm.application import ApplicationORM
+from src.infrastructure.orm.audit_log import AuditLogORM
+from src.infrastructure.orm.audit_log_outbox import AuditLogOutboxORM
+from src.infrastructure.repositories.audit_log_repository import AuditLogRepository
+from src.infrastructure.audit_writer import AuditWriter, BUFFERED, OUTBOX, SYNC
+from src.infrastructure import audit_writer
+from src.application.usecases.release_usecase import ReleaseUseCase
+from src.application.dtos.release_dtos import ReleaseRequest
+
+
+@pytest.fixture
+def make_writer(test_db, monkeypatch):
+    writers = []
+
+    def make(mode, **kwargs):
+        writer = AuditWriter(mode, session_factory=sessionmaker(bind=test_db.get_bind()), **kwargs)
+        monkeypatch.setattr(audit_writer, "_audit_writer", writer)
+        writers.append(writer)
+        return writer
+
+    yield make
+    for writer in writers:
+        writer.close()
+
+
+def _append(session, action="UPDATE"):
+    AuditLogRepository(session).append("dev@test.com", action, "RELEASE", uuid4(), {"k": "v"}, "req-1")
+
+
+class TestAuditWriterModes:
+
+    def test_sync_writes_in_the_transaction(self, test_db, make_writer):
+        make_writer(SYNC)
+        _append(test_db)
+
+        assert test_db.query(AuditLogORM).count() == 1
+
+    def test_buffered_writes_only_committed_rows_in_batches(self, test_db, make_writer):
+        writer = make_writer(BUFFERED, batch_size=2)
+        _append(test_db)
+        test_db.rollback()
+        for _ in range(3):
+            _append(test_db)
+        assert writer.stats()["queued"] == 0
+
+        test_db.commit()
+        assert writer.stats()["queued"] == 3
+        assert test_db.query(AuditLogORM).count() == 0
+
+        assert writer.flush() == 3
+        assert test_db.query(AuditLogORM).count() == 3
+        assert writer.stats()["written"] == 3
+
+    def test_outbox_is_transactional_and_relayed(self, test_db, make_writer):
+        writer = make_writer(OUTBOX, batch_size=2)
+        _append(test_db)
+        test_db.rollback()
+        for i in range(3):
+            _append(test_db, action=f"A{i}")
+        test_db.commit()
+
+        assert test_db.query(AuditLogOutboxORM).count() == 3
+        assert test_db.query(AuditLogORM).count() == 0
+
+        assert writer.flush() == 3
+        logs = test_db.query(AuditLogORM).order_by(AuditLogORM.action).all()
+        assert [log.action for log in logs] == ["A0", "A1", "A2"]
+        assert logs[0].request_id == "req-1" and logs[0].payload == {"k": "v"}
+        assert test_db.query(AuditLogOutboxORM).count() == 0
+
+    def test_buffered_retries_a_failed_batch(self, test_db, make_writer, monkeypatch):
+        writer = make_writer(BUFFERED, max_retries=2)
+        insert_many = AuditLogRepository.insert_many
+        failures = iter([True, True])
+
+        def flaky_insert_many(repo, rows):
+            if next(failures, False):
+                raise RuntimeError("failover")
+            insert_many(repo, rows)
+
+        monkeypatch.setattr(AuditLogRepository, "insert_many", flaky_insert_many)
+        for _ in range(3):
+            _append(test_db)
+        test_db.commit()
+
+        assert writer.flush() == 0
+        assert writer.flush() == 0
+        assert writer.stats()["retrying"] == 3
+        assert writer.flush() == 3
+        assert test_db.query(AuditLogORM).count() == 3
+        assert writer.stats()["failed"] == 0 and writer.stats()["retrying"] == 0
+
+    def test_buffered_drops_batch_after_max_retries(self, test_db, make_writer, monkeypatch, caplog):
+        writer = make_writer(BUFFERED, max_retries=1)
+
+        def failing_insert_many(repo, rows):
+            raise RuntimeError("lock timeout")
+
+        monkeypatch.setattr(AuditLogRepository, "insert_many", failing_insert_many)
+        _append(test_db)
+        test_db.commit()
+
+        writer.flush()
+        writer.flush()
+
+        stats = writer.stats()
+        assert stats["failed"] == 1 and stats["retrying"] == 0 and stats["written"] == 0
+        assert any(r.levelname == "ERROR" and "descartados" in r.getMessage() for r in caplog.records)
+
+    def test_buffered_full_queue_writes_overflow_in_the_request(self, test_db, make_writer, caplog):
+        writer = make_writer(BUFFERED, buffer_max=1, put_timeout=0.01)
+        for _ in range(3):
+            _append(test_db)
+
+        test_db.commit()
+
+        assert writer.stats()["queued"] == 1
+        assert test_db.query(AuditLogORM).count() == 2
+        assert "Fila do AuditWriter cheia" in caplog.text
+        assert writer.flush() == 1
+        assert test_db.query(AuditLogORM).count() == 3
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            AuditWriter("async")
+
+
+class TestUseCaseAuditModes:
+
+    def test_create_release_in_outbox_mode(self, test_db, make_writer):
+        writer = make_writer(OUTBOX)
+        application = ApplicationORM(id=uuid4(), name="audit-writer-app", owner_team="team")
+        test_db.add(application)
+        test_db.commit()
+
+        release = ReleaseUseCase(test_db, actor_email="dev@test.com").create(ReleaseRequest(
+            application_id=str(application.id), version="v1.0.0", environment="DEV",
+            evidence_url="https://ci.example.com/results.xml"
+        ))
+        writer.flush()
+
+        log = test_db.query(AuditLogORM).one()
+        assert log.action == "CREATE"
+        assert UUID(str(log.entity_id)) == UUID(release.id)
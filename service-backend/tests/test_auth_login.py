@@ -0,0 +1,107 @@
+"""
+Testes de /auth/login e /auth/me sobre AsyncSession, com bcrypt no executor dedicado
+"""
+import threading
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+pytest.importorskip("aiosqlite")
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from main import app
+from src.infrastructure.database import Base, get_async_db
+from src.infrastructure.orm.user import UserORM
+from src.domain.entities.user import UserRole
+from src.application.services import password_hashing
+from src.application.services.auth_service import AuthService
+from src.infrastructure.cache.user_cache import get_user_cache
+from tests.helpers import auth_header
+
+EMAIL = "login@test.com"
+PASSWORD = "password123"
+
+
+@pytest.fixture
+def login_client(tmp_path):
+    db_path = tmp_path / "auth.sqlite"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        db.add(UserORM(email=EMAIL, name="Login", password_hash=AuthService.hash_password(PASSWORD),
+                       role=UserRole.APPROVER))
+        db.commit()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+
+    async def override_get_async_db():
+        async with async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    get_user_cache().clear()
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    get_user_cache().clear()
+    engine.dispose()
+
+
+class TestLogin:
+
+    def test_login_returns_token_and_role(self, login_client):
+        response = login_client.post("/auth/login", json={"email": EMAIL, "password": PASSWORD})
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["access_token"]
+        assert data["user"]["role"] == UserRole.APPROVER.value
+
+    def test_wrong_password(self, login_client):
+        response = login_client.post("/auth/login", json={"email": EMAIL, "password": "wrong"})
+
+        assert response.status_code == 401
+
+    def test_unknown_user(self, login_client):
+        response = login_client.post("/auth/login", json={"email": "nobody@test.com", "password": PASSWORD})
+
+        assert response.status_code == 404
+
+    def test_bcrypt_runs_on_the_dedicated_executor(self, login_client, monkeypatch):
+        threads = []
+        verify = password_hashing.verify_password
+
+        def recording_verify(plain, hashed):
+            threads.append(threading.current_thread().name)
+            return verify(plain, hashed)
+
+        monkeypatch.setattr(password_hashing, "verify_password", recording_verify)
+        login_client.post("/auth/login", json={"email": EMAIL, "password": PASSWORD})
+
+        assert len(threads) == 1 and threads[0].startswith("password-hash")
+
+    def test_me_returns_role(self, login_client):
+        response = login_client.get("/auth/me", headers=auth_header(EMAIL, "Login"))
+
+        assert response.status_code == 200
+        assert response.json()["data"]["role"] == UserRole.APPROVER.value
+
+    def test_me_unknown_user_is_404(self, login_client):
+        response = login_client.get("/auth/me", headers=auth_header("ghost@test.com", "Ghost"))
+
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "USER_NOT_FOUND"
+
+    def test_me_serves_repeated_calls_from_cache(self, login_client):
+        headers = auth_header(EMAIL, "Login")
+        login_client.get("/auth/me", headers=headers)
+        login_client.get("/auth/me", headers=headers)
+
+        assert get_user_cache().stats()["hits"] == 1
+
+
+class TestPasswordExecutor:
+
+    def test_invalid_executor_kind(self):
+        with pytest.raises(ValueError):
+            password_hashing._create_executor("fiber", 2)
@@ -0,0 +1,39 @@
+"""
+Testes das estratégias de total (exact / estimated / cached)
+"""
+from uuid import uuid4
+
+from src.infrastructure.orm.audit_log import AuditLogORM
+from src.infrastructure.repositories.counting import CountMode
+from src.application.usecases.audit_log_usecase import AuditLogUseCase
+
+
+def _log(test_db, actor):
+    test_db.add(AuditLogORM(actor=actor, action="CREATE", entity="RELEASE", entity_id=uuid4(), payload={}))
+    test_db.commit()
+
+
+class TestCountModes:
+
+    def test_exact_by_default(self, test_db):
+        _log(test_db, "exact@test.com")
+        page = AuditLogUseCase(test_db).list_by_actor("exact@test.com")
+        assert page.total == 1 and page.total_exact
+
+    def test_estimated_falls_back_to_exact_outside_postgres(self, test_db):
+        _log(test_db, "estimated@test.com")
+        page = AuditLogUseCase(test_db).list_all(count_mode=CountMode.ESTIMATED)
+        assert page.total == 1 and page.total_exact
+
+    def test_cached_total_is_reused_and_flagged_inexact(self, test_db):
+        actor = f"{uuid4()}@test.com"
+        uc = AuditLogUseCase(test_db)
+        _log(test_db, actor)
+
+        first = uc.list_by_actor(actor, count_mode=CountMode.CACHED)
+        _log(test_db, actor)
+        second = uc.list_by_actor(actor, count_mode=CountMode.CACHED)
+
+        assert (first.total, first.total_exact) == (1, True)
+        assert (second.total, second.total_exact) == (1, False)
+        assert len(second.data) == 2
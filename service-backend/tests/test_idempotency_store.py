@@ -0,0 +1,224 @@
+"""
+Testes do store de idempotência (reserva atômica, replay, cache local e limpeza)
+"""
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.orm.application import ApplicationORM
+from src.infrastructure.orm.release import ReleaseORM
+from src.infrastructure.orm.idempotency_key import IdempotencyKey
+from src.infrastructure.repositories.idempotency_key_repository import IdempotencyKeyRepository
+from src.infrastructure.idempotency_store import (
+    Claim, IdempotencyStore, IdempotencyConflictError, IdempotencyKeyReusedError, StoredResponse
+)
+from src.infrastructure import idempotency_store
+from tests.helpers import auth_header
+
+
+@pytest.fixture
+def store(test_db):
+    return IdempotencyStore(session_factory=sessionmaker(bind=test_db.get_bind()))
+
+
+@pytest.fixture
+def app_store(store, monkeypatch):
+    monkeypatch.setattr(idempotency_store, "_idempotency_store", store)
+    return store
+
+
+class TestIdempotencyKeyRepository:
+
+    def test_claim_is_exclusive_until_expired(self, test_db):
+        repo = IdempotencyKeyRepository(test_db)
+        future = datetime.utcnow() + timedelta(minutes=1)
+
+        assert repo.claim("k", "POST", "/p", future) is not None
+        assert repo.claim("k", "POST", "/p", future) is None
+
+        repo.claim("old", "POST", "/p", datetime.utcnow() - timedelta(seconds=1))
+        assert repo.claim("old", "POST", "/p", future) is not None
+
+    def test_complete_and_delete_only_touch_the_owners_claim(self, test_db):
+        repo = IdempotencyKeyRepository(test_db)
+        stale = repo.claim("k", "POST", "/p", datetime.utcnow() - timedelta(seconds=1))
+        owner = repo.claim("k", "POST", "/p", datetime.utcnow() + timedelta(minutes=1))
+        later = datetime.utcnow() + timedelta(hours=1)
+
+        assert repo.complete("k", stale, {"stale": True}, "200", later) is False
+        assert repo.delete("k", stale) is False
+        assert repo.complete("k", owner, {"ok": True}, "200", later) is True
+        # Resposta final não é mais uma reserva: nem o dono a remove
+        assert repo.delete("k", owner) is False
+        assert test_db.query(IdempotencyKey).one().response_body == '{"ok": true}'
+
+    def test_delete_expired_in_batches(self, test_db):
+        repo = IdempotencyKeyRepository(test_db)
+        past = datetime.utcnow() - timedelta(seconds=1)
+        for i in range(5):
+            repo.claim(f"old-{i}", "POST", "/p", past)
+        repo.claim("live", "POST", "/p", datetime.utcnow() + timedelta(minutes=1))
+
+        assert repo.delete_expired_batch(limit=3) == 3
+        assert repo.delete_expired_batch(limit=3) == 2
+        assert test_db.query(IdempotencyKey).count() == 1
+
+
+class TestIdempotencyStore:
+
+    def test_begin_complete_and_replay(self, test_db, store):
+        claim = store.begin("k", "POST", "/p")
+        assert isinstance(claim, Claim)
+        with pytest.raises(IdempotencyConflictError):
+            store.begin("k", "POST", "/p")
+
+        assert store.complete(claim, "POST", "/p", 200, {"ok": True}) is True
+
+        assert store.begin("k", "POST", "/p") == StoredResponse(200, {"ok": True})
+        assert store.stats()["hits"] == 1
+        # Outro processo (cache frio) lê da tabela
+        cold = IdempotencyStore(session_factory=store.session_factory)
+        assert cold.begin("k", "POST", "/p") == StoredResponse(200, {"ok": True})
+
+    def test_key_reused_on_other_path_conflicts(self, test_db, store):
+        store.complete(store.begin("k", "POST", "/a"), "POST", "/a", 200, {})
+        with pytest.raises(IdempotencyConflictError):
+            store.begin("k", "POST", "/b")
+
+    def test_release_allows_retry(self, test_db, store):
+        assert store.release(store.begin("k", "POST", "/p")) is True
+        assert isinstance(store.begin("k", "POST", "/p"), Claim)
+
+    def test_expired_claim_does_not_overwrite_new_owner(self, test_db, store, caplog):
+        store.lock_ttl = timedelta(seconds=-1)
+        slow = store.begin("k", "POST", "/p")
+        store.lock_ttl = timedelta(seconds=60)
+        owner = store.begin("k", "POST", "/p")
+
+        assert store.complete(slow, "POST", "/p", 200, {"slow": True}) is False
+        assert store.release(slow) is False
+        assert "expirou" in caplog.text
+        with pytest.raises(IdempotencyConflictError):
+            store.begin("k", "POST", "/p")
+
+        store.complete(owner, "POST", "/p", 200, {"owner": True})
+        assert store.begin("k", "POST", "/p") == StoredResponse(200, {"owner": True})
+
+    def test_replay_with_other_body_hash_is_rejected(self, test_db, store):
+        claim = store.begin("k", "POST", "/p", store.request_hash(b'{"a": 1}'))
+        store.complete(claim, "POST", "/p", 200, {"ok": True})
+        cold = IdempotencyStore(session_factory=store.session_factory)
+
+        assert cold.begin("k", "POST", "/p", store.request_hash(b'{"a": 1}')) == StoredResponse(200, {"ok": True})
+        with pytest.raises(IdempotencyKeyReusedError):
+            cold.begin("k", "POST", "/p", store.request_hash(b'{"a": 2}'))
+
+    def test_sweep_commits_per_batch(self, test_db, store):
+        repo = IdempotencyKeyRepository(test_db)
+        for i in range(7):
+            repo.claim(f"old-{i}", "POST", "/p", datetime.utcnow() - timedelta(seconds=1))
+        test_db.commit()
+
+        assert store.sweep(batch_size=3) == 7
+        assert test_db.query(IdempotencyKey).count() == 0
+
+
+def _release(test_db):
+    application = ApplicationORM(id=uuid4(), name=f"idem-app-{uuid4().hex[:6]}", owner_team="team")
+    test_db.add(application)
+    test_db.flush()
+    release = ReleaseORM(id=uuid4(), application_id=application.id, version="v1.0.0", env="DEV")
+    test_db.add(release)
+    test_db.commit()
+    return release.id
+
+
+class TestIdempotencyMiddleware:
+
+    def test_duplicate_promote_replays_first_response(self, client, test_db, app_store):
+        release_id = _release(test_db)
+        headers = {**auth_header(), "Idempotency-Key": "promote-1"}
+
+        first = client.post(f"/releases/{release_id}/promote", json={"targetEnv": "PRE_PROD"}, headers=headers)
+        second = client.post(f"/releases/{release_id}/promote", json={"targetEnv": "PRE_PROD"}, headers=headers)
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert second.headers["Idempotent-Replayed"] == "true"
+        assert "Idempotent-Replayed" not in first.headers
+        assert test_db.query(IdempotencyKey).one().status_code == "200"
+
+    def test_failed_request_releases_the_key(self, client, test_db, app_store):
+        headers = {**auth_header(), "Idempotency-Key": "promote-2"}
+
+        response = client.post(f"/releases/{uuid4()}/promote", json={"targetEnv": "PRE_PROD"}, headers=headers)
+
+        assert response.status_code == 400
+        assert test_db.query(IdempotencyKey).count() == 0
+
+    def test_applies_to_other_mutating_routes(self, client, test_db, app_store):
+        headers = {**auth_header(), "Idempotency-Key": "create-app-1"}
+        body = {"name": "idem-created", "ownerTeam": "team"}
+
+        first = client.post("/applications", json=body, headers=headers)
+        second = client.post("/applications", json=body, headers=headers)
+
+        assert first.status_code in (200, 201)
+        assert second.status_code == first.status_code
+        assert second.json() == first.json()
+        assert test_db.query(ApplicationORM).filter_by(name="idem-created").count() == 1
+
+    def test_key_is_scoped_by_actor_and_path(self, client, test_db, app_store):
+        release_id = _release(test_db)
+        body = {"targetEnv": "PRE_PROD"}
+
+        first = client.post(f"/releases/{release_id}/promote", json=body,
+                            headers={**auth_header(), "Idempotency-Key": "shared"})
+        other_path = client.post(f"/releases/{uuid4()}/promote", json=body,
+                                 headers={**auth_header(), "Idempotency-Key": "shared"})
+        other_actor = client.post(f"/releases/{release_id}/promote", json=body,
+                                  headers={**auth_header("other@test.com", "Other"), "Idempotency-Key": "shared"})
+
+        assert first.status_code == 200
+        # Mesma chave em outra rota/ator executa de novo em vez de repetir a resposta
+        assert other_path.status_code == 400
+        assert "Idempotent-Replayed" not in other_actor.headers
+
+    def test_requests_without_key_are_not_recorded(self, client, test_db, app_store):
+        release_id = _release(test_db)
+
+        client.post(f"/releases/{release_id}/promote", json={"targetEnv": "PRE_PROD"}, headers=auth_header())
+
+        assert test_db.query(IdempotencyKey).count() == 0
+
+    def test_oversized_key_is_rejected(self, client, app_store):
+        headers = {**auth_header(), "Idempotency-Key": "x" * 256}
+
+        response = client.post("/applications", json={"name": "x"}, headers=headers)
+
+        assert response.status_code == 400
+
+    def test_reused_key_with_other_body_is_rejected(self, client, test_db, app_store):
+        headers = {**auth_header(), "Idempotency-Key": "create-app-2"}
+
+        first = client.post("/applications", json={"name": "idem-a", "ownerTeam": "team"}, headers=headers)
+        second = client.post("/applications", json={"name": "idem-b", "ownerTeam": "team"}, headers=headers)
+
+        assert first.status_code in (200, 201)
+        assert second.status_code == 422
+        assert second.json()["error"]["code"] == "IDEMPOTENCY_KEY_REUSED"
+        assert test_db.query(ApplicationORM).filter_by(name="idem-b").count() == 0
+
+    def test_read_only_posts_are_not_recorded(self, client, test_db, app_store):
+        headers = {**auth_header(), "Idempotency-Key": "score-1"}
+
+        first = client.post("/releases/calculate-score:batch",
+                            json={"evidenceUrls": ["https://example.com/a"]}, headers=headers)
+        second = client.post("/releases/calculate-score:batch",
+                             json={"evidenceUrls": ["https://example.com/b"]}, headers=headers)
+
+        assert first.status_code == second.status_code == 200
+        assert "Idempotent-Replayed" not in second.headers
+        assert test_db.query(IdempotencyKey).count() == 0
@@ -0,0 +1,82 @@
+"""
+Testes do caminho direto de serialização (orjson) das respostas ApiResponse
+"""
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from fastapi.encoders import jsonable_encoder
+
+from src.infrastructure.orm.application import ApplicationORM
+from src.domain.entities.user import UserRole
+from src.application.dtos.api_response import ApiResponse
+from src.application.dtos.release_event_dtos import ReleaseEventResponse
+from src.presentation.utils.json_response import dump_models, render_json, success_json
+
+
+def _event(i: int) -> ReleaseEventResponse:
+    return ReleaseEventResponse(id=uuid.uuid4(), release_id=uuid.uuid4(), event_type="CREATED", status="PENDING",
+                                actor_email=f"user{i}@test.com", created_at=datetime(2026, 1, 1, 12, 0, i))
+
+
+class TestRenderJson:
+
+    def test_matches_jsonable_encoder(self):
+        content = {
+            "id": uuid.uuid4(),
+            "at": datetime(2026, 1, 1, 12, 30, 15, 123456),
+            "utc": datetime(2026, 1, 1, tzinfo=timezone.utc),
+            "role": UserRole.ADMIN,
+            "amount": Decimal("1.5"),
+            "tags": {"a"},
+            "event": _event(0),
+            "nested": [{"id": uuid.uuid4()}, None, True],
+        }
+
+        assert json.loads(render_json(content)) == jsonable_encoder(content)
+
+    def test_non_string_keys(self):
+        key = uuid.uuid4()
+
+        assert json.loads(render_json({key: 1, 2: "b"})) == {str(key): 1, "2": "b"}
+
+
+class TestDumpModels:
+
+    def test_page_dump_uses_aliases(self):
+        events = [_event(i) for i in range(3)]
+
+        assert dump_models(events) == [e.model_dump(by_alias=True) for e in events]
+
+    def test_empty_page(self):
+        assert dump_models([]) == []
+        assert dump_models(iter(())) == []
+
+
+class TestSuccessJson:
+
+    def test_envelope_matches_api_response(self):
+        data = {"data": dump_models([_event(1)]), "total": 1}
+        expected = jsonable_encoder(ApiResponse.success_response(data, "req-1").model_dump())
+
+        response = success_json(data, "req-1")
+        body = json.loads(response.body)
+
+        assert response.media_type == "application/json"
+        assert body.pop("timestamp")
+        expected.pop("timestamp")
+        assert body == expected
+
+    def test_list_route(self, client, test_db):
+        test_db.add(ApplicationORM(name="svc", owner_team="team", repo_url=None))
+        test_db.commit()
+
+        response = client.get("/applications")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        body = response.json()
+        assert body["success"] is True and body["error"] is None
+        assert body["data"]["data"][0]["ownerTeam"] == "team"
+        assert body["data"]["totalExact"] is True
@@ -0,0 +1,83 @@
+"""
+Testes da paginação por cursor (created_at, id) nas listagens
+"""
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from src.infrastructure.orm.application import ApplicationORM
+from src.infrastructure.orm.audit_log import AuditLogORM
+from src.infrastructure.orm.release import ReleaseORM
+from src.infrastructure.repositories.keyset import InvalidCursorError
+from src.application.usecases.audit_log_usecase import AuditLogUseCase
+from src.application.usecases.release_usecase import ReleaseUseCase
+
+
+@pytest.fixture
+def audit_logs(test_db):
+    # Metade das linhas com o mesmo created_at para exercitar o desempate por id
+    base = datetime(2026, 1, 1)
+    logs = [
+        AuditLogORM(id=uuid4(), actor="a@test.com", action="CREATE", entity="RELEASE",
+                    entity_id=uuid4(), payload={}, created_at=base + timedelta(minutes=i // 2))
+        for i in range(7)
+    ]
+    test_db.add_all(logs)
+    test_db.commit()
+    return logs
+
+
+def _walk(list_page, limit):
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = list_page(limit=limit, cursor=cursor)
+        seen.extend(str(item.id) for item in page.data)
+        pages += 1
+        cursor = page.next_cursor
+        if not cursor:
+            return seen, pages
+
+
+class TestKeysetPagination:
+
+    def test_cursor_walk_returns_every_row_once_in_order(self, test_db, audit_logs):
+        uc = AuditLogUseCase(test_db)
+        seen, pages = _walk(uc.list_all, limit=3)
+
+        expected = sorted(audit_logs, key=lambda l: (l.created_at, str(l.id)), reverse=True)
+        assert seen == [str(l.id) for l in expected]
+        assert pages == 3
+
+    def test_offset_mode_still_supported_and_emits_cursor(self, test_db, audit_logs):
+        uc = AuditLogUseCase(test_db)
+        first = uc.list_all(skip=0, limit=4)
+        by_offset = uc.list_all(skip=4, limit=4)
+        by_cursor = uc.list_all(limit=4, cursor=first.next_cursor)
+
+        assert first.total == 7
+        assert [l.id for l in by_offset.data] == [l.id for l in by_cursor.data]
+        assert by_cursor.next_cursor is None
+
+    def test_total_can_be_skipped(self, test_db, audit_logs):
+        page = AuditLogUseCase(test_db).list_by_actor("a@test.com", limit=5, include_total=False)
+
+        assert page.total is None
+        assert page.has_next
+
+    def test_release_listing_by_application(self, test_db):
+        app = ApplicationORM(id=uuid4(), name="keyset-app", owner_team="team")
+        test_db.add(app)
+        test_db.add_all(
+            ReleaseORM(id=uuid4(), application_id=app.id, version=f"v{i}.0.0", env="DEV")
+            for i in range(5)
+        )
+        test_db.commit()
+
+        uc = ReleaseUseCase(test_db)
+        seen, _ = _walk(lambda **kw: uc.list_by_application(app.id, **kw), limit=2)
+
+        assert len(seen) == len(set(seen)) == 5
+
+    def test_invalid_cursor(self, test_db, audit_logs):
+        with pytest.raises(InvalidCursorError):
+            AuditLogUseCase(test_db).list_all(cursor="%%%")
@@ -0,0 +1,101 @@
+"""
+Testes das leituras projetadas (SELECT Core) das listagens de releases e audit logs
+"""
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from src.infrastructure.orm.application import ApplicationORM
+from src.infrastructure.orm.release import ReleaseORM
+from src.infrastructure.orm.audit_log import AuditLogORM
+from src.infrastructure.repositories.release_repository import ReleaseRepository
+from src.infrastructure.repositories.audit_log_repository import AuditLogRepository
+from src.infrastructure.repositories.projection import AUDIT_LOG_LISTING, AUDIT_LOG_SUMMARY, RELEASE_LISTING
+from src.application.usecases.audit_log_usecase import AuditLogUseCase
+
+
+@pytest.fixture
+def releases(test_db):
+    app = ApplicationORM(id=uuid4(), name="projection-app", owner_team="team")
+    test_db.add(app)
+    now = datetime(2026, 1, 1)
+    test_db.add_all(
+        ReleaseORM(id=uuid4(), application_id=app.id, version=f"1.0.{i}", env="DEV", status="PENDING",
+                   evidence_score=10, version_row=0, created_at=now + timedelta(minutes=i))
+        for i in range(3)
+    )
+    test_db.commit()
+    test_db.expunge_all()
+    return app
+
+
+@pytest.fixture
+def audit_logs(test_db):
+    now = datetime(2026, 1, 1)
+    test_db.add_all(
+        AuditLogORM(id=uuid4(), actor="auditor@test.com", action="CREATE", entity="Release", entity_id=uuid4(),
+                    payload={"version": f"1.0.{i}"}, created_at=now + timedelta(minutes=i))
+        for i in range(3)
+    )
+    test_db.commit()
+    test_db.expunge_all()
+
+
+@pytest.fixture
+def statements(test_db):
+    captured = []
+    event.listen(test_db.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: captured.append(statement))
+    return captured
+
+
+class TestProjection:
+
+    def test_without_drops_columns(self):
+        assert "payload" in AUDIT_LOG_LISTING.names
+        assert "payload" not in AUDIT_LOG_SUMMARY.names
+
+    def test_without_unknown_column(self):
+        with pytest.raises(ValueError):
+            RELEASE_LISTING.without("payload")
+
+
+class TestProjectedReads:
+
+    def test_release_listing_returns_rows_outside_the_identity_map(self, test_db, releases):
+        rows, next_cursor = ReleaseRepository(test_db).list_all(limit=2)
+
+        assert [row.version for row in rows] == ["1.0.2", "1.0.1"]
+        assert next_cursor is not None
+        assert not isinstance(rows[0], ReleaseORM)
+        assert len(test_db.identity_map) == 0
+
+    def test_release_cursor_continues_the_listing(self, test_db, releases):
+        repo = ReleaseRepository(test_db)
+        _, cursor = repo.list_all(limit=2)
+        rows, next_cursor = repo.list_all(limit=2, cursor=cursor)
+
+        assert [row.version for row in rows] == ["1.0.0"]
+        assert next_cursor is None
+
+    def test_audit_summary_does_not_select_payload(self, test_db, audit_logs, statements):
+        rows, _ = AuditLogRepository(test_db).list_all(projection=AUDIT_LOG_SUMMARY)
+
+        assert len(rows) == 3
+        assert "payload" not in statements[0]
+
+    def test_audit_usecase_without_payload(self, test_db, audit_logs):
+        page = AuditLogUseCase(test_db).list_by_actor("auditor@test.com", include_payload=False)
+
+        assert [log.payload for log in page.data] == [None, None, None]
+        assert page.data[0].action == "CREATE"
+
+    def test_audit_route_include_payload(self, client, audit_logs):
+        full = client.get("/audit-logs").json()["data"]["data"]
+        summary = client.get("/audit-logs", params={"includePayload": "false"}).json()["data"]["data"]
+
+        assert full[0]["payload"] == {"version": "1.0.2"}
+        assert summary[0]["payload"] is None
+        assert summary[0]["actor"] == "auditor@test.com"
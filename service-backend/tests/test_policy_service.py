@@ -2,9 +2,12 @@
 Testes unitarios do PolicyService
 Cobre: defaults, load YAML, reload, freeze windows, validate_promotion
 """
+import os
+import threading
+import time
 import pytest
 from unittest.mock import patch, mock_open, MagicMock
-from datetime import datetime
+from datetime import datetime, timezone
 from src.domain.services.policy_service import PolicyService, FreezeWindow
 
 
@@ -316,3 +319,131 @@ class TestValidatePromotion:
             is_valid, msg = svc.validate_promotion("DEV", "PRE_PROD")
         assert is_valid is False
         assert "congelado" in msg.lower()
+
+
+class TestCompiledFreezeWindows:
+    """Avaliacao pre-compilada por minuto do dia"""
+
+    @pytest.fixture
+    def policy(self):
+        yaml_content = (
+            "freezeWindows:\n"
+            "  - env: PROD\n    start: '22:00'\n    end: '06:00'\n    timezone: America/Sao_Paulo\n"
+            "  - env: PROD\n    start: '12:00'\n    end: '13:00'\n    timezone: America/Sao_Paulo\n"
+            "  - env: PRE_PROD\n    start: '25:00'\n    end: '06:00'\n    timezone: UTC\n"
+        )
+        with patch('os.path.exists', return_value=True):
+            with patch('builtins.open', mock_open(read_data=yaml_content)):
+                return PolicyService()
+
+    def test_converts_instant_to_window_timezone(self, policy):
+        # 01:30 UTC = 22:30 em Sao Paulo (UTC-3)
+        assert policy.is_frozen_at("PROD", datetime(2026, 10, 18, 1, 30, tzinfo=timezone.utc)) is True
+        assert policy.is_frozen_at("PROD", datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)) is False
+
+    def test_naive_instant_is_utc(self, policy):
+        assert policy.is_frozen_at("PROD", datetime(2026, 10, 18, 9, 0)) is True
+        assert policy.is_frozen_at("PROD", datetime(2026, 10, 18, 9, 1)) is False
+
+    def test_multiple_windows_are_united(self, policy):
+        # 15:30 UTC = 12:30 em Sao Paulo, dentro da segunda janela
+        assert policy.is_frozen_at("PROD", datetime(2026, 10, 18, 15, 30, tzinfo=timezone.utc)) is True
+
+    def test_invalid_window_is_skipped(self, policy):
+        assert [w.env for w in policy.freeze_windows] == ["PROD", "PROD"]
+        assert policy.is_frozen_at("PRE_PROD", datetime(2026, 10, 18, 3, 0, tzinfo=timezone.utc)) is False
+
+    def test_window_is_frozen_at_matches_minutes(self):
+        window = FreezeWindow("PROD", "08:00", "18:00", "UTC")
+        assert window.is_frozen_at(datetime(2026, 10, 18, 18, 0, tzinfo=timezone.utc)) is True
+        assert window.is_frozen_at(datetime(2026, 10, 18, 18, 1, tzinfo=timezone.utc)) is False
+
+    def test_reload_recompiles(self, policy):
+        with patch('os.path.exists', return_value=False):
+            policy.reload_policy()
+        # Default: PROD 22:00-23:59 America/Sao_Paulo
+        assert policy.is_frozen_at("PROD", datetime(2026, 10, 18, 2, 30, tzinfo=timezone.utc)) is True
+        assert policy.is_frozen_at("PROD", datetime(2026, 10, 18, 5, 0, tzinfo=timezone.utc)) is False
+
+
+class TestPolicyHotReload:
+    """Reload por mudanca no arquivo, com troca atomica de snapshot"""
+
+    @pytest.fixture
+    def policy_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "policy.yaml"
+        path.write_text("minApprovals: 2\nminScore: 80\nfreezeWindows: []\n")
+        monkeypatch.setattr(PolicyService, "POLICY_FILE", str(path))
+        return path
+
+    def _rewrite(self, path, content):
+        path.write_text(content)
+        # Garante mtime diferente mesmo em filesystems com resolucao grossa
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_version_is_content_hash(self, policy_file):
+        first = PolicyService().version
+        assert first == PolicyService().version
+        self._rewrite(policy_file, "minApprovals: 3\n")
+        assert PolicyService().version != first
+
+    def test_check_for_changes_swaps_snapshot(self, policy_file):
+        service = PolicyService()
+        old = service.snapshot()
+        assert service.check_for_changes() is False
+
+        self._rewrite(policy_file, "minApprovals: 4\nminScore: 90\nfreezeWindows: []\n")
+        assert service.check_for_changes() is True
+
+        assert service.get_min_approvals() == 4
+        assert service.version != old.version
+        # Snapshot antigo permanece intacto para quem ainda o segura
+        assert old.min_approvals == 2
+
+    def test_invalid_reload_keeps_current_snapshot(self, policy_file):
+        service = PolicyService()
+        version = service.version
+
+        self._rewrite(policy_file, "minApprovals: 4\nfreezeWindows:\n  - env: PROD\n    start: '99:00'\n    end: '06:00'\n")
+        assert service.check_for_changes() is False
+        self._rewrite(policy_file, "minApprovals: [1\n")
+        assert service.reload_policy() is False
+
+        assert service.get_min_approvals() == 2
+        assert service.version == version
+
+    def test_watcher_reloads_in_background(self, policy_file):
+        service = PolicyService()
+        service.start_watching(0.01)
+        try:
+            self._rewrite(policy_file, "minApprovals: 7\nfreezeWindows: []\n")
+            deadline = time.monotonic() + 2
+            while service.get_min_approvals() != 7 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            service.stop_watching()
+        assert service.get_min_approvals() == 7
+
+    def test_concurrent_readers_see_whole_snapshots(self, policy_file):
+        service = PolicyService()
+        pairs = {(2, 80), (5, 95)}
+        seen, stop = set(), threading.Event()
+
+        def read():
+            while not stop.is_set():
+                snapshot = service.snapshot()
+                seen.add((snapshot.min_approvals, snapshot.min_score))
+                time.sleep(0)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for i in range(20):
+            self._rewrite(policy_file, "minApprovals: 5\nminScore: 95\n" if i % 2 == 0 else "minApprovals: 2\nminScore: 80\n")
+            service.reload_policy()
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+        assert seen <= pairs
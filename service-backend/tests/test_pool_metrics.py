@@ -0,0 +1,66 @@
+"""
+Testes da instrumentação do pool de conexões
+"""
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from src.infrastructure.pool_metrics import InstrumentedQueuePool, instrument_engine
+from tests.helpers import auth_header
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.sqlite'}",
+        poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.05
+    )
+    yield engine
+    engine.dispose()
+
+
+class TestPoolMetrics:
+
+    def test_records_checkouts_hold_and_usage(self, engine):
+        metrics = instrument_engine(engine, "test-usage")
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            assert metrics.snapshot()["inUse"] == 1
+
+        snapshot = metrics.snapshot()
+        assert snapshot["checkouts"] == 1
+        assert snapshot["connects"] == 1
+        assert snapshot["checkoutWait"]["count"] == 1
+        assert snapshot["checkoutHold"]["count"] == 1
+        assert snapshot["inUse"] == 0
+
+    def test_counts_timeouts_when_pool_is_exhausted(self, engine):
+        metrics = instrument_engine(engine, "test-timeout")
+
+        with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        assert metrics.snapshot()["timeouts"] == 1
+
+    def test_connection_lifetime_after_dispose(self, engine):
+        metrics = instrument_engine(engine, "test-lifetime")
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        engine.dispose()
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        snapshot = metrics.snapshot()
+        assert snapshot["connectionLifetime"]["count"] == 1
+        assert snapshot["checkouts"] == 2
+
+
+class TestMetricsRoutes:
+
+    @pytest.mark.parametrize("path", ["/metrics/db-pool", "/metrics/caches", "/metrics/audit-writer"])
+    def test_require_token(self, client, path):
+        assert client.get(path).status_code == 401
+        assert client.get(path, headers={"Authorization": "Bearer not-a-jwt"}).status_code == 401
+        assert client.get(path, headers=auth_header()).status_code == 200
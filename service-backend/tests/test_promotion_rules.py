@@ -153,3 +153,43 @@ class TestPromotionAuditTrail:
             ReleaseEventORM.event_type == "PROMOTED"
         ).all()
         assert len(events) == 1
+
+
+class TestApprovalCounters:
+    """Contadores denormalizados usados por promote/checklist"""
+
+    def _release_orm(self, test_db, release_id):
+        test_db.expire_all()
+        return test_db.get(ReleaseORM, UUID(release_id))
+
+    def test_approve_and_reject_update_counters(self, test_db, app):
+        release = _create_release(test_db, app, version="v4.0.0")
+        uc = ApprovalUseCase(test_db, actor_email="a@test.com")
+        uc.approve(UUID(release.id), "a@test.com")
+        uc.reject(UUID(release.id), "b@test.com")
+
+        orm = self._release_orm(test_db, release.id)
+        assert orm.approved_count == 1
+        assert orm.rejected_count == 1
+
+    def test_update_outcome_moves_counter(self, test_db, app):
+        release = _create_release(test_db, app, version="v4.1.0")
+        approval = _approve_release(test_db, release.id)
+        ApprovalUseCase(test_db, actor_email="approver@test.com").update_outcome(
+            UUID(approval.id), "REJECTED"
+        )
+
+        orm = self._release_orm(test_db, release.id)
+        assert orm.approved_count == 0
+        assert orm.rejected_count == 1
+
+    def test_promote_reads_counter(self, test_db, app):
+        release = _create_release(test_db, app, version="v4.2.0")
+        uc = ReleaseUseCase(test_db, actor_email="dev@test.com")
+        uc.promote(UUID(release.id), "PRE_PROD")
+        _approve_release(test_db, release.id)
+        # Remover as linhas de approvals não afeta a leitura do contador
+        test_db.query(ApprovalORM).delete()
+        test_db.commit()
+        promoted = uc.promote(UUID(release.id), "PROD")
+        assert promoted.environment == "PROD"
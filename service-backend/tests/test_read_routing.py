@@ -0,0 +1,78 @@
+"""
+Testes do roteamento de leituras (réplica x primário / read-your-writes)
+"""
+from starlette.requests import Request
+
+from src.infrastructure import database
+from src.infrastructure.read_routing import must_read_primary, record_write
+from tests.helpers import auth_header
+
+
+def _request(headers: dict) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/releases",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+class TestReadRouting:
+
+    def test_reads_go_to_replica_by_default(self):
+        assert not must_read_primary(_request({"Authorization": "Bearer reader-token"}))
+        assert not must_read_primary(_request({}))
+
+    def test_client_reads_primary_after_write(self):
+        record_write(_request({"Authorization": "Bearer writer-token"}))
+
+        assert must_read_primary(_request({"Authorization": "Bearer writer-token"}))
+        assert not must_read_primary(_request({"Authorization": "Bearer other-token"}))
+
+    def test_explicit_primary_header(self):
+        assert must_read_primary(_request({"X-Read-Consistency": "primary"}))
+
+    def test_get_read_db_picks_session_factory(self, monkeypatch):
+        class FakeSession:
+            def __init__(self, name):
+                self.name = name
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr(database, "SessionLocal", lambda: FakeSession("primary"))
+        monkeypatch.setattr(database, "ReadSessionLocal", lambda: FakeSession("replica"))
+
+        replica = database.get_read_db(_request({}))
+        primary = database.get_read_db(_request({"X-Read-Consistency": "primary"}))
+
+        assert next(replica).name == "replica"
+        assert next(primary).name == "primary"
+        replica.close()
+        primary.close()
+
+
+class TestReadYourWritesMiddleware:
+
+    def test_committed_write_pins_client_to_primary(self, client):
+        headers = auth_header("rw-writer@test.com", "Writer")
+        response = client.post("/applications", json={"name": "rw-app", "ownerTeam": "team"}, headers=headers)
+
+        assert response.status_code == 200
+        assert must_read_primary(_request(headers))
+
+    def test_read_only_posts_do_not_pin_client(self, client):
+        headers = auth_header("rw-scorer@test.com", "Scorer")
+        score = client.post("/releases/calculate-score", json={"evidenceUrl": "https://ci/1"}, headers=headers)
+        batch = client.post("/releases/calculate-score:batch", json={"evidenceUrls": ["https://ci/1"]},
+                            headers=headers)
+
+        assert score.status_code == 200 and batch.status_code == 200
+        assert not must_read_primary(_request(headers))
+
+    def test_failed_write_does_not_pin_client(self, client):
+        headers = auth_header("rw-failed@test.com", "Failed")
+        response = client.post("/applications", json={"name": "rw-app"}, headers=headers)
+
+        assert response.status_code == 422
+        assert not must_read_primary(_request(headers))
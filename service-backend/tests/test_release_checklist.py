@@ -0,0 +1,114 @@
+"""
+Testes do checklist de pré-lançamento (unitário e em lote)
+"""
+import pytest
+from uuid import uuid4
+from unittest.mock import patch
+from sqlalchemy import event
+
+from src.infrastructure.orm.application import ApplicationORM
+from src.infrastructure.orm.release import ReleaseORM
+from src.application.usecases.release_usecase import ReleaseUseCase
+from src.domain.services.policy_service import PolicyService
+from src.infrastructure.read_routing import must_read_primary
+from tests.helpers import auth_header
+
+
+@pytest.fixture
+def policy():
+    with patch('os.path.exists', return_value=False):
+        svc = PolicyService()
+    with patch('src.application.usecases.release_usecase.get_policy_service', return_value=svc):
+        yield svc
+
+
+@pytest.fixture
+def releases(test_db):
+    application = ApplicationORM(id=uuid4(), name="checklist-app", owner_team="team")
+    test_db.add(application)
+    rows = [
+        ReleaseORM(id=uuid4(), application_id=application.id, version="v1.0.0", env="PRE_PROD",
+                   evidence_url="https://ci/report", evidence_score=90, approved_count=1),
+        ReleaseORM(id=uuid4(), application_id=application.id, version="v1.1.0", env="PRE_PROD",
+                   evidence_url=None, evidence_score=50, approved_count=0),
+    ]
+    test_db.add_all(rows)
+    test_db.commit()
+    return rows
+
+
+class TestChecklistBatch:
+
+    def test_keeps_requested_order_and_reports_missing(self, test_db, releases, policy):
+        unknown = uuid4()
+        ids = [releases[1].id, unknown, releases[0].id, releases[1].id]
+
+        with patch.object(policy, 'is_frozen_for_env', return_value=False):
+            checklists, missing = ReleaseUseCase(test_db).get_checklists(ids)
+
+        assert [c['releaseId'] for c in checklists] == [str(releases[1].id), str(releases[0].id)]
+        assert missing == [str(unknown)]
+        assert checklists[1]['ready'] is True
+        assert checklists[0]['ready'] is False
+        assert checklists[0]['evidenceOk'] is False and checklists[0]['scoreOk'] is False
+        assert checklists[0]['policyVersion'] == policy.version
+
+    def test_single_query_and_one_freeze_evaluation(self, test_db, releases, policy):
+        ids = [r.id for r in releases]
+        statements = []
+
+        @event.listens_for(test_db.get_bind(), "before_cursor_execute")
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        test_db.expire_all()
+        with patch.object(policy, 'is_frozen_for_env', return_value=True) as frozen:
+            checklists, _ = ReleaseUseCase(test_db).get_checklists(ids)
+
+        assert len(statements) == 1
+        frozen.assert_called_once()
+        assert all(c['isFrozen'] and not c['ready'] for c in checklists)
+
+    def test_single_checklist_matches_batch(self, test_db, releases, policy):
+        uc = ReleaseUseCase(test_db)
+        with patch.object(policy, 'is_frozen_for_env', return_value=False):
+            single = uc.get_checklist(releases[0].id)
+            batch, _ = uc.get_checklists([releases[0].id])
+            assert uc.get_checklist(uuid4()) is None
+
+        assert single == batch[0]
+
+
+class TestChecklistBatchRoute:
+
+    def _post(self, client, release_ids):
+        return client.post("/releases/checklist:batch", json={"releaseIds": release_ids}, headers=auth_header())
+
+    def test_requires_token(self, client):
+        response = client.post("/releases/checklist:batch", json={"releaseIds": [str(uuid4())]})
+        assert response.status_code == 401
+
+    def test_rejects_empty_and_oversized_batches(self, client):
+        from src.presentation.routes import release_routes
+
+        assert self._post(client, []).status_code == 400
+        with patch.object(release_routes, "CHECKLIST_BATCH_MAX", 1):
+            assert self._post(client, [str(uuid4()), str(uuid4())]).status_code == 400
+        assert self._post(client, ["not-a-uuid"]).status_code == 400
+
+    def test_returns_checklists_and_missing(self, client, test_db, releases):
+        unknown = str(uuid4())
+        response = self._post(client, [str(releases[0].id), unknown])
+
+        assert response.status_code == 200
+        body = response.json()["data"]
+        assert [c["releaseId"] for c in body["data"]] == [str(releases[0].id)]
+        assert body["missing"] == [unknown]
+
+    def test_does_not_pin_client_to_primary(self, client, releases):
+        headers = auth_header("checklist-reader@test.com", "Reader")
+        response = client.post("/releases/checklist:batch", json={"releaseIds": [str(releases[0].id)]},
+                               headers=headers)
+
+        assert response.status_code == 200
+        assert not must_read_primary(client.build_request("GET", "/releases", headers=headers))
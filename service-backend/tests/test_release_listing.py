@@ -0,0 +1,110 @@
+"""
+Testes das listagens de releases (contagens de approvals por página)
+"""
+import pytest
+from uuid import uuid4
+from sqlalchemy import event
+
+from src.infrastructure.orm.application import ApplicationORM
+from src.infrastructure.orm.release import ReleaseORM
+from src.infrastructure.orm.approval import ApprovalORM
+from src.infrastructure.repositories.approval_repository import ApprovalRepository
+from src.application.usecases.release_usecase import ReleaseUseCase
+from src.infrastructure.cache.application_cache import get_application_cache
+
+
+@pytest.fixture
+def app(test_db):
+    application = ApplicationORM(id=uuid4(), name="listing-test-app", owner_team="team")
+    test_db.add(application)
+    test_db.commit()
+    return application
+
+
+def _seed_releases(test_db, app, count):
+    releases = []
+    for i in range(count):
+        release = ReleaseORM(id=uuid4(), application_id=app.id, version=f"v{i}.0.0", env="PRE_PROD")
+        test_db.add(release)
+        releases.append(release)
+    test_db.flush()
+    for i, release in enumerate(releases):
+        # Contadores mantidos como em ApprovalUseCase (adjust_approval_counters)
+        test_db.add(ApprovalORM(release_id=release.id, approver_email="a@test.com", outcome="APPROVED"))
+        release.approved_count = 1
+        if i % 2 == 0:
+            test_db.add(ApprovalORM(release_id=release.id, approver_email="b@test.com", outcome="REJECTED"))
+            release.rejected_count = 1
+    test_db.commit()
+    return releases
+
+
+def _count_selects(engine):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+class TestApprovalCountsOnListings:
+
+    def test_list_by_application_counts(self, test_db, app):
+        releases = _seed_releases(test_db, app, 3)
+        result = ReleaseUseCase(test_db).list_by_application(app.id)
+
+        by_id = {r.id: r for r in result.data}
+        assert by_id[str(releases[0].id)].approval_count == 1
+        assert by_id[str(releases[0].id)].rejection_count == 1
+        assert by_id[str(releases[1].id)].rejection_count == 0
+
+    def test_list_all_and_by_status_include_counts(self, test_db, app):
+        _seed_releases(test_db, app, 2)
+        uc = ReleaseUseCase(test_db)
+
+        assert all(r.approval_count == 1 for r in uc.list_all().data)
+        assert all(r.approval_count == 1 for r in uc.list_by_status("PENDING").data)
+
+    def test_query_count_does_not_grow_with_page_size(self, test_db, app):
+        _seed_releases(test_db, app, 20)
+        app_id = app.id
+        uc = ReleaseUseCase(test_db)
+
+        cache = get_application_cache()
+        cache.clear()
+        small = _count_selects(test_db.get_bind())
+        uc.list_by_application(app_id, limit=2)
+        small_count = len(small)
+
+        cache.clear()
+        large = _count_selects(test_db.get_bind())
+        uc.list_by_application(app_id, limit=20)
+
+        assert len(large) == small_count
+
+    def test_counts_come_from_release_counters(self, test_db, app):
+        _seed_releases(test_db, app, 3)
+        statements = _count_selects(test_db.get_bind())
+
+        ReleaseUseCase(test_db).list_by_application(app.id)
+
+        assert not any("approvals" in statement for statement in statements)
+
+
+class TestCountOutcomesByRelease:
+
+    def test_grouped_counts_match_counters(self, test_db, app):
+        releases = _seed_releases(test_db, app, 3)
+        pending = ReleaseORM(id=uuid4(), application_id=app.id, version="v9.0.0", env="DEV")
+        test_db.add(pending)
+        test_db.commit()
+
+        counts = ApprovalRepository(test_db).count_outcomes_by_release([r.id for r in releases] + [pending.id])
+
+        assert counts == {r.id: (r.approved_count, r.rejected_count) for r in releases}
+
+    def test_empty_ids(self, test_db):
+        assert ApprovalRepository(test_db).count_outcomes_by_release([]) == {}
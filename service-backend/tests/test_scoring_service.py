@@ -1,5 +1,7 @@
 import pytest
+from unittest.mock import patch
 from src.domain.services.scoring_service import ScoringService
+from tests.helpers import auth_header
 
 
 class TestScoringService:
@@ -87,3 +89,94 @@ class TestScoringService:
         score1 = ScoringService.calculate_score(url1)
         score2 = ScoringService.calculate_score(url2)
         assert score1 == score2
+
+    def test_overlapping_keywords_all_count(self):
+        """Palavras sobrepostas ("PASSUCCESS", "RESULTSUCCESS") contam as duas"""
+        assert ScoringService.calculate_score("https://example.com/PASSUCCESS") == 70
+        assert ScoringService.calculate_score("https://example.com/resultsuccess") == 60
+
+    def test_url_validation_matches_urlparse(self):
+        """Caminho rápido da validação concorda com urlparse"""
+        from urllib.parse import urlparse
+        urls = ["https://x", "http://[::1]/a", "http://[::1/a", " https://x", "h\ttps://x",
+                "https:///path", "mailto:a@b", "http://é.com", "a+b.c-d://host", "1http://x", None]
+        for url in urls:
+            try:
+                parsed = urlparse(url)
+                expected = all([parsed.scheme, parsed.netloc])
+            except Exception:
+                expected = False
+            assert ScoringService._is_valid_url(url) == expected, url
+
+
+class TestBatchScoring:
+    """Testes de ScoringService.calculate_scores e do endpoint em lote"""
+
+    URLS = [
+        "https://example.com/test-report-PASS.pdf",
+        "not-a-url",
+        "http://example.com/evidence/SUCCESS.json",
+        "https://example.com/test-report-PASS.pdf",
+        "ftp://files.example.com/results.xml",
+        "",
+    ]
+
+    def test_matches_single_scoring_in_order(self):
+        assert ScoringService.calculate_scores(self.URLS) == [
+            ScoringService.calculate_score(url) for url in self.URLS
+        ]
+
+    def test_empty_batch(self):
+        assert ScoringService.calculate_scores([]) == []
+
+    def test_batch_endpoint(self, client):
+        response = client.post("/releases/calculate-score:batch", json={"evidenceUrls": self.URLS[:2]})
+        assert response.status_code == 200
+        assert response.json()["data"]["data"] == [
+            {"evidenceUrl": self.URLS[0], "score": 80},
+            {"evidenceUrl": self.URLS[1], "score": 0},
+        ]
+
+    def test_batch_endpoint_validates_body(self, client):
+        assert client.post("/releases/calculate-score:batch", json={"evidenceUrls": []}).status_code == 400
+        assert client.post("/releases/calculate-score:batch", json={"evidenceUrls": [1]}).status_code == 400
+
+
+class TestScoreMemo:
+    """Memo de scores por URL e versão das regras"""
+
+    @pytest.fixture(autouse=True)
+    def clean_cache(self):
+        ScoringService.clear_cache()
+        yield
+        ScoringService.clear_cache()
+
+    def test_repeated_url_is_a_cache_hit(self):
+        url = "https://example.com/test-report-PASS.pdf"
+        with patch.object(ScoringService, "_score_valid_url", wraps=ScoringService._score_valid_url) as scorer:
+            assert ScoringService.calculate_score(url) == 80
+            assert ScoringService.calculate_score(url) == 80
+            assert ScoringService.calculate_scores([url, url]) == [80, 80]
+        assert scorer.call_count == 1
+        stats = ScoringService.cache_stats()
+        assert stats["hits"] >= 2 and stats["size"] == 1
+
+    def test_invalid_urls_are_memoized_too(self):
+        with patch.object(ScoringService, "_is_valid_url", wraps=ScoringService._is_valid_url) as validator:
+            assert ScoringService.calculate_score("not-a-url") == 0
+            assert ScoringService.calculate_score("not-a-url") == 0
+        assert validator.call_count == 1
+
+    def test_rules_version_invalidates(self, monkeypatch):
+        url = "https://example.com/report.pdf"
+        ScoringService.calculate_score(url)
+        monkeypatch.setattr(ScoringService, "RULES_VERSION", ScoringService.RULES_VERSION + 1)
+        with patch.object(ScoringService, "_score_valid_url", return_value=42):
+            assert ScoringService.calculate_score(url) == 42
+        assert ScoringService.cache_stats()["rulesVersion"] == ScoringService.RULES_VERSION
+
+    def test_cache_metrics_endpoint(self, client):
+        ScoringService.calculate_score("https://example.com")
+        body = client.get("/metrics/caches", headers=auth_header()).json()["data"]
+        assert body["evidenceScores"]["size"] == 1
+        assert "hits" in body["applications"]
@@ -0,0 +1,71 @@
+"""
+Testes do TokenVerifier (verificação PyJWT + cache de claims verificados)
+"""
+import time
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from src.core import auth
+from src.core.auth import InvalidTokenError, TokenPayload, TokenVerifier, extract_user_from_token
+from tests.helpers import auth_header
+
+SECRET = "test-secret-with-enough-length-for-hs256"
+
+
+@pytest.fixture
+def verifier():
+    return TokenVerifier(SECRET)
+
+
+def _claims(**extra):
+    return {"email": "a@test.com", "name": "A", "exp": int(time.time()) + 3600, **extra}
+
+
+class TestTokenVerifier:
+
+    def test_round_trip_and_cache_hit_skips_decode(self, verifier, monkeypatch):
+        token = verifier.issue(_claims())
+        decode = jwt.decode
+        calls = []
+        monkeypatch.setattr(jwt, "decode", lambda *a, **k: calls.append(1) or decode(*a, **k))
+
+        assert verifier.verify(token) == TokenPayload("a@test.com", "A")
+        assert verifier.verify(token) == TokenPayload("a@test.com", "A")
+
+        assert len(calls) == 1
+        assert verifier.cache_stats()["hits"] == 1
+
+    def test_cache_never_outlives_exp(self, verifier):
+        exp = int(time.time()) + 3600
+        token = verifier.issue(_claims(exp=exp))
+        verifier._clock = lambda: exp + 1
+
+        verifier.verify(token)
+
+        assert verifier.cache_stats()["size"] == 0
+
+    def test_rejects_expired_tampered_and_incomplete_tokens(self, verifier):
+        expired = verifier.issue(_claims(exp=int(time.time()) - 10))
+        other_key = jwt.encode(_claims(), "another-secret-with-enough-length-ok", algorithm="HS256")
+        no_name = verifier.issue({"email": "a@test.com", "exp": int(time.time()) + 60})
+
+        for token in (expired, other_key, no_name, "not-a-jwt"):
+            with pytest.raises(InvalidTokenError):
+                verifier.verify(token)
+        assert verifier.cache_stats()["size"] == 0
+
+    def test_accepts_tokens_from_test_helper(self):
+        header = auth_header("helper@test.com", "Helper")
+
+        assert extract_user_from_token(header["Authorization"]) == TokenPayload("helper@test.com", "Helper")
+
+
+class TestExtractUserFromToken:
+
+    def test_expired_token_is_401(self):
+        token = auth.get_token_verifier().issue(_claims(exp=int(time.time()) - 10))
+
+        with pytest.raises(HTTPException) as exc:
+            extract_user_from_token(f"Bearer {token}")
+        assert exc.value.status_code == 401
@@ -0,0 +1,64 @@
+"""
+Testes do cache de id/role de usuários (positivo, negativo, lote e invalidação)
+"""
+import pytest
+from sqlalchemy import event
+
+from src.infrastructure.orm.user import UserORM
+from src.infrastructure.repositories.user_repository import UserRepository
+from src.infrastructure.cache.user_cache import UserCache
+from src.infrastructure.cache import user_cache
+from src.domain.entities.user import UserRole
+from src.application.services.auth_service import AuthService
+
+
+@pytest.fixture
+def users(test_db):
+    for email, role in [("a@test.com", UserRole.ADMIN), ("v@test.com", UserRole.VIEWER)]:
+        test_db.add(UserORM(email=email, name=email, password_hash="x", role=role))
+    test_db.commit()
+
+
+@pytest.fixture
+def count_queries(test_db):
+    statements = []
+    event.listen(test_db.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    return statements
+
+
+class TestUserCache:
+
+    def test_hits_skip_the_database(self, test_db, users, count_queries):
+        cache, repo = UserCache(), UserRepository(test_db)
+
+        assert cache.get(repo, "a@test.com").role == UserRole.ADMIN
+        assert cache.get(repo, "a@test.com").role == UserRole.ADMIN
+
+        assert len(count_queries) == 1
+
+    def test_unknown_emails_are_negatively_cached(self, test_db, users, count_queries):
+        cache, repo = UserCache(), UserRepository(test_db)
+
+        assert cache.get(repo, "ghost@test.com") is None
+        assert cache.get(repo, "ghost@test.com") is None
+
+        assert len(count_queries) == 1
+
+    def test_get_roles_loads_misses_in_one_query(self, test_db, users, count_queries):
+        cache, repo = UserCache(), UserRepository(test_db)
+        cache.get(repo, "a@test.com")
+
+        roles = cache.get_roles(repo, ["a@test.com", "v@test.com", "ghost@test.com"])
+
+        assert roles == {"a@test.com": UserRole.ADMIN, "v@test.com": UserRole.VIEWER, "ghost@test.com": None}
+        assert len(count_queries) == 2
+
+    def test_role_change_invalidates(self, test_db, users, monkeypatch):
+        cache, repo = UserCache(), UserRepository(test_db)
+        monkeypatch.setattr(user_cache, "_user_cache", cache)
+        cache.get(repo, "v@test.com")
+
+        AuthService(test_db).update_role("v@test.com", UserRole.APPROVER)
+
+        assert cache.get(repo, "v@test.com").role == UserRole.APPROVER